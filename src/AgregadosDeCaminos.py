@@ -0,0 +1,411 @@
+# AgregadosDeCaminos.py
+# Agregados sobre los caminos en matrices y triángulos.
+# José A. Alonso Jiménez <https://jaalonso.github.io>
+# Sevilla, 18-octubre-2026
+# ---------------------------------------------------------------------
+
+# ---------------------------------------------------------------------
+# En los ejercicios "Caminos en una matriz" y "Caminos en un triángulo"
+# se construyen las listas de todos los caminos, cuyo número crece
+# exponencialmente (en una matriz nxn hay binomial(2n-2, n-1) caminos;
+# en un triángulo de altura n, 2^(n-1)). Para calcular agregados sobre
+# los caminos (su número, la máxima o la mínima suma o las k mayores
+# sumas) no hace falta construirlos: basta recorrer la matriz (o el
+# triángulo) por filas guardando, en un vector de NumPy, el agregado de
+# los caminos que llegan a cada posición de la fila actual. Los vectores
+# son de enteros de 64 bits (o de números flotantes) si con ellos las
+# sumas son exactas y de objetos (enteros de Python) en caso contrario.
+#
+# En los caminos de las matrices se empieza en el extremo superior
+# izquierdo, se termina en el inferior derecho y en cada paso se avanza
+# una posición hacia la derecha o hacia abajo. En los de los triángulos
+# se empieza en el elemento de la primera fila, se termina en la última
+# y en cada paso se avanza a uno de los dos elementos adyacentes de la
+# fila siguiente.
+#
+# Definir las funciones
+#    numeroDeCaminos        : (list[list[int]]) -> int
+#    maximaSuma             : (list[list[int]]) -> int
+#    minimaSuma             : (list[list[int]]) -> int
+#    mayoresSumas           : (list[list[int]], int) -> list[int]
+#    caminos                : (list[list[A]]) -> Iterator[list[A]]
+#    numeroDeCaminosTriangulo, maximaSumaTriangulo, minimaSumaTriangulo,
+#    mayoresSumasTriangulo, caminosTriangulo
+# tales que
+# + numeroDeCaminos(p) es el número de caminos en la matriz p. Por
+#   ejemplo,
+#      >>> numeroDeCaminos([[1,6,11,2],[7,12,3,8],[3,8,4,9]])
+#      10
+#      >>> numeroDeCaminos([[0] * 100] * 100)
+#      22750883079422934966181954039568885395604168260154104734000
+# + maximaSuma(p) y minimaSuma(p) son la máxima y la mínima suma de los
+#   caminos en la matriz p. Por ejemplo,
+#      >>> maximaSuma([[1,6,11,2],[7,12,3,8],[3,8,4,9]])
+#      41
+#      >>> minimaSuma([[1,6,11,2],[7,12,3,8],[3,8,4,9]])
+#      32
+# + mayoresSumas(p, k) es la lista de las k mayores sumas de los
+#   caminos en la matriz p (con repeticiones y en orden decreciente),
+#   que es vacía si k <= 0. Por ejemplo,
+#      >>> mayoresSumas([[1,6,11,2],[7,12,3,8],[3,8,4,9]], 4)
+#      [41, 40, 40, 39]
+#      >>> mayoresSumas([[1,2],[3,4]], 5)
+#      [8, 7]
+# + caminos(p) genera los caminos de la matriz p, en el mismo orden que
+#   la función caminos1 de "Caminos en una matriz", sin guardarlos
+#   todos. Por ejemplo,
+#      >>> list(caminos([[1,2,3],[4,5,6]]))
+#      [[1, 2, 3, 6], [1, 2, 5, 6], [1, 4, 5, 6]]
+#      >>> next(caminos([[0] * 100] * 100))[:5]
+#      [0, 0, 0, 0, 0]
+# + las funciones con el sufijo Triangulo son las correspondientes para
+#   los caminos en los triángulos. Por ejemplo,
+#      >>> t = [[3],[7,4],[2,4,6],[8,5,9,3]]
+#      >>> numeroDeCaminosTriangulo(t)
+#      8
+#      >>> maximaSumaTriangulo(t)
+#      23
+#      >>> minimaSumaTriangulo(t)
+#      16
+#      >>> mayoresSumasTriangulo(t, 3)
+#      [23, 22, 20]
+#      >>> list(caminosTriangulo([[3],[7,4],[2,4,6]]))
+#      [[3, 7, 2], [3, 7, 4], [3, 4, 4], [3, 4, 6]]
+# ---------------------------------------------------------------------
+
+from itertools import combinations, product
+from math import comb
+from timeit import Timer, default_timer
+from typing import Any, Callable, Iterator, TypeVar
+
+import numpy as np
+import numpy.typing as npt
+from hypothesis import given
+from hypothesis import strategies as st
+
+from src.Caminos_en_un_triangulo import caminos as caminosTrianguloLista
+from src.Caminos_en_una_matriz import caminos2 as caminosMatrizLista
+
+A = TypeVar('A')
+
+Acumulador = Callable[[npt.NDArray[np.generic]], npt.NDArray[np.generic]]
+
+# Vectores exactos
+# ================
+
+# vectores(xss, factor, tipo) es la lista de los vectores de NumPy con
+# los elementos de las listas de xss. Son de tipo tipo (np.int64 o
+# np.float64) si factor por la suma de los mayores valores absolutos de
+# las listas es menor que 2^63 o que 2^53, respectivamente (que son los
+# límites hasta los que los enteros se representan exactamente en dichos
+# tipos) y son de objetos en caso contrario. Por ejemplo,
+#    >>> vectores([[3], [-7, 4]], 1, np.int64)
+#    [array([3]), array([-7,  4])]
+#    >>> vectores([[2**62], [2**62, 1]], 1, np.int64)
+#    [array([4611686018427387904], dtype=object),
+#     array([4611686018427387904, 1], dtype=object)]
+#    >>> vectores([[2**60, 1], [1, 1]], 4, np.float64)
+#    [array([1152921504606846976, 1], dtype=object),
+#     array([1, 1], dtype=object)]
+def vectores(xss: list[list[int]],
+             factor: int,
+             tipo: type) -> list[npt.NDArray[Any]]:
+    limite = 2**53 if tipo is np.float64 else 2**63
+    vs = []
+    cota = 0
+    for xs in xss:
+        try:
+            v = np.asarray(xs, dtype=np.int64)
+            cota += max(int(v.max()), -int(v.min()))
+        except OverflowError:
+            v = np.asarray(xs, dtype=object)
+            cota += max(abs(x) for x in xs)
+        vs.append(v)
+    if factor * cota < limite:
+        return [v.astype(tipo, copy=False) for v in vs]
+    return [v.astype(object) for v in vs]
+
+# Caminos en matrices
+# ===================
+
+# El número de caminos hasta cada posición de una fila es la suma de
+# los de la posición de encima y la de su izquierda, por lo que la fila
+# de los números de caminos es la suma acumulada de la anterior. Se
+# usan vectores de objetos para que los números sean exactos.
+def numeroDeCaminos(p: list[list[int]]) -> int:
+    fila = np.ones(len(p[0]), dtype=object)
+    for _ in p[1:]:
+        fila = np.cumsum(fila)
+    return int(fila[-1])
+
+# extremoDeSumas(p, acumula) es la máxima (si acumula es
+# np.maximum.accumulate) o la mínima (si es np.minimum.accumulate) suma
+# de los caminos en la matriz p. Si f es el vector de las máximas sumas
+# hasta las posiciones de una fila, xs la fila siguiente de p y s la
+# suma acumulada de xs, la máxima suma hasta la posición j de la fila
+# siguiente es el máximo, para k <= j, de f[k] + xs[k] + ... + xs[j] =
+# s[j] + (f[k] - s[k-1]), que se calcula para todos los j a la vez. Si
+# cada elemento de la fila i es, en valor absoluto, menor o igual que
+# c(i), en una matriz con n columnas los valores de f y de s están
+# acotados por n·(c(0) + ... + c(m-1)), por lo que sus diferencias lo
+# están por el doble.
+def extremoDeSumas(p: list[list[int]], acumula: Acumulador) -> int:
+    a = vectores(p, 2 * len(p[0]), np.int64)
+    fila = np.cumsum(a[0])
+    for xs in a[1:]:
+        s = np.cumsum(xs)
+        fila = s + acumula(fila - np.concatenate(([0], s[:-1])))
+    return int(fila[-1])
+
+def maximaSuma(p: list[list[int]]) -> int:
+    return extremoDeSumas(p, np.maximum.accumulate)
+
+def minimaSuma(p: list[list[int]]) -> int:
+    return extremoDeSumas(p, np.minimum.accumulate)
+
+# mejores(c, k) es la matriz cuya fila i-ésima son los k mayores
+# elementos de la fila i-ésima de c, en orden decreciente.
+def mejores(c: npt.NDArray[Any], k: int) -> npt.NDArray[Any]:
+    return -np.sort(-c, axis=1)[:, :k]
+
+# sumasValidas(xs) es la lista de los elementos finitos de xs como
+# enteros.
+def sumasValidas(xs: npt.NDArray[Any]) -> list[int]:
+    return [int(x) for x in xs if x != -np.inf]
+
+# En las filas de mayoresSumas la posición j depende de la j-1 de la
+# misma fila, por lo que se recorren las diagonales de la matriz (las
+# posiciones (i,j) con i+j = d), en las que cada posición sólo depende
+# de dos de la diagonal anterior. En cada diagonal se guarda la matriz
+# de las k mayores sumas hasta cada posición (completada con -inf si hay
+# menos de k caminos). Las sumas se calculan con números flotantes si
+# son exactas (las de los caminos están acotadas como en extremoDeSumas)
+# y con objetos (en los que -inf es un flotante que se compara y suma
+# con los enteros) en caso contrario.
+def mayoresSumas(p: list[list[int]], k: int) -> list[int]:
+    if k <= 0:
+        return []
+    a = np.vstack(vectores(p, len(p[0]), np.float64))
+    (m, n) = a.shape
+    nada = np.full((1, k), -np.inf, dtype=a.dtype)
+    diagonal = nada.copy()
+    diagonal[0, 0] = a[0, 0]
+    inicio = 0
+    for d in range(1, m + n - 1):
+        (i0, i1) = (max(0, d - n + 1), min(d, m - 1))
+        previa = np.vstack((nada, diagonal, nada))
+        indices = np.arange(i0, i1 + 1)
+        desdeArriba = previa[indices - inicio]
+        desdeIzquierda = previa[indices - inicio + 1]
+        diagonal = mejores(np.hstack((desdeArriba, desdeIzquierda)), k) + \
+            a[indices, d - indices][:, None]
+        inicio = i0
+    return sumasValidas(diagonal[0])
+
+# Los caminos se determinan por los pasos que se dan, desde el final,
+# hacia arriba (que son m-1) y hacia la izquierda (n-1). En caminos1 y
+# caminos2 los caminos se ordenan poniendo antes los que dan antes un
+# paso hacia arriba, que es el orden lexicográfico de las posiciones de
+# los pasos hacia arriba y es el que sigue combinations.
+def caminos(p: list[list[A]]) -> Iterator[list[A]]:
+    (m, n) = (len(p), len(p[0]))
+    for arriba in combinations(range(m + n - 2), m - 1):
+        (i, j) = (m - 1, n - 1)
+        c = [p[i][j]]
+        pasos = set(arriba)
+        for k in range(m + n - 2):
+            if k in pasos:
+                i -= 1
+            else:
+                j -= 1
+            c.append(p[i][j])
+        c.reverse()
+        yield c
+
+# Caminos en triángulos
+# =====================
+
+# La posición j de la fila i se alcanza desde las posiciones j-1 y j de
+# la fila anterior (si existen).
+def numeroDeCaminosTriangulo(xss: list[list[int]]) -> int:
+    fila = np.ones(1, dtype=object)
+    for _ in xss[1:]:
+        fila = np.concatenate(([0], fila)) + np.concatenate((fila, [0]))
+    return int(fila.sum())
+
+# extremoTriangulo(xss, extremo) es la máxima (si extremo es
+# np.maximum) o la mínima (si es np.minimum) suma de los caminos en el
+# triángulo xss. Cada camino tiene un elemento de cada fila, por lo que
+# sus sumas están acotadas por la suma de los mayores valores absolutos
+# de las filas.
+def extremoTriangulo(xss: list[list[int]],
+                     extremo: np.ufunc) -> int:
+    (fila, *filas) = vectores(xss, 1, np.int64)
+    for xs in filas:
+        mejor = np.concatenate((fila[:1], extremo(fila[:-1], fila[1:]),
+                                fila[-1:]))
+        fila = mejor + xs
+    return int(extremo.reduce(fila))
+
+def maximaSumaTriangulo(xss: list[list[int]]) -> int:
+    return extremoTriangulo(xss, np.maximum)
+
+def minimaSumaTriangulo(xss: list[list[int]]) -> int:
+    return extremoTriangulo(xss, np.minimum)
+
+def mayoresSumasTriangulo(xss: list[list[int]], k: int) -> list[int]:
+    if k <= 0:
+        return []
+    (primera, *filas) = vectores(xss, 1, np.float64)
+    nada = np.full((1, k), -np.inf, dtype=primera.dtype)
+    fila = nada.copy()
+    fila[0, 0] = primera[0]
+    for xs in filas:
+        previa = np.vstack((nada, fila, nada))
+        fila = mejores(np.hstack((previa[:-1], previa[1:])), k) + \
+            xs[:, None]
+    return sumasValidas(mejores(fila.reshape(1, -1), k)[0])
+
+# Los caminos se determinan por los desplazamientos (0 ó 1) de cada paso
+# y en caminos se ordenan lexicográficamente por ellos, que es el orden
+# en el que los genera product.
+def caminosTriangulo(xss: list[list[A]]) -> Iterator[list[A]]:
+    for ds in product((0, 1), repeat=len(xss) - 1):
+        j = 0
+        c = [xss[0][0]]
+        for (xs, d) in zip(xss[1:], ds):
+            j += d
+            c.append(xs[j])
+        yield c
+
+# Verificación
+# ============
+
+def test_AgregadosDeCaminos() -> None:
+    p = [[1,6,11,2],[7,12,3,8],[3,8,4,9]]
+    assert numeroDeCaminos(p) == 10
+    assert numeroDeCaminos([[0] * 100] * 100) == comb(198, 99)
+    assert maximaSuma(p) == 41
+    assert minimaSuma(p) == 32
+    assert mayoresSumas(p, 4) == [41, 40, 40, 39]
+    assert mayoresSumas([[1,2],[3,4]], 5) == [8, 7]
+    assert mayoresSumas([[1,2],[3,4]], 0) == []
+    assert list(caminos([[1,2,3],[4,5,6]])) == \
+        [[1, 2, 3, 6], [1, 2, 5, 6], [1, 4, 5, 6]]
+    assert list(caminos(p)) == caminosMatrizLista(p)
+    assert next(caminos([[0] * 100] * 100))[:5] == [0, 0, 0, 0, 0]
+    assert list(caminos([[5]])) == [[5]]
+    t = [[3],[7,4],[2,4,6],[8,5,9,3]]
+    assert numeroDeCaminosTriangulo(t) == 8
+    assert maximaSumaTriangulo(t) == 23
+    assert minimaSumaTriangulo(t) == 16
+    assert mayoresSumasTriangulo(t, 3) == [23, 22, 20]
+    assert mayoresSumasTriangulo(t, 0) == []
+    assert list(caminosTriangulo([[3],[7,4],[2,4,6]])) == \
+        [[3, 7, 2], [3, 7, 4], [3, 4, 4], [3, 4, 6]]
+    assert list(caminosTriangulo(t)) == caminosTrianguloLista(t)
+    # Las sumas son exactas aunque no quepan en 64 bits.
+    assert maximaSuma([[2**62] * 2] * 2) == 3 * 2**62
+    assert minimaSuma([[-2**63] * 3] * 2) == -4 * 2**63
+    assert mayoresSumas([[2**60, 1], [1, 1]], 2) == [2**60 + 2, 2**60 + 2]
+    assert maximaSumaTriangulo([[2**62], [2**62, 1]]) == 2**63
+    assert minimaSumaTriangulo([[2**70], [-1, 2**70]]) == 2**70 - 1
+    assert mayoresSumasTriangulo([[2**60], [1, 2]], 3) == \
+        [2**60 + 2, 2**60 + 1]
+    assert vectores([[3], [-7, 4]], 1, np.int64)[1].dtype == np.int64
+    print("Verificado")
+
+# La verificación es
+#    >>> test_AgregadosDeCaminos()
+#    Verificado
+
+# Comprobación de propiedades
+# ===========================
+
+# enteros es un generador de enteros pequeños o que no caben en 64 bits
+# (para comprobar que las sumas son exactas).
+enteros = st.one_of(st.integers(min_value=-100, max_value=100),
+                    st.integers(min_value=-2**70, max_value=2**70))
+
+# matrices es un generador de matrices de enteros.
+matrices = st.integers(min_value=1, max_value=6).flatmap(
+    lambda n: st.lists(st.lists(enteros, min_size=n, max_size=n),
+                       min_size=1, max_size=6))
+
+# triangulos es un generador de triángulos de enteros.
+triangulos = st.integers(min_value=1, max_value=8).flatmap(
+    lambda n: st.tuples(*(st.lists(enteros, min_size=k, max_size=k)
+                          for k in range(1, n + 1))).map(list))
+
+# La propiedad es que los agregados coinciden con los calculados sobre
+# la lista de todos los caminos.
+@given(matrices, triangulos, st.integers(min_value=0, max_value=20))
+def test_agregados(p: list[list[int]],
+                   t: list[list[int]],
+                   k: int) -> None:
+    cs = list(caminos(p))
+    sumas = sorted((sum(c) for c in cs), reverse=True)
+    assert numeroDeCaminos(p) == len(cs)
+    assert maximaSuma(p) == sumas[0]
+    assert minimaSuma(p) == sumas[-1]
+    assert mayoresSumas(p, k) == sumas[:k]
+    cs = list(caminosTriangulo(t))
+    sumas = sorted((sum(c) for c in cs), reverse=True)
+    assert cs == caminosTrianguloLista(t)
+    assert numeroDeCaminosTriangulo(t) == len(cs)
+    assert maximaSumaTriangulo(t) == sumas[0]
+    assert minimaSumaTriangulo(t) == sumas[-1]
+    assert mayoresSumasTriangulo(t, k) == sumas[:k]
+
+# La comprobación es
+#    > poetry run pytest -q AgregadosDeCaminos.py
+#    2 passed in 3.90s
+
+# Comparación de eficiencia
+# =========================
+
+def tiempo(e: str) -> None:
+    """Tiempo (en segundos) de evaluar la expresión e."""
+    t = Timer(e, "", default_timer, globals()).timeit(1)
+    print(f"{t:0.2f} segundos")
+
+# La comparación es
+#    >>> m = [list(range(12*n+1, 12*(n+1)+1)) for n in range(12)]
+#    >>> from src.Maxima_suma_de_los_caminos_en_una_matriz import maximaSuma2
+#    >>> tiempo('maximaSuma2(m)')
+#    5.45 segundos
+#    >>> tiempo('maximaSuma(m)')
+#    0.00 segundos
+#
+#    >>> m = [list(range(800*n+1, 800*(n+1)+1)) for n in range(800)]
+#    >>> from src.Maxima_suma_de_los_caminos_en_una_matriz import maximaSuma5
+#    >>> tiempo('maximaSuma5(m)')
+#    0.35 segundos
+#    >>> tiempo('maximaSuma(m)')
+#    0.04 segundos
+#    >>> tiempo('mayoresSumas(m, 10)')
+#    0.19 segundos
+#    >>> tiempo('numeroDeCaminos([[0] * 2000] * 2000)')
+#    0.41 segundos
+#
+#    >>> tiempo('len(caminosMatrizLista([[0] * 12] * 12))')
+#    5.29 segundos
+#    >>> tiempo('sum(1 for _ in caminos([[0] * 12] * 12))')
+#    1.91 segundos
+#
+#    >>> t = [list(range(k, 2*k+1)) for k in range(20)]
+#    >>> tiempo('len(caminosTrianguloLista(t))')
+#    10.97 segundos
+#    >>> tiempo('sum(1 for _ in caminosTriangulo(t))')
+#    1.17 segundos
+#    >>> t = [list(range(k, 2*k+1)) for k in range(3000)]
+#    >>> tiempo('maximaSumaTriangulo(t)')
+#    0.23 segundos
+#    >>> tiempo('mayoresSumasTriangulo(t, 10)')
+#    1.61 segundos
+#
+# La memoria máxima usada (medida con tracemalloc, en un proceso nuevo
+# para cada expresión) por caminosMatrizLista en la matriz 12x12 es 608
+# MiB y por caminosTrianguloLista en el triángulo de altura 20 es 166
+# MiB, mientras que caminos y caminosTriangulo usan 16 KiB, ya que
+# generan los caminos uno a uno.
@@ -0,0 +1,343 @@
+# AlineamientoSCM.py
+# Subsecuencias comunes máximas en espacio lineal y alineamientos.
+# José A. Alonso Jiménez <https://jaalonso.github.io>
+# Sevilla, 18-octubre-2026
+# ---------------------------------------------------------------------
+
+# ---------------------------------------------------------------------
+# Un alineamiento de dos secuencias xs e ys es una lista de operaciones
+# de edición que transforma xs en ys:
+# + ('=', x) conserva el elemento x (que es común a xs e ys),
+# + ('-', x) elimina el elemento x de xs y
+# + ('+', y) inserta el elemento y de ys.
+# Los elementos conservados forman una subsecuencia común de xs e ys y,
+# si es máxima, el alineamiento es mínimo (es lo que calcula la orden
+# diff entre las líneas de dos ficheros).
+#
+# La programación dinámica usual guarda la matriz de las longitudes
+# de las SCM de todos los prefijos, que ocupa O(n·m). En este módulo se
+# usan dos algoritmos que no la necesitan:
+# + el de Hirschberg, que calcula sólo la última fila de la matriz (en
+#   espacio O(m)) de la primera mitad de xs con ys y de la segunda mitad
+#   invertida con ys invertida, elige por dónde partir ys y resuelve
+#   recursivamente las dos mitades (en tiempo O(n·m) y espacio O(n+m))
+#   y
+# + el de Hunt y Szymanski, que recorre sólo los pares (i,j) tales que
+#   xs[i] = ys[j], manteniendo para cada k la menor posición j de ys en
+#   la que termina una subsecuencia común de longitud k (en tiempo
+#   O((r+n)·log(n)), donde r es el número de dichos pares, lo que es
+#   mucho menor que n·m cuando casi todos los elementos son distintos,
+#   como las líneas de un fichero).
+# Ambos funcionan con secuencias de elementos cualesquiera que se puedan
+# comparar y usar como claves de diccionarios, no sólo con cadenas.
+#
+# Definir las funciones
+#    alineamientoHirschberg     : (Sequence[A], Sequence[A]) -> Iterator[Operacion[A]]
+#    alineamientoHuntSzymanski  : (Sequence[A], Sequence[A]) -> Iterator[Operacion[A]]
+#    alineamiento               : (Sequence[A], Sequence[A]) -> Iterator[Operacion[A]]
+#    comunes                    : (Iterable[Operacion[A]]) -> list[A]
+# tales que
+# + alineamientoHirschberg(xs, ys) genera un alineamiento mínimo de xs
+#   e ys calculado con el algoritmo de Hirschberg. Por ejemplo,
+#      >>> list(alineamientoHirschberg("amapola", "matamoscas"))
+#      [('-', 'a'), ('=', 'm'), ('=', 'a'), ('-', 'p'), ('+', 't'),
+#       ('+', 'a'), ('+', 'm'), ('=', 'o'), ('-', 'l'), ('+', 's'),
+#       ('+', 'c'), ('=', 'a'), ('+', 's')]
+# + alineamientoHuntSzymanski(xs, ys) genera un alineamiento mínimo de
+#   xs e ys calculado con el algoritmo de Hunt y Szymanski. Por ejemplo,
+#      >>> list(alineamientoHuntSzymanski([1, 2, 3, 4], [2, 4, 5]))
+#      [('-', 1), ('=', 2), ('-', 3), ('=', 4), ('+', 5)]
+# + alineamiento(xs, ys) genera un alineamiento mínimo de xs e ys,
+#   eliminando antes el prefijo y el sufijo comunes y usando el
+#   algoritmo de Hunt y Szymanski si el número de pares de elementos
+#   iguales es menor que la mitad del de todos los pares (ya que, en la
+#   práctica, procesar cada par de iguales en el primero cuesta el doble
+#   que cada elemento de la matriz en el segundo) y el de Hirschberg en
+#   caso contrario.
+# + comunes(ops) es la lista de los elementos conservados en el
+#   alineamiento ops (que es una SCM de xs e ys si ops es mínimo). Por
+#   ejemplo,
+#      >>> "".join(comunes(alineamiento("amapola", "matamoscas")))
+#      'maoa'
+# ---------------------------------------------------------------------
+
+from array import array
+from bisect import bisect_left
+from collections import Counter
+from random import randrange
+from timeit import Timer, default_timer
+from typing import Hashable, Iterable, Iterator, Sequence, TypeVar
+
+from hypothesis import given
+from hypothesis import strategies as st
+
+A = TypeVar('A', bound=Hashable)
+
+Operacion = tuple[str, A]
+
+# filaSCM(xs, ys, ixs, jys) es la lista de las longitudes de las SCM de
+# la secuencia de los xs[i] con i en ixs y de cada prefijo de la
+# secuencia de los ys[j] con j en jys (es decir, la última fila de la
+# matriz de programación dinámica), calculada guardando una única
+# fila. Por ejemplo,
+#    >>> filaSCM("amapola", "matamoscas", range(7), range(10))
+#    [0, 1, 2, 2, 3, 3, 3, 3, 3, 4, 4]
+#    >>> filaSCM("amapola", "matamoscas", range(6, -1, -1), range(9, -1, -1))
+#    [0, 0, 1, 1, 1, 2, 3, 4, 4, 4, 4]
+def filaSCM(xs: Sequence[A],
+            ys: Sequence[A],
+            ixs: range,
+            jys: range) -> list[int]:
+    zs = [ys[j] for j in jys]
+    fila = [0] * (len(zs) + 1)
+    for i in ixs:
+        x = xs[i]
+        # diagonal es el valor de la fila anterior en la columna j-1.
+        diagonal = 0
+        for (j, z) in enumerate(zs, 1):
+            arriba = fila[j]
+            if x == z:
+                fila[j] = diagonal + 1
+            elif fila[j - 1] > arriba:
+                fila[j] = fila[j - 1]
+            diagonal = arriba
+    return fila
+
+# hirschberg(xs, ys, i0, i1, j0, j1) genera un alineamiento mínimo de
+# xs[i0:i1] e ys[j0:j1].
+def hirschberg(xs: Sequence[A],
+               ys: Sequence[A],
+               i0: int, i1: int,
+               j0: int, j1: int) -> Iterator[Operacion[A]]:
+    if i0 == i1:
+        yield from (('+', ys[j]) for j in range(j0, j1))
+    elif j0 == j1:
+        yield from (('-', xs[i]) for i in range(i0, i1))
+    elif i1 - i0 == 1:
+        x = xs[i0]
+        k = next((j for j in range(j0, j1) if ys[j] == x), None)
+        if k is None:
+            yield ('-', x)
+            yield from (('+', ys[j]) for j in range(j0, j1))
+        else:
+            yield from (('+', ys[j]) for j in range(j0, k))
+            yield ('=', x)
+            yield from (('+', ys[j]) for j in range(k + 1, j1))
+    else:
+        medio = (i0 + i1) // 2
+        izquierda = filaSCM(xs, ys, range(i0, medio), range(j0, j1))
+        derecha = filaSCM(xs, ys, range(i1 - 1, medio - 1, -1),
+                          range(j1 - 1, j0 - 1, -1))
+        m = j1 - j0
+        k = max(range(m + 1), key=lambda j: izquierda[j] + derecha[m - j])
+        del izquierda, derecha
+        yield from hirschberg(xs, ys, i0, medio, j0, j0 + k)
+        yield from hirschberg(xs, ys, medio, i1, j0 + k, j1)
+
+def alineamientoHirschberg(xs: Sequence[A],
+                           ys: Sequence[A]) -> Iterator[Operacion[A]]:
+    return hirschberg(xs, ys, 0, len(xs), 0, len(ys))
+
+# paresSCM(xs, ys) es la lista de los pares (i,j) tales que los xs[i]
+# (y los ys[j]) forman una SCM de xs e ys, calculada con el algoritmo
+# de Hunt y Szymanski. Por ejemplo,
+#    >>> paresSCM([1, 2, 3, 4], [2, 4, 5])
+#    [(1, 0), (3, 1)]
+def paresSCM(xs: Sequence[A], ys: Sequence[A]) -> list[tuple[int, int]]:
+    posiciones: dict[A, list[int]] = {}
+    for (j, y) in enumerate(ys):
+        posiciones.setdefault(y, []).append(j)
+    # umbrales[k] es la menor posición de ys en la que termina una
+    # subsecuencia común de longitud k+1 y enlaces[k] es el índice de su
+    # último par (is_[n], js[n]) en los vectores is_ y js, donde
+    # anteriores[n] es el índice del par anterior de la subsecuencia (o
+    # -1, si es el primero).
+    umbrales: list[int] = []
+    enlaces: list[int] = []
+    (is_, js, anteriores) = (array('l'), array('l'), array('l'))
+    for (i, x) in enumerate(xs):
+        # Las posiciones se recorren de mayor a menor para no usar dos
+        # veces el mismo xs[i].
+        for j in reversed(posiciones.get(x, [])):
+            k = bisect_left(umbrales, j)
+            if k == len(umbrales):
+                umbrales.append(j)
+                enlaces.append(len(is_))
+            elif j < umbrales[k]:
+                umbrales[k] = j
+                enlaces[k] = len(is_)
+            else:
+                continue
+            is_.append(i)
+            js.append(j)
+            anteriores.append(enlaces[k - 1] if k > 0 else -1)
+    pares = []
+    n = enlaces[-1] if enlaces else -1
+    while n >= 0:
+        pares.append((is_[n], js[n]))
+        n = anteriores[n]
+    return pares[::-1]
+
+# alineamientoDePares(xs, ys, pares) genera el alineamiento de xs e ys
+# en el que se conservan los xs[i] tales que (i,j) está en pares.
+def alineamientoDePares(xs: Sequence[A],
+                        ys: Sequence[A],
+                        pares: Iterable[tuple[int, int]]) -> Iterator[Operacion[A]]:
+    (i0, j0) = (0, 0)
+    for (i, j) in list(pares) + [(len(xs), len(ys))]:
+        yield from (('-', xs[k]) for k in range(i0, i))
+        yield from (('+', ys[k]) for k in range(j0, j))
+        if i < len(xs):
+            yield ('=', xs[i])
+        (i0, j0) = (i + 1, j + 1)
+
+def alineamientoHuntSzymanski(xs: Sequence[A],
+                              ys: Sequence[A]) -> Iterator[Operacion[A]]:
+    return alineamientoDePares(xs, ys, paresSCM(xs, ys))
+
+# numeroDeCoincidencias(xs, ys) es el número de pares (i,j) tales que
+# xs[i] = ys[j]. Por ejemplo,
+#    numeroDeCoincidencias("amapola", "matamoscas")  ==  12
+def numeroDeCoincidencias(xs: Sequence[A], ys: Sequence[A]) -> int:
+    cs = Counter(ys)
+    return sum(cs[x] for x in xs)
+
+def alineamiento(xs: Sequence[A], ys: Sequence[A]) -> Iterator[Operacion[A]]:
+    (n, m) = (len(xs), len(ys))
+    p = 0
+    while p < min(n, m) and xs[p] == ys[p]:
+        p += 1
+    s = 0
+    while s < min(n, m) - p and xs[n - 1 - s] == ys[m - 1 - s]:
+        s += 1
+    yield from (('=', xs[i]) for i in range(p))
+    xs2 = xs[p:n - s]
+    ys2 = ys[p:m - s]
+    r = numeroDeCoincidencias(xs2, ys2)
+    if 2 * r < len(xs2) * len(ys2):
+        yield from alineamientoHuntSzymanski(xs2, ys2)
+    else:
+        yield from alineamientoHirschberg(xs2, ys2)
+    yield from (('=', xs[i]) for i in range(n - s, n))
+
+def comunes(ops: Iterable[Operacion[A]]) -> list[A]:
+    return [x for (o, x) in ops if o == '=']
+
+# Verificación
+# ============
+
+def test_AlineamientoSCM() -> None:
+    assert filaSCM("amapola", "matamoscas", range(7), range(10)) == \
+        [0, 1, 2, 2, 3, 3, 3, 3, 3, 4, 4]
+    assert filaSCM("amapola", "matamoscas",
+                   range(6, -1, -1), range(9, -1, -1)) == \
+        [0, 0, 1, 1, 1, 2, 3, 4, 4, 4, 4]
+    assert list(alineamientoHirschberg("amapola", "matamoscas")) == \
+        [('-', 'a'), ('=', 'm'), ('=', 'a'), ('-', 'p'), ('+', 't'),
+         ('+', 'a'), ('+', 'm'), ('=', 'o'), ('-', 'l'), ('+', 's'),
+         ('+', 'c'), ('=', 'a'), ('+', 's')]
+    assert paresSCM([1, 2, 3, 4], [2, 4, 5]) == [(1, 0), (3, 1)]
+    assert list(alineamientoHuntSzymanski([1, 2, 3, 4], [2, 4, 5])) == \
+        [('-', 1), ('=', 2), ('-', 3), ('=', 4), ('+', 5)]
+    assert numeroDeCoincidencias("amapola", "matamoscas") == 12
+    assert "".join(comunes(alineamiento("amapola", "matamoscas"))) == 'maoa'
+    assert list(alineamiento("", "ab")) == [('+', 'a'), ('+', 'b')]
+    assert list(alineamiento("ab", "ab")) == [('=', 'a'), ('=', 'b')]
+    print("Verificado")
+
+# La verificación es
+#    >>> test_AlineamientoSCM()
+#    Verificado
+
+# Comprobación de propiedades
+# ===========================
+
+# aplica(ops) es el par (xs, ys) de las secuencias origen y destino del
+# alineamiento ops.
+def aplica(ops: Iterable[Operacion[A]]) -> tuple[list[A], list[A]]:
+    ops = list(ops)
+    return ([x for (o, x) in ops if o != '+'],
+            [x for (o, x) in ops if o != '-'])
+
+# longitudSCM(xs, ys) es la longitud de las SCM de xs e ys.
+def longitudSCM(xs: Sequence[A], ys: Sequence[A]) -> int:
+    return filaSCM(xs, ys, range(len(xs)), range(len(ys)))[-1]
+
+# La propiedad es
+@given(st.lists(st.integers(min_value=0, max_value=5), max_size=40),
+       st.lists(st.integers(min_value=0, max_value=5), max_size=40))
+def test_alineamientos(xs: list[int], ys: list[int]) -> None:
+    n = longitudSCM(xs, ys)
+    for f in [alineamientoHirschberg, alineamientoHuntSzymanski, alineamiento]:
+        ops = list(f(xs, ys))
+        assert aplica(ops) == (xs, ys)
+        assert len(comunes(ops)) == n
+
+# La comprobación es
+#    > poetry run pytest -q AlineamientoSCM.py
+#    2 passed in 2.27s
+
+# Comparación de eficiencia
+# =========================
+
+def tiempo(e: str) -> None:
+    """Tiempo (en segundos) de evaluar la expresión e."""
+    t = Timer(e, "", default_timer, globals()).timeit(1)
+    print(f"{t:0.2f} segundos")
+
+# lineasAleatorias(n) es una lista de n líneas aleatorias (casi todas
+# distintas).
+def lineasAleatorias(n: int) -> list[str]:
+    return [f"línea {randrange(10**9)}" for _ in range(n)]
+
+# modifica(xs, k) es la lista obtenida aplicando a xs k ediciones
+# aleatorias (inserciones o eliminaciones de una línea).
+def modifica(xs: list[str], k: int) -> list[str]:
+    ys = list(xs)
+    for _ in range(k):
+        i = randrange(len(ys) + 1)
+        if randrange(2) == 0 and i < len(ys):
+            del ys[i]
+        else:
+            ys.insert(i, f"nueva {randrange(10**9)}")
+    return ys
+
+# La comparación es
+#    >>> from src.Subsecuencia_comun_maxima import scm2
+#    >>> from src.Longitud_SCM import longitudSCM2
+#    >>> from random import seed
+#    >>> seed(2026)
+#
+# Con dos listas de 2000 elementos tomados de 4 valores (por lo que hay
+# muchos pares de elementos iguales):
+#    >>> as_ = [str(randrange(4)) for _ in range(2000)]
+#    >>> bs = [str(randrange(4)) for _ in range(2000)]
+#    >>> tiempo('len(scm2(as_, bs))')
+#    2.02 segundos
+#    >>> tiempo('longitudSCM2(as_, bs)')
+#    1.35 segundos
+#    >>> tiempo('len(comunes(alineamientoHirschberg(as_, bs)))')
+#    0.83 segundos
+#    >>> tiempo('len(comunes(alineamientoHuntSzymanski(as_, bs)))')
+#    0.40 segundos
+#
+# La memoria máxima usada (medida con tracemalloc) es 577 MiB por scm2,
+# 53 MiB por longitudSCM2 y menos de 1 MiB por alineamientoHirschberg.
+#
+# Con dos ficheros de 2000 líneas, el segundo obtenido del primero con
+# 100 ediciones:
+#    >>> cs = lineasAleatorias(2000)
+#    >>> ds = modifica(cs, 100)
+#    >>> tiempo('longitudSCM2(cs, ds)')
+#    1.76 segundos
+#    >>> tiempo('len(comunes(alineamientoHirschberg(cs, ds)))')
+#    0.95 segundos
+#    >>> tiempo('len(comunes(alineamientoHuntSzymanski(cs, ds)))')
+#    0.00 segundos
+#
+# Con dos ficheros de 10^5 líneas, el segundo obtenido del primero con
+# 1000 ediciones (con los que la matriz tendría 10^10 elementos):
+#    >>> xs = lineasAleatorias(10**5)
+#    >>> ys = modifica(xs, 1000)
+#    >>> tiempo('len(comunes(alineamiento(xs, ys)))')
+#    0.31 segundos
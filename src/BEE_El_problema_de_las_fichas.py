@@ -86,13 +86,17 @@
 #    >>> fichas(buscaEscalada, 2, 2)
 #    [[B,B,H,V,V],[B,H,B,V,V],[H,B,B,V,V],[V,B,B,H,V],[V,B,B,V,H],
 #     [V,H,B,V,B],[V,V,B,H,B],[V,V,H,B,B]]
+#    >>> fichas(buscaAnchuraSinRepeticiones, 2, 2)
+#    [[B,B,H,V,V],[H,B,B,V,V],[V,B,B,H,V],[V,H,B,B,V],[V,V,B,B,H],
+#     [V,V,H,B,B]]
 # ---------------------------------------------------------------------
 
 from enum import Enum
 from functools import partial
+from timeit import Timer, default_timer
 from typing import Callable, Optional
 
-from src.BusquedaEnAnchura import buscaAnchura1
+from src.BusquedaEnAnchura import buscaAnchura1, buscaAnchuraPerezosa
 from src.BusquedaEnEscalada import buscaEscalada
 from src.BusquedaEnProfundidad import buscaProfundidad1
 from src.BusquedaPrimeroElMejor import buscaPM
@@ -200,6 +204,21 @@ def sucesores(e: Estado) -> list[Estado]:
     t, *ts = e
     return [Estado([t1] + e) for t1 in tablerosSucesores(t) if t1 not in ts]
 
+# claveEstado(e) es la clave que identifica al estado e en la búsqueda
+# sin repeticiones; es decir, su último tablero. Por ejemplo,
+#    >>> claveEstado([[H,B,B,V],[B,B,H,V]])
+#    (H, B, B, V)
+def claveEstado(e: Estado) -> tuple[Ficha, ...]:
+    return tuple(e[0])
+
+# buscaAnchuraSinRepeticiones(s, o, e) es la primera solución obtenida
+# por búsqueda en anchura sin volver a explorar los tableros ya
+# alcanzados.
+def buscaAnchuraSinRepeticiones(s: Callable[[Estado], list[Estado]],
+                                o: Callable[[Estado], bool],
+                                e: Estado) -> Optional[Estado]:
+    return next(buscaAnchuraPerezosa(s, o, e, claveEstado), None)
+
 # Solución por búsqueda
 # =====================
 
@@ -228,8 +247,29 @@ def test_fichas() -> None:
     assert fichas(buscaEscalada, 1, 2) == \
         [[B, H, V, V], [H, B, V, V], [V, B, H, V], [V, H, B, V],
          [V, V, B, H], [V, V, H, B]]
+    assert fichas(buscaAnchuraSinRepeticiones, 1, 2) == \
+        fichas(buscaAnchura1, 1, 2)
+    assert fichas(buscaAnchuraSinRepeticiones, 2, 2) == \
+        [[B, B, H, V, V], [H, B, B, V, V], [V, B, B, H, V], [V, H, B, B, V],
+         [V, V, B, B, H], [V, V, H, B, B]]
     print("Verificado")
 
 # La verificación es
 #    >>> test_fichas()
 #    Verificado
+
+# Comparación de eficiencia
+# =========================
+
+def tiempo(e: str) -> None:
+    """Tiempo (en segundos) de evaluar la expresión e."""
+    t = Timer(e, "", default_timer, globals()).timeit(1)
+    print(f"{t:0.2f} segundos")
+
+# La comparación es
+#    >>> tiempo('fichas(buscaAnchura1, 2, 2)')
+#    1.33 segundos
+#    >>> tiempo('fichas(buscaAnchuraSinRepeticiones, 2, 2)')
+#    0.00 segundos
+#    >>> tiempo('fichas(buscaAnchuraSinRepeticiones, 4, 4)')
+#    0.02 segundos
@@ -22,6 +22,7 @@
 # funciones
 #    solucionesNR      : (int) -> list[SolNR]
 #    primeraSolucionNR : (int) -> SolNR
+#    primerasSolucionesNR : (int, int) -> list[SolNR]
 #    nSolucionesNR     : (int) -> int
 # tales que
 # + solucionesNR(n) es la lista de las soluciones del problema de las n
@@ -36,13 +37,24 @@
 #   ejemplo,
 #      >>> primeraSolucionNR(8)
 #      [(1, 8), (2, 4), (3, 1), (4, 3), (5, 6), (6, 2), (7, 7), (8, 5)]
+# + primerasSolucionesNR(n, k) es la lista de las k primeras soluciones
+#   del problema de las n reinas, por búsqueda en espacio de estados por
+#   profundidad. Por ejemplo,
+#      >>> primerasSolucionesNR(8, 2)
+#      [[(1, 8), (2, 4), (3, 1), (4, 3), (5, 6), (6, 2), (7, 7), (8, 5)],
+#       [(1, 8), (2, 3), (3, 1), (4, 6), (5, 2), (6, 5), (7, 7), (8, 4)]]
 # + nSolucionesNR(n) es el número de soluciones del problema de las n
 #   reinas, por búsqueda en espacio de estados. Por ejemplo,
 #      >>> nSolucionesNR(8)
 #      92
 # ---------------------------------------------------------------------
 
-from src.BusquedaEnProfundidad import buscaProfundidad
+from itertools import islice
+from timeit import Timer, default_timer
+from typing import Iterator
+
+from src.BusquedaEnProfundidad import (buscaProfundidad,
+                                       buscaProfundidadPerezosa)
 
 Columna = int
 Fila = int
@@ -87,8 +99,19 @@ def solucionesNR(n: int) -> list[SolNR]:
                                                 esFinalNR,
                                                 nInicial)]
 
+# solucionesPerezosasNR(n) es el generador de las soluciones del
+# problema de las n reinas.
+def solucionesPerezosasNR(n: int) -> Iterator[SolNR]:
+    nInicial: NodoNR = (1,n,[])
+    return (e for (_, _, e) in buscaProfundidadPerezosa(sucesoresNR,
+                                                         esFinalNR,
+                                                         nInicial))
+
 def primeraSolucionNR(n: int) -> SolNR:
-    return solucionesNR(n)[0]
+    return next(solucionesPerezosasNR(n))
+
+def primerasSolucionesNR(n: int, k: int) -> list[SolNR]:
+    return list(islice(solucionesPerezosasNR(n), k))
 
 def nSolucionesNR(n: int) -> int:
     return len(solucionesNR(n))
@@ -101,8 +124,28 @@ def test_nReinas() -> None:
         [[(1,8),(2,4),(3,1),(4,3),(5,6),(6,2),(7,7),(8,5)],
          [(1,8),(2,3),(3,1),(4,6),(5,2),(6,5),(7,7),(8,4)],
          [(1,8),(2,2),(3,5),(4,3),(5,1),(6,7),(7,4),(8,6)]]
+    assert primeraSolucionNR(8) == solucionesNR(8)[0]
+    assert primerasSolucionesNR(8, 3) == solucionesNR(8)[:3]
     assert nSolucionesNR(8) == 92
     print("Verificado")
 
 # La verificación es
 #
+#    >>> test_nReinas()
+#    Verificado
+
+# Comparación de eficiencia
+# =========================
+
+def tiempo(e: str) -> None:
+    """Tiempo (en segundos) de evaluar la expresión e."""
+    t = Timer(e, "", default_timer, globals()).timeit(1)
+    print(f"{t:0.2f} segundos")
+
+# La comparación es
+#    >>> tiempo('solucionesNR(10)[0]')
+#    17.13 segundos
+#    >>> tiempo('primeraSolucionNR(10)')
+#    0.00 segundos
+#    >>> tiempo('primeraSolucionNR(16)')
+#    1.08 segundos
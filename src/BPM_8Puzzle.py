@@ -60,11 +60,25 @@
 #      [7, 6, 5]]]
 #    >>> len(solucion_8puzzle([[2,6,3],[5,0,4],[1,7,8]]))
 #    21
+#
+# Además, usando el procedimiento de búsqueda A*, definir la función
+#    solucion_8puzzleA : (Tablero) -> Optional[list[Tablero]]
+# tal que solucion_8puzzleA(t) es una solución de longitud mínima del
+# problema del 8 puzzle a partir del tablero t, o None si no tiene
+# solución. Por ejemplo,
+#    >>> len(solucion_8puzzleA([[2,6,3],[5,0,4],[1,7,8]]))
+#    17
+#    >>> len(solucion_8puzzleA([[5,6,7],[4,0,8],[3,2,1]]))
+#    31
+#    >>> solucion_8puzzleA([[2,1,3],[8,0,4],[7,6,5]])
+#    None
 # ---------------------------------------------------------------------
 
 from copy import deepcopy
+from timeit import Timer, default_timer
 from typing import Optional
 
+from src.BusquedaAEstrella import buscaAEstrella
 from src.BusquedaPrimeroElMejor import buscaPM
 
 Tablero = list[list[int]]
@@ -249,6 +263,89 @@ def solucion_8puzzle(t: Tablero) -> Optional[list[Tablero]]:
     ts.reverse()
     return ts
 
+# Solución mediante A*
+# ====================
+
+# En la búsqueda A* los estados son los propios tableros,
+# representados por la tupla de sus 9 elementos leídos por filas, ya
+# que el camino lo reconstruye buscaAEstrella.
+TableroA = tuple[int, ...]
+
+# aTableroA(t) es la representación como tupla del tablero t. Por
+# ejemplo,
+#    >>> aTableroA([[0,1,3],[8,2,4],[7,6,5]])
+#    (0, 1, 3, 8, 2, 4, 7, 6, 5)
+def aTableroA(t: Tablero) -> TableroA:
+    return tuple(x for fila in t for x in fila)
+
+# deTableroA(t) es el tablero representado por la tupla t. Por ejemplo,
+#    >>> deTableroA((0, 1, 3, 8, 2, 4, 7, 6, 5))
+#    [[0, 1, 3], [8, 2, 4], [7, 6, 5]]
+def deTableroA(t: TableroA) -> Tablero:
+    return [list(t[i:i+3]) for i in range(0, 9, 3)]
+
+tableroFinalA: TableroA = aTableroA(tableroFinal)
+
+# posicionFinal[a] es la posición del elemento a en el tablero final.
+posicionFinal: dict[int, Posicion] = {a: divmod(i, 3)
+                                      for (i, a) in enumerate(tableroFinalA)}
+
+# vecinasA[i] es la lista de los índices de las posiciones vecinas a la
+# de índice i.
+vecinasA: list[list[int]] = [[3 * a + b for (a, b) in posicionesVecinas(divmod(i, 3))]
+                             for i in range(9)]
+
+# heuristicaA(t) es la suma de las distancias Manhattan de cada pieza
+# (sin contar el hueco) a su posición final. Es una heurística
+# admisible y consistente. Por ejemplo,
+#    >>> heuristicaA(aTableroA([[0,1,3],[8,2,4],[7,6,5]]))
+#    2
+def heuristicaA(t: TableroA) -> int:
+    return sum(distancia(divmod(i, 3), posicionFinal[a])
+               for (i, a) in enumerate(t)
+               if a != 0)
+
+# sucesoresA(t) es la lista de los tableros sucesores de t. Por
+# ejemplo,
+#    >>> sucesoresA((0, 1, 3, 8, 2, 4, 7, 6, 5))
+#    [(8, 1, 3, 0, 2, 4, 7, 6, 5), (1, 0, 3, 8, 2, 4, 7, 6, 5)]
+def sucesoresA(t: TableroA) -> list[TableroA]:
+    i = t.index(0)
+    r = []
+    for j in vecinasA[i]:
+        t1 = list(t)
+        t1[i], t1[j] = t1[j], t1[i]
+        r.append(tuple(t1))
+    return r
+
+# esResoluble(t) se verifica si desde el tablero t se puede llegar al
+# final; es decir, si la permutación de las piezas de t respecto de las
+# del tablero final es par. Por ejemplo,
+#    >>> esResoluble(aTableroA([[0,1,3],[8,2,4],[7,6,5]]))
+#    True
+#    >>> esResoluble(aTableroA([[2,1,3],[8,0,4],[7,6,5]]))
+#    False
+def esResoluble(t: TableroA) -> bool:
+    orden = {a: i for (i, a) in enumerate(x for x in tableroFinalA if x != 0)}
+    xs = [orden[a] for a in t if a != 0]
+    inversiones = sum(1
+                      for i in range(len(xs))
+                      for j in range(i + 1, len(xs))
+                      if xs[i] > xs[j])
+    return inversiones % 2 == 0
+
+def solucion_8puzzleA(t: Tablero) -> Optional[list[Tablero]]:
+    t0 = aTableroA(t)
+    if not esResoluble(t0):
+        return None
+    r = buscaAEstrella(sucesoresA,
+                       lambda x: x == tableroFinalA,
+                       t0,
+                       heuristicaA)
+    if r is None:
+        return None
+    return [deTableroA(x) for x in r]
+
 # Verificación
 # ============
 
@@ -258,7 +355,28 @@ def test_8puzzle() -> None:
          [[0, 1, 3], [8, 2, 4], [7, 6, 5]],
          [[1, 0, 3], [8, 2, 4], [7, 6, 5]],
          [[1, 2, 3], [8, 0, 4], [7, 6, 5]]]
+    assert solucion_8puzzleA([[8,1,3],[0,2,4],[7,6,5]]) == \
+        solucion_8puzzle([[8,1,3],[0,2,4],[7,6,5]])
+    assert len(solucion_8puzzleA([[2,6,3],[5,0,4],[1,7,8]]) or []) == 17
+    assert len(solucion_8puzzleA([[5,6,7],[4,0,8],[3,2,1]]) or []) == 31
+    assert solucion_8puzzleA([[2,1,3],[8,0,4],[7,6,5]]) is None
 
 # La verificación es
 #    src> poetry run pytest -q BPM_8Puzzle.py
 #    1 passed in 0.10s
+
+# Comparación de eficiencia
+# =========================
+
+def tiempo(e: str) -> None:
+    """Tiempo (en segundos) de evaluar la expresión e."""
+    t = Timer(e, "", default_timer, globals()).timeit(1)
+    print(f"{t:0.2f} segundos")
+
+# La comparación es
+#    >>> tiempo('solucion_8puzzle([[2,6,3],[5,0,4],[1,7,8]])')
+#    0.03 segundos
+#    >>> tiempo('solucion_8puzzleA([[2,6,3],[5,0,4],[1,7,8]])')
+#    0.00 segundos
+#    >>> tiempo('solucion_8puzzleA([[5,6,7],[4,0,8],[3,2,1]])')
+#    0.05 segundos
@@ -0,0 +1,278 @@
+# Binomiales.py
+# Coeficientes binomiales exactos y filas del triángulo de Pascal.
+# José A. Alonso Jiménez <https://jaalonso.github.io>
+# Sevilla, 18-octubre-2026
+# ---------------------------------------------------------------------
+
+# ---------------------------------------------------------------------
+# Por la fórmula de Legendre, el exponente del primo p en n! es
+#    e(n, p) = n//p + n//p² + n//p³ + ...
+# por lo que el exponente de p en el coeficiente binomial n sobre k es
+# e(n, p) - e(k, p) - e(n-k, p). Con los primos menores o iguales que n
+# en un vector de NumPy, el primer sumando se calcula para todos a la
+# vez y los siguientes sólo hay que calcularlos para los primos menores
+# o iguales que la raíz cuadrada de n. El coeficiente es el producto de
+# las potencias de los primos, que se calcula con un árbol de productos
+# (multiplicando por parejas números de tamaños parecidos, que es como
+# la multiplicación de Karatsuba de Python es más eficiente).
+#
+# Por el teorema de Lucas, si p es primo y n = n(0) + n(1)p + n(2)p² +
+# ... y k = k(0) + k(1)p + k(2)p² + ... son las expresiones de n y k en
+# base p, entonces el coeficiente binomial n sobre k es congruente
+# módulo p con el producto de los coeficientes binomiales n(i) sobre
+# k(i). Con él se calcula a la vez, con NumPy, la fila n-ésima del
+# triángulo de Pascal módulo p.
+#
+# Definir las funciones
+#    factorizacionBinomial : (int, int) -> dict[int, int]
+#    binomial              : (int, int) -> int
+#    filaDePascal          : (int) -> list[int]
+#    filaDePascalModulo    : (int, int) -> npt.NDArray[np.int64]
+# tales que
+# + factorizacionBinomial(n, k) es el diccionario de los factores
+#   primos del coeficiente binomial n sobre k con sus exponentes. Por
+#   ejemplo,
+#      >>> factorizacionBinomial(10, 4)
+#      {2: 1, 3: 1, 5: 1, 7: 1}
+#      >>> factorizacionBinomial(100, 50)[2]
+#      3
+# + binomial(n, k) es el coeficiente binomial n sobre k. Por ejemplo,
+#      >>> binomial(10, 4)
+#      210
+#      >>> binomial(10, 11)
+#      0
+#      >>> binomial(10**18, 3)
+#      166666666666666666166666666666666667000000000000000000
+#      >>> binomial(10**6, 5 * 10**5) % 10**9
+#      409350784
+# + filaDePascal(n) es la fila n-ésima del triángulo de Pascal. Por
+#   ejemplo,
+#      >>> filaDePascal(6)
+#      [1, 6, 15, 20, 15, 6, 1]
+# + filaDePascalModulo(n, p) es el vector de los restos de dividir
+#   entre p los elementos de la fila n-ésima del triángulo de Pascal,
+#   donde p es un primo menor que 2^31. Por ejemplo,
+#      >>> filaDePascalModulo(6, 5)
+#      array([1, 1, 0, 0, 0, 1, 1])
+#      >>> filaDePascalModulo(6, 7)
+#      array([1, 6, 1, 6, 1, 6, 1])
+#      >>> filaDePascalModulo(10**6, 10**9 + 7)[:4]
+#      array([        1,   1000000, 999496507, 500336845])
+# ---------------------------------------------------------------------
+
+from math import comb, isqrt, prod
+from timeit import Timer, default_timer
+
+import numpy as np
+import numpy.typing as npt
+from hypothesis import given
+from hypothesis import strategies as st
+from sympy import isprime
+
+from src.CribaSegmentada import primosHasta
+
+# _primos es la lista cuyo único elemento es el par (n, ps) tal que ps
+# es el vector de los primos menores o iguales que n (o la lista vacía
+# si aún no se ha calculado).
+_primos: list[tuple[int, npt.NDArray[np.int64]]] = []
+
+# vectorDePrimos(n) es el vector de los primos menores o iguales que n.
+# Se guarda el último vector calculado y, si no llega hasta n, se
+# calcula otro al menos el doble de largo. Por ejemplo,
+#    >>> vectorDePrimos(20)
+#    array([ 2,  3,  5,  7, 11, 13, 17, 19])
+def vectorDePrimos(n: int) -> npt.NDArray[np.int64]:
+    if not _primos or _primos[0][0] < n:
+        m = max(n, 2 * _primos[0][0]) if _primos else n
+        _primos[:] = [(m, np.array(primosHasta(m), dtype=np.int64))]
+    ps = _primos[0][1]
+    return ps[:np.searchsorted(ps, n, side='right')]
+
+# exponentes(n, k, ps) es el vector de los exponentes de los primos de
+# ps en el coeficiente binomial n sobre k, calculados con la fórmula de
+# Legendre. Por ejemplo,
+#    >>> exponentes(10, 4, vectorDePrimos(10))
+#    array([1, 1, 1, 1])
+def exponentes(n: int,
+               k: int,
+               ps: npt.NDArray[np.int64]) -> npt.NDArray[np.int64]:
+    es = n // ps - k // ps - (n - k) // ps
+    for (i, p) in enumerate(ps[:np.searchsorted(ps, isqrt(n), side='right')]
+                            .tolist()):
+        q = p * p
+        while q <= n:
+            es[i] += n // q - k // q - (n - k) // q
+            q *= p
+    return es
+
+def factorizacionBinomial(n: int, k: int) -> dict[int, int]:
+    if not 0 <= k <= n:
+        raise ValueError(f'no se puede factorizar binomial({n}, {k})')
+    ps = vectorDePrimos(n)
+    es = exponentes(n, k, ps)
+    positivos = es > 0
+    return dict(zip(ps[positivos].tolist(), es[positivos].tolist()))
+
+# productoEnArbol(xs) es el producto de los elementos de xs, calculado
+# multiplicando por parejas los elementos consecutivos hasta que sólo
+# queda uno. Por ejemplo,
+#    >>> productoEnArbol([2, 3, 5, 7, 11])
+#    2310
+def productoEnArbol(xs: list[int]) -> int:
+    if not xs:
+        return 1
+    while len(xs) > 1:
+        ys = [xs[i] * xs[i + 1] for i in range(0, len(xs) - 1, 2)]
+        if len(xs) % 2 == 1:
+            ys.append(xs[-1])
+        xs = ys
+    return xs[0]
+
+# MULTIPLICATIVO es el cociente n/k a partir del cual binomial calcula
+# el coeficiente como (n-k+1)(n-k+2)...n / k!, en lugar de factorizarlo.
+MULTIPLICATIVO = 64
+
+def binomial(n: int, k: int) -> int:
+    if not 0 <= k <= n:
+        return 0
+    k = min(k, n - k)
+    if k * MULTIPLICATIVO < n:
+        return productoEnArbol(list(range(n - k + 1, n + 1))) // \
+            productoEnArbol(list(range(2, k + 1)))
+    ps = vectorDePrimos(n)
+    es = exponentes(n, k, ps)
+    # Los primos con exponente 1 son la mayoría, por lo que se separan de
+    # los que hay que elevar.
+    simples = ps[es == 1].tolist()
+    multiples = [p**e for (p, e) in zip(ps[es > 1].tolist(),
+                                        es[es > 1].tolist())]
+    return productoEnArbol(multiples + simples)
+
+# La fila n-ésima se calcula por la mitad, con C(n,k+1) = C(n,k)(n-k)/(k+1),
+# y se completa por simetría.
+def filaDePascal(n: int) -> list[int]:
+    fila = [1] * (n + 1)
+    for k in range(n // 2):
+        fila[k + 1] = fila[n - k - 1] = fila[k] * (n - k) // (k + 1)
+    return fila
+
+# filaPequena(a, p) es el vector de los restos módulo p de los
+# coeficientes binomiales a sobre j, para 0 <= j <= a < p, calculados
+# con los factoriales módulo p y sus inversos. Por ejemplo,
+#    >>> filaPequena(4, 7)
+#    array([1, 4, 6, 4, 1])
+#    >>> filaPequena(4, 5)
+#    array([1, 4, 1, 4, 1])
+def filaPequena(a: int, p: int) -> npt.NDArray[np.int64]:
+    f = 1
+    for i in range(2, a + 1):
+        f = f * i % p
+    inversos = [0] * (a + 1)
+    inversos[a] = pow(f, p - 2, p)
+    for i in range(a, 0, -1):
+        inversos[i - 1] = inversos[i] * i % p
+    g = np.array(inversos, dtype=np.int64)
+    return f * g % p * g[::-1] % p
+
+def filaDePascalModulo(n: int, p: int) -> npt.NDArray[np.int64]:
+    if not (isprime(p) and p < 2**31):
+        raise ValueError(f'el módulo {p} no es un primo menor que 2^31')
+    ks = np.arange(n + 1, dtype=np.int64)
+    fila = np.ones(n + 1, dtype=np.int64)
+    while n > 0:
+        (n, a) = divmod(n, p)
+        ds = ks % p
+        ks //= p
+        t = filaPequena(a, p)
+        fila = np.where(ds <= a, fila * t[np.minimum(ds, a)] % p, 0)
+    return fila
+
+# Verificación
+# ============
+
+def test_Binomiales() -> None:
+    assert vectorDePrimos(20).tolist() == [2, 3, 5, 7, 11, 13, 17, 19]
+    assert exponentes(10, 4, vectorDePrimos(10)).tolist() == [1, 1, 1, 1]
+    assert factorizacionBinomial(10, 4) == {2: 1, 3: 1, 5: 1, 7: 1}
+    assert factorizacionBinomial(100, 50)[2] == 3
+    assert productoEnArbol([2, 3, 5, 7, 11]) == 2310
+    assert productoEnArbol([]) == 1
+    assert binomial(10, 4) == 210
+    assert binomial(10, 11) == 0
+    assert binomial(10, -1) == 0
+    assert binomial(0, 0) == 1
+    assert binomial(10**18, 3) == \
+        166666666666666666166666666666666667000000000000000000
+    assert binomial(3000, 1500) == comb(3000, 1500)
+    assert binomial(10**6, 5 * 10**5) % 10**9 == 409350784
+    assert filaDePascal(6) == [1, 6, 15, 20, 15, 6, 1]
+    assert filaDePascal(0) == [1]
+    assert filaPequena(4, 7).tolist() == [1, 4, 6, 4, 1]
+    assert filaPequena(4, 5).tolist() == [1, 4, 1, 4, 1]
+    assert filaDePascalModulo(6, 5).tolist() == [1, 1, 0, 0, 0, 1, 1]
+    assert filaDePascalModulo(6, 7).tolist() == [1, 6, 1, 6, 1, 6, 1]
+    assert filaDePascalModulo(10**6, 10**9 + 7)[:4].tolist() == \
+        [1, 1000000, 999496507, 500336845]
+    print("Verificado")
+
+# La verificación es
+#    >>> test_Binomiales()
+#    Verificado
+
+# Comprobación de propiedades
+# ===========================
+
+# La propiedad es
+@given(st.integers(min_value=0, max_value=2000),
+       st.integers(min_value=-5, max_value=2000),
+       st.sampled_from([2, 3, 5, 7, 97, 1009, 2**31 - 1]))
+def test_binomial(n: int, k: int, p: int) -> None:
+    assert binomial(n, k) == (comb(n, k) if k >= 0 else 0)
+    if 0 <= k <= n:
+        f = factorizacionBinomial(n, k)
+        assert all(isprime(q) and e > 0 for (q, e) in f.items())
+        assert prod(q**e for (q, e) in f.items()) == comb(n, k)
+    fila = filaDePascal(n)
+    assert fila == [comb(n, j) for j in range(n + 1)]
+    assert filaDePascalModulo(n, p).tolist() == [x % p for x in fila]
+
+# La comprobación es
+#    > poetry run pytest -q Binomiales.py
+#    2 passed in 15.42s
+
+# Comparación de eficiencia
+# =========================
+
+def tiempo(e: str) -> None:
+    """Tiempo (en segundos) de evaluar la expresión e."""
+    t = Timer(e, "", default_timer, globals()).timeit(1)
+    print(f"{t:0.2f} segundos")
+
+# La comparación es
+#    >>> tiempo('comb(10**6, 5 * 10**5)')
+#    13.04 segundos
+#    >>> tiempo('binomial(10**6, 5 * 10**5)')
+#    0.18 segundos
+#    >>> tiempo('factorizacionBinomial(10**6, 5 * 10**5)')
+#    0.01 segundos
+#    >>> tiempo('comb(10**6, 20000)')
+#    0.06 segundos
+#    >>> tiempo('binomial(10**6, 20000)')
+#    0.01 segundos
+#    >>> tiempo('binomial(10**7, 5 * 10**6)')
+#    7.46 segundos
+#
+#    >>> tiempo('filaDePascal(10**4)')
+#    0.01 segundos
+#    >>> tiempo('filaDePascalModulo(10**6, 7)')
+#    0.16 segundos
+#    >>> tiempo('filaDePascalModulo(10**6, 10**9 + 7)')
+#    0.37 segundos
+#
+# El primer cálculo de binomial(10**6, _) incluye el de los primos
+# hasta 10^6 (0.03 segundos). Con ellos, los exponentes se calculan en
+# milisegundos y la mayor parte del tiempo se dedica a multiplicar los
+# números grandes del árbol de productos. Con un módulo grande, como
+# 10^9+7, la mayor parte del tiempo de filaDePascalModulo es el cálculo
+# de los factoriales módulo p (que no se puede vectorizar), mientras
+# que con uno pequeño, como 7, es el de los vectores de los dígitos.
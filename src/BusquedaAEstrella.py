@@ -0,0 +1,162 @@
+# BusquedaAEstrella.py
+# Búsqueda A*.
+# José A. Alonso Jiménez <https://jaalonso.github.io>
+# Sevilla, 18-octubre-2026
+# ---------------------------------------------------------------------
+
+# ---------------------------------------------------------------------
+# La búsqueda A* es una búsqueda por primero el mejor en la que los
+# estados se ordenan por f(e) = g(e) + h(e), donde g(e) es el coste del
+# camino desde el estado inicial hasta e y h(e) es la heurística; es
+# decir, una estimación del coste desde e hasta un estado final. Si la
+# heurística es admisible (nunca sobreestima el coste), el camino
+# encontrado es de coste mínimo.
+#
+# A diferencia de buscaPM, los estados no guardan el camino recorrido,
+# sino que se identifican mediante una clave (por defecto, el propio
+# estado) con la que se reconocen los estados ya alcanzados:
+# + La frontera (o conjunto abierto) es un montículo binario (heapq) de
+#   elementos (f, h, n, g, e), donde n es el orden de inserción (que
+#   sirve para desempatar sin comparar los estados).
+# + Cuando se encuentra un camino mejor a un estado de la frontera no se
+#   modifica su prioridad, sino que se inserta de nuevo y, al extraer el
+#   elemento antiguo, se descarta por tener un coste mayor que el mejor
+#   conocido (borrado perezoso).
+# + Los estados expandidos forman el conjunto cerrado. Si se llega a un
+#   estado cerrado por un camino de menor coste (lo que sólo ocurre si
+#   la heurística no es consistente), se reabre.
+#
+# Definir la función
+#    buscaAEstrella(Callable[[A], list[A]], Callable[[A], bool], A,
+#                   Callable[[A], float], Callable[[A, A], float],
+#                   Callable[[A], Hashable],
+#                   Optional[EstadisticasAEstrella]) -> Optional[list[A]]
+# tal que buscaAEstrella(s, o, e, h, c, clave, estadisticas) es el
+# camino (desde e hasta un estado final) de menor coste del problema de
+# espacio de estado definido por la función sucesores s, el objetivo o,
+# el estado inicial e, la heurística h y el coste c (donde c(x, y) es
+# el coste de pasar del estado x a su sucesor y). Si se da estadisticas,
+# se anotan en ella el número de nodos expandidos, el tamaño máximo de
+# la frontera y el número de reaperturas. Por ejemplo,
+#    >>> est = EstadisticasAEstrella()
+#    >>> buscaAEstrella(lambda x: [x+1, 2*x], lambda x: x == 10, 1,
+#    ...                lambda x: 0, estadisticas=est)
+#    [1, 2, 4, 5, 10]
+#    >>> est.expandidos
+#    9
+# ---------------------------------------------------------------------
+
+from dataclasses import dataclass
+from heapq import heappop, heappush
+from itertools import count
+from typing import Callable, Hashable, Optional, TypeVar
+
+from src.BusquedaEnAnchura import Estadisticas
+
+A = TypeVar('A')
+
+# EstadisticasAEstrella es el tipo de los contadores de la búsqueda A*,
+# que añade a los de Estadisticas el número de estados reabiertos.
+@dataclass
+class EstadisticasAEstrella(Estadisticas):
+    reaperturas: int = 0
+
+# identidad(x) es x.
+def identidad(x: A) -> A:
+    return x
+
+# costeUnitario(x, y) es 1.
+def costeUnitario(_x: A, _y: A) -> float:
+    return 1
+
+def buscaAEstrella(sucesores: Callable[[A], list[A]],
+                   esFinal: Callable[[A], bool],
+                   inicial: A,
+                   heuristica: Callable[[A], float],
+                   coste: Callable[[A, A], float] = costeUnitario,
+                   clave: Callable[[A], Hashable] = identidad,
+                   estadisticas: Optional[EstadisticasAEstrella] = None
+                   ) -> Optional[list[A]]:
+    if estadisticas is None:
+        estadisticas = EstadisticasAEstrella()
+    contador = count()
+    k0 = clave(inicial)
+    # g[k] es el menor coste conocido hasta el estado de clave k y
+    # padre[k] es la clave de su predecesor en ese camino.
+    g: dict[Hashable, float] = {k0: 0}
+    padre: dict[Hashable, Optional[Hashable]] = {k0: None}
+    estados: dict[Hashable, A] = {k0: inicial}
+    cerrados: set[Hashable] = set()
+    h0 = heuristica(inicial)
+    abiertos: list[tuple[float, float, int, float, A]] = \
+        [(h0, h0, next(contador), 0, inicial)]
+    estadisticas.maximaFrontera = max(estadisticas.maximaFrontera, 1)
+
+    while abiertos:
+        (_, _, _, gx, x) = heappop(abiertos)
+        kx = clave(x)
+        if gx > g[kx]:
+            continue
+        if esFinal(x):
+            camino = []
+            k: Optional[Hashable] = kx
+            while k is not None:
+                camino.append(estados[k])
+                k = padre[k]
+            camino.reverse()
+            return camino
+
+        cerrados.add(kx)
+        estadisticas.expandidos += 1
+        for y in sucesores(x):
+            ky = clave(y)
+            gy = gx + coste(x, y)
+            if ky in g and gy >= g[ky]:
+                continue
+            if ky in cerrados:
+                cerrados.remove(ky)
+                estadisticas.reaperturas += 1
+            g[ky] = gy
+            padre[ky] = kx
+            estados[ky] = y
+            hy = heuristica(y)
+            heappush(abiertos, (gy + hy, hy, next(contador), gy, y))
+        estadisticas.maximaFrontera = max(estadisticas.maximaFrontera,
+                                          len(abiertos))
+
+    return None
+
+# Verificación
+# ============
+
+def test_buscaAEstrella() -> None:
+    est = EstadisticasAEstrella()
+    assert buscaAEstrella(lambda x: [x + 1, 2 * x],
+                          lambda x: x == 10,
+                          1,
+                          lambda x: 0,
+                          estadisticas=est) == [1, 2, 4, 5, 10]
+    assert est.expandidos == 9
+    assert est.reaperturas == 0
+    assert buscaAEstrella(lambda x: [x + 1] if x < 5 else [],
+                          lambda x: x == 10,
+                          1,
+                          lambda x: 0) is None
+    # Grafo con pesos en el que la heurística no es consistente: el
+    # estado 'c' se cierra primero por un camino peor y luego se
+    # reabre.
+    pesos = {('a', 'b'): 1, ('a', 'c'): 4, ('b', 'c'): 1, ('c', 'd'): 1}
+    hs = {'a': 0, 'b': 3, 'c': 0, 'd': 0}
+    est = EstadisticasAEstrella()
+    assert buscaAEstrella(lambda x: [y for (z, y) in pesos if z == x],
+                          lambda x: x == 'd',
+                          'a',
+                          lambda x: hs[x],
+                          lambda x, y: pesos[(x, y)],
+                          estadisticas=est) == ['a', 'b', 'c', 'd']
+    assert est.reaperturas == 1
+    print("Verificado")
+
+# La verificación es
+#    >>> test_buscaAEstrella()
+#    Verificado
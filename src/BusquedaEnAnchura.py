@@ -26,11 +26,34 @@
 #   problema de espacio de estado definido por la función sucesores s,
 #   el objetivo o y estado inicial e obtenidas mediante búsqueda en
 #   anchura.
+#
+# Además, se define la función
+#    buscaAnchuraPerezosa(Callable[[A], list[A]], Callable[[A], bool], A,
+#                         Optional[Callable[[A], Hashable]],
+#                         Optional[Estadisticas]) -> Iterator[A]
+# tal que buscaAnchuraPerezosa(s, o, e, clave, estadisticas) es un
+# generador de las soluciones del problema de espacio de estado definido
+# por la función sucesores s, el objetivo o y estado inicial e
+# obtenidas mediante búsqueda en anchura. La frontera se representa
+# mediante una deque que se modifica en el sitio (sin copiarla en cada
+# paso). Si se da la función clave, no se exploran los estados cuya
+# clave ya ha sido encontrada. Si se da estadisticas, se van anotando
+# en ella el número de nodos expandidos y el tamaño máximo de la
+# frontera. Por ejemplo,
+#    >>> est = Estadisticas()
+#    >>> s = buscaAnchuraPerezosa(lambda x: [x+1, 2*x], lambda x: x > 5, 1,
+#    ...                          lambda x: x, est)
+#    >>> next(s)
+#    6
+#    >>> est
+#    Estadisticas(expandidos=4, maximaFrontera=3)
 # ---------------------------------------------------------------------
 
+from collections import deque
+from dataclasses import dataclass
 from functools import reduce
 from sys import setrecursionlimit
-from typing import Callable, Optional, TypeVar
+from typing import Callable, Hashable, Iterator, Optional, TypeVar
 
 from src.TAD.cola import Cola, esVacia, inserta, primero, resto, vacia
 
@@ -66,3 +89,70 @@ def buscaAnchura1(sucesores: Callable[[A], list[A]],
         c = reduce(lambda x, y: inserta(y, x), es, resto(c))
 
     return None
+
+# Búsqueda perezosa con estados visitados
+# =======================================
+
+# Estadisticas es el tipo de los contadores de una búsqueda: el número
+# de nodos expandidos y el tamaño máximo alcanzado por la frontera.
+@dataclass
+class Estadisticas:
+    expandidos: int = 0
+    maximaFrontera: int = 0
+
+def buscaAnchuraPerezosa(sucesores: Callable[[A], list[A]],
+                         esFinal: Callable[[A], bool],
+                         inicial: A,
+                         clave: Optional[Callable[[A], Hashable]] = None,
+                         estadisticas: Optional[Estadisticas] = None
+                         ) -> Iterator[A]:
+    if estadisticas is None:
+        estadisticas = Estadisticas()
+    frontera: deque[A] = deque([inicial])
+    visitados: set[Hashable] = set()
+    if clave is not None:
+        visitados.add(clave(inicial))
+    estadisticas.maximaFrontera = max(estadisticas.maximaFrontera, 1)
+
+    while frontera:
+        x = frontera.popleft()
+        if esFinal(x):
+            yield x
+            continue
+
+        estadisticas.expandidos += 1
+        for y in sucesores(x):
+            if clave is not None:
+                k = clave(y)
+                if k in visitados:
+                    continue
+                visitados.add(k)
+            frontera.append(y)
+        estadisticas.maximaFrontera = max(estadisticas.maximaFrontera,
+                                          len(frontera))
+
+# Verificación
+# ============
+
+def test_buscaAnchuraPerezosa() -> None:
+    def sucesores(x: int) -> list[int]:
+        return [x + 1, 2 * x]
+
+    def esFinal(x: int) -> bool:
+        return x > 5
+
+    est = Estadisticas()
+    s = buscaAnchuraPerezosa(sucesores, esFinal, 1, lambda x: x, est)
+    assert next(s) == 6
+    assert est == Estadisticas(expandidos=4, maximaFrontera=3)
+    assert list(buscaAnchuraPerezosa(lambda x: [2 * x, 2 * x + 1] if x < 4 else [],
+                                     lambda x: x > 3,
+                                     1)) == \
+        buscaAnchura(lambda x: [2 * x, 2 * x + 1] if x < 4 else [],
+                     lambda x: x > 3,
+                     1)
+    print("Verificado")
+
+# La verificación es
+#    >>> test_buscaAnchuraPerezosa()
+#    Verificado
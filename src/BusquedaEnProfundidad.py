@@ -26,11 +26,34 @@
 #   problema de espacio de estado definido por la función sucesores s,
 #   el objetivo o y estado inicial e obtenidas mediante búsqueda en
 #   profundidad.
+#
+# Además, se define la función
+#    buscaProfundidadPerezosa(Callable[[A], list[A]], Callable[[A], bool], A,
+#                             Optional[Callable[[A], bool]],
+#                             Optional[int]) -> Iterator[A]
+# tal que buscaProfundidadPerezosa(s, o, e, poda, profundidadMaxima) es
+# un generador de las soluciones del problema de espacio de estado
+# definido por la función sucesores s, el objetivo o y estado inicial e
+# obtenidas mediante búsqueda en profundidad, en el mismo orden que
+# buscaProfundidad. La búsqueda es iterativa (no necesita aumentar el
+# límite de recursión) y la pila es una lista de iteradores sobre los
+# sucesores de cada nivel, por lo que la memoria usada es proporcional
+# a la profundidad por el número de sucesores. Si se da poda, se
+# descartan los estados que la verifican y si se da profundidadMaxima
+# no se expanden los estados que estén a esa profundidad. Por ejemplo,
+#    >>> s = buscaProfundidadPerezosa(lambda x: [2*x, 2*x+1], lambda x: x > 5, 1)
+#    >>> [next(s) for _ in range(3)]
+#    [7, 6, 11]
+#    >>> list(buscaProfundidadPerezosa(lambda x: [2*x, 2*x+1], lambda x: x > 5, 1,
+#    ...                               poda=lambda x: x % 3 == 0,
+#    ...                               profundidadMaxima=4))
+#    [11, 10, 8]
 # ---------------------------------------------------------------------
 
 from functools import reduce
+from itertools import islice
 from sys import setrecursionlimit
-from typing import Callable, Optional, TypeVar
+from typing import Callable, Iterator, Optional, TypeVar
 
 from src.TAD.pila import Pila, apila, cima, desapila, esVacia, vacia
 
@@ -66,3 +89,55 @@ def buscaProfundidad1(sucesores: Callable[[A], list[A]],
         p = reduce(lambda x, y: apila(y, x), es, desapila(p))
 
     return None
+
+# Búsqueda perezosa con poda
+# ==========================
+
+def buscaProfundidadPerezosa(sucesores: Callable[[A], list[A]],
+                             esFinal: Callable[[A], bool],
+                             inicial: A,
+                             poda: Optional[Callable[[A], bool]] = None,
+                             profundidadMaxima: Optional[int] = None
+                             ) -> Iterator[A]:
+    # Los sucesores se recorren en orden inverso para que el orden de
+    # las soluciones coincida con el de buscaProfundidad.
+    pila: list[Iterator[A]] = [iter([inicial])]
+
+    while pila:
+        try:
+            x = next(pila[-1])
+        except StopIteration:
+            pila.pop()
+            continue
+        if poda is not None and poda(x):
+            continue
+        if esFinal(x):
+            yield x
+        elif profundidadMaxima is None or len(pila) <= profundidadMaxima:
+            pila.append(reversed(sucesores(x)))
+
+# Verificación
+# ============
+
+def test_buscaProfundidadPerezosa() -> None:
+    def sucesores(x: int) -> list[int]:
+        return [2 * x, 2 * x + 1] if x < 8 else []
+
+    def esFinal(x: int) -> bool:
+        return x > 5
+
+    assert list(buscaProfundidadPerezosa(sucesores, esFinal, 1)) == \
+        buscaProfundidad(sucesores, esFinal, 1)
+    assert list(islice(buscaProfundidadPerezosa(sucesores, esFinal, 1), 3)) == \
+        [7, 6, 11]
+    assert list(buscaProfundidadPerezosa(sucesores, esFinal, 1,
+                                         poda=lambda x: x % 3 == 0,
+                                         profundidadMaxima=4)) == \
+        [11, 10, 8]
+    assert list(buscaProfundidadPerezosa(sucesores, esFinal, 1,
+                                         profundidadMaxima=1)) == []
+    print("Verificado")
+
+# La verificación es
+#    >>> test_buscaProfundidadPerezosa()
+#    Verificado
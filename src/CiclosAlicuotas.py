@@ -0,0 +1,276 @@
+# CiclosAlicuotas.py
+# Búsqueda de números perfectos, amigos y sociables.
+# José A. Alonso Jiménez <https://jaalonso.github.io>
+# Sevilla, 18-octubre-2026
+# ---------------------------------------------------------------------
+
+# ---------------------------------------------------------------------
+# Sea s(x) la suma de los divisores propios de x. La sucesión alícuota
+# de x es x, s(x), s(s(x)), ... Un ciclo alícuota de longitud k es una
+# lista [x(1), ..., x(k)] de números distintos tales que s(x(i)) =
+# x(i+1) y s(x(k)) = x(1). Los ciclos de longitud 1 son los números
+# perfectos, los de longitud 2 son los pares de números amigos y los
+# de longitud mayor son los números sociables.
+#
+# Para buscar los ciclos cuyos elementos son menores o iguales que n
+# se procede en dos fases, dividiendo el intervalo [1, n] en trozos
+# que se pueden procesar en paralelo:
+# + en la primera se calcula, con una criba de divisores sobre cada
+#   trozo, el vector de los valores de s en [0, n], que se guarda en
+#   un fichero proyectado en memoria (para que lo compartan todos los
+#   procesos) y
+# + en la segunda se recorren, para todos los x de cada trozo a la vez,
+#   las sucesiones alícuotas de x, descartando las que bajan de x o
+#   pasan de n; los x cuya sucesión vuelve a x son los menores
+#   elementos de sus ciclos.
+# Los ciclos se generan ordenados por su menor elemento.
+#
+# Definir las funciones
+#    ciclosAlicuotas : (int, int, int, Optional[str]) -> Iterator[list[int]]
+#    paresAmigos     : (int, int) -> Iterator[tuple[int, int]]
+# tales que
+# + ciclosAlicuotas(n, procesos, trozo, fichero) genera los ciclos
+#   alícuotas cuyos elementos son menores o iguales que n, empezando
+#   por su menor elemento. Los trozos tienen trozo elementos y se
+#   procesan con procesos procesos. Si se indica un fichero, en él se
+#   guarda el vector de los valores de s (y, si ya existe y está
+#   completo, se usa sin volver a calcularlo). Por ejemplo,
+#      >>> list(ciclosAlicuotas(20000))
+#      [[6], [28], [220, 284], [496], [1184, 1210], [2620, 2924],
+#       [5020, 5564], [6232, 6368], [8128], [10744, 10856],
+#       [12285, 14595], [12496, 14288, 15472, 14536, 14264],
+#       [17296, 18416]]
+# + paresAmigos(n, procesos) genera los pares de números amigos
+#   menores o iguales que n. Por ejemplo,
+#      >>> list(paresAmigos(10000))
+#      [(220, 284), (1184, 1210), (2620, 2924), (5020, 5564), (6232, 6368)]
+# ---------------------------------------------------------------------
+
+from collections import deque
+from concurrent.futures import Executor, Future, ProcessPoolExecutor
+from math import isqrt
+from os import path, remove
+from tempfile import TemporaryDirectory
+from timeit import Timer, default_timer
+from typing import Any, Callable, Iterator, Optional
+
+import numpy as np
+import numpy.typing as npt
+from hypothesis import given, settings
+from hypothesis import strategies as st
+
+from src.TablasAritmeticas import calculaTabla
+
+# TROZO es el número de elementos de los trozos y LONGITUD la mayor
+# longitud de los ciclos que se buscan (el mayor ciclo conocido tiene
+# 28 elementos).
+TROZO = 2**22
+LONGITUD = 30
+
+# sumasDivisoresPropios(a, b) es el vector de las sumas de los
+# divisores propios de los números de a hasta b (excluido), con a >= 1.
+# Se calcula sumando, para cada d menor o igual que la raíz cuadrada de
+# b-1, d y m/d a cada múltiplo m de d tal que m >= d². Por ejemplo,
+#    >>> sumasDivisoresPropios(1, 13).tolist()
+#    [0, 1, 1, 3, 1, 6, 1, 7, 4, 8, 1, 16]
+#    >>> sumasDivisoresPropios(220, 222).tolist()
+#    [284, 31]
+def sumasDivisoresPropios(a: int, b: int) -> npt.NDArray[np.int64]:
+    r = np.zeros(b - a, dtype=np.int64)
+    for d in range(1, isqrt(b - 1) + 1):
+        m = max(d * d, -(-a // d) * d)
+        if m >= b:
+            continue
+        r[m - a::d] += d + np.arange(m // d, (b - 1) // d + 1)
+        if m == d * d:
+            r[m - a] -= d
+    return r - np.arange(a, b)
+
+# tipoDeSumas(n) es el tipo de los elementos del vector de los valores
+# de s en [0, n]. Como s(x) < 5x para x < 10^9, basta con enteros de 32
+# bits si 5n < 2^31.
+def tipoDeSumas(n: int) -> type:
+    return np.int32 if 5 * n < 2**31 else np.int64
+
+# escribeSumas(f, a, b) escribe en el vector guardado en el fichero f
+# los valores de s de los números de a hasta b (excluido).
+def escribeSumas(f: str, a: int, b: int) -> None:
+    s = np.load(f, mmap_mode='r+')
+    s[a:b] = sumasDivisoresPropios(a, b)
+    s.flush()
+
+# marca(f) es el fichero que indica que el vector guardado en el fichero
+# f está completo. Se crea después de escribir el último trozo, por lo
+# que no existe si se interrumpe el cálculo.
+def marca(f: str) -> str:
+    return f + '.completo'
+
+# sumasCompletas(f, n) se verifica si el fichero f contiene el vector
+# completo de los valores de s en [0, n], con elementos de tipo
+# tipoDeSumas(n).
+def sumasCompletas(f: str, n: int) -> bool:
+    if not (path.exists(f) and path.exists(marca(f))):
+        return False
+    s = np.load(f, mmap_mode='r')
+    return s.shape == (n + 1,) and s.dtype == tipoDeSumas(n)
+
+# ciclosTrozo(f, a, b, longitud) es la lista de los ciclos alícuotas de
+# longitud menor o igual que longitud cuyo menor elemento está entre a y
+# b (excluido), usando el vector de los valores de s guardado en el
+# fichero f.
+def ciclosTrozo(f: str, a: int, b: int, longitud: int) -> list[list[int]]:
+    s = np.load(f, mmap_mode='r')
+    n = len(s) - 1
+    xs = np.arange(a, b, dtype=np.int64)
+    vs = np.asarray(s[a:b], dtype=np.int64)
+    ciclos = []
+    for _ in range(longitud):
+        iguales = vs == xs
+        for x in xs[iguales].tolist():
+            ciclo = [x]
+            while (y := int(s[ciclo[-1]])) != x:
+                ciclo.append(y)
+            ciclos.append(ciclo)
+        vivos = (vs > xs) & (vs <= n)
+        (xs, vs) = (xs[vivos], vs[vivos])
+        if xs.size == 0:
+            break
+        vs = np.asarray(s[vs], dtype=np.int64)
+    return sorted(ciclos)
+
+# enOrden(e, f, argumentos, pendientes) genera los resultados de aplicar
+# f a cada una de las tuplas de argumentos, en el mismo orden. Si e es
+# None se calculan uno a uno y, en caso contrario, se calculan en el
+# ejecutor e sin tener más de pendientes resultados pendientes.
+def enOrden(e: Optional[Executor],
+            f: Callable[..., Any],
+            argumentos: Iterator[tuple[Any, ...]],
+            pendientes: int) -> Iterator[Any]:
+    if e is None:
+        for xs in argumentos:
+            yield f(*xs)
+        return
+    cola: deque[Future[Any]] = deque()
+    for xs in argumentos:
+        cola.append(e.submit(f, *xs))
+        if len(cola) >= pendientes:
+            yield cola.popleft().result()
+    while cola:
+        yield cola.popleft().result()
+
+def ciclosAlicuotas(n: int,
+                    procesos: int = 1,
+                    trozo: int = TROZO,
+                    fichero: Optional[str] = None,
+                    longitud: int = LONGITUD) -> Iterator[list[int]]:
+    with TemporaryDirectory() as d:
+        f = fichero or path.join(d, 'sumas.npy')
+        trozos = [(a, min(n + 1, a + trozo)) for a in range(1, n + 1, trozo)]
+        ejecutor = ProcessPoolExecutor(procesos) if procesos > 1 else None
+        try:
+            if not sumasCompletas(f, n):
+                if path.exists(marca(f)):
+                    remove(marca(f))
+                np.lib.format.open_memmap(f, mode='w+', shape=(n + 1,),
+                                          dtype=tipoDeSumas(n)).flush()
+                for _ in enOrden(ejecutor, escribeSumas,
+                                 ((f, a, b) for (a, b) in trozos),
+                                 2 * procesos):
+                    pass
+                with open(marca(f), 'w', encoding='utf-8') as m:
+                    m.write(f'{n}\n')
+            for ciclos in enOrden(ejecutor, ciclosTrozo,
+                                  ((f, a, b, longitud) for (a, b) in trozos),
+                                  2 * procesos):
+                yield from ciclos
+        finally:
+            if ejecutor is not None:
+                ejecutor.shutdown(cancel_futures=True)
+
+def paresAmigos(n: int, procesos: int = 1) -> Iterator[tuple[int, int]]:
+    return ((x, y) for [x, y] in (c for c in ciclosAlicuotas(n, procesos)
+                                  if len(c) == 2))
+
+# Verificación
+# ============
+
+def test_CiclosAlicuotas() -> None:
+    assert sumasDivisoresPropios(1, 13).tolist() == \
+        [0, 1, 1, 3, 1, 6, 1, 7, 4, 8, 1, 16]
+    assert sumasDivisoresPropios(220, 222).tolist() == [284, 31]
+    r = [[6], [28], [220, 284], [496], [1184, 1210], [2620, 2924],
+         [5020, 5564], [6232, 6368], [8128], [10744, 10856],
+         [12285, 14595], [12496, 14288, 15472, 14536, 14264],
+         [17296, 18416]]
+    assert list(ciclosAlicuotas(20000)) == r
+    assert list(ciclosAlicuotas(20000, procesos=2, trozo=3000)) == r
+    assert list(paresAmigos(10000)) == \
+        [(220, 284), (1184, 1210), (2620, 2924), (5020, 5564), (6232, 6368)]
+    # Los ciclos con algún elemento mayor que n no se incluyen.
+    assert list(paresAmigos(284)) == [(220, 284)]
+    assert list(paresAmigos(283)) == []
+    # Un fichero incompleto (sin la marca o con otro tipo) se recalcula.
+    with TemporaryDirectory() as d:
+        f = path.join(d, 'sumas.npy')
+        np.lib.format.open_memmap(f, mode='w+', shape=(20001,),
+                                  dtype=np.int32).flush()
+        assert not sumasCompletas(f, 20000)
+        assert list(ciclosAlicuotas(20000, fichero=f)) == r
+        assert sumasCompletas(f, 20000)
+        assert list(ciclosAlicuotas(20000, fichero=f)) == r
+        np.save(f, np.zeros(20001, dtype=np.int64))
+        assert not sumasCompletas(f, 20000)
+        assert list(ciclosAlicuotas(20000, fichero=f)) == r
+    print("Verificado")
+
+# La verificación es
+#    >>> test_CiclosAlicuotas()
+#    Verificado
+
+# Comprobación de propiedades
+# ===========================
+
+# La propiedad es que las sumas calculadas por trozos coinciden con las
+# de la tabla de TablasAritmeticas.
+@settings(deadline=None)
+@given(st.integers(min_value=1, max_value=10**5),
+       st.integers(min_value=1, max_value=1000))
+def test_sumasDivisoresPropios(a: int, k: int) -> None:
+    t = calculaTabla(a + k)
+    assert sumasDivisoresPropios(a, a + k).tolist() == \
+        (t.sumaDivisores[a:a + k] - np.arange(a, a + k)).tolist()
+
+# La comprobación es
+#    > poetry run pytest -q CiclosAlicuotas.py
+#    2 passed in 10.75s
+
+# Comparación de eficiencia
+# =========================
+
+def tiempo(e: str) -> None:
+    """Tiempo (en segundos) de evaluar la expresión e."""
+    t = Timer(e, "", default_timer, globals()).timeit(1)
+    print(f"{t:0.2f} segundos")
+
+# La comparación es
+#    >>> from src.Suma_de_numeros_amigos_menores_que_n import amigosMenores3, amigosMenores5
+#    >>> tiempo('amigosMenores3(10**5)')
+#    1.06 segundos
+#    >>> tiempo('list(paresAmigos(10**5))')
+#    0.01 segundos
+#    >>> tiempo('amigosMenores5(10**6)')
+#    1.47 segundos
+#    >>> tiempo('list(paresAmigos(10**6))')
+#    0.08 segundos
+#    >>> tiempo('list(ciclosAlicuotas(10**7))')
+#    0.99 segundos
+#    >>> tiempo('list(ciclosAlicuotas(10**7, procesos=2))')
+#    1.19 segundos
+#    >>> tiempo('list(ciclosAlicuotas(10**8))')
+#    11.99 segundos
+#
+# Los tiempos anteriores se han medido en una máquina con un único
+# núcleo, por lo que el cálculo en paralelo no mejora el tiempo. Hasta
+# 10^8 hay 248 ciclos: 5 números perfectos, 231 pares de números
+# amigos y 12 ciclos de números sociables (uno de longitud 5, uno de
+# longitud 28 y 10 de longitud 4).
@@ -23,6 +23,9 @@ from timeit import Timer, default_timer
 import numpy as np
 import numpy.typing as npt
 
+from src.Binomiales import binomial as binomialPorFactorizacion
+from src.ProgramacionDinamica import Consulta, ascendente, descendente
+
 setrecursionlimit(10**6)
 
 # 1ª definición (por recursión)
@@ -88,6 +91,40 @@ def matrizBinomial3(n: int, k: int) -> npt.NDArray[np.int_]:
 
     return q
 
+# 4ª definición (con el esquema de programación dinámica descendente)
+# ====================================================================
+
+# binomialRec(v, i, j) es el coeficiente binomial i sobre j calculado a
+# partir de los valores v(i-1, _) de la fila anterior del triángulo de
+# Pascal.
+def binomialRec(v: Consulta[int], i: int, j: int) -> int:
+    if j == 0 or i == j:
+        return 1
+    return v(i - 1, j - 1) + v(i - 1, j)
+
+# Se usa la función descendente del módulo ProgramacionDinamica, que
+# sólo calcula las posiciones de las que depende (n, k).
+def binomial4(n: int, k: int) -> int:
+    return descendente(binomialRec, n, k)
+
+# 5ª definición (con el esquema de programación dinámica ascendente)
+# ===================================================================
+
+# Se usa la función ascendente del módulo ProgramacionDinamica,
+# guardando sólo dos filas de la matriz.
+def binomial5(n: int, k: int) -> int:
+    return ascendente(binomialRec, n + 1,
+                      lambda i: range(min(i, k) + 1))[-1][k]
+
+# 6ª definición (por factorización)
+# =================================
+
+# Se usa la función binomial del módulo Binomiales, que calcula la
+# factorización del coeficiente con la fórmula de Legendre y multiplica
+# las potencias de los primos con un árbol de productos.
+def binomial6(n: int, k: int) -> int:
+    return binomialPorFactorizacion(n, k)
+
 # Comparación de eficiencia
 # =========================
 
@@ -108,6 +145,32 @@ def tiempo(e: str) -> None:
 # 0.18 segundos
 # >>> tiempo('binomial3(50000, 12)')
 # 0.26 segundos
+#
+# Con el esquema de programación dinámica (la memoria es el pico de la
+# reservada durante la evaluación, medido con tracemalloc en un proceso
+# nuevo para cada expresión, salvo en las marcadas con (*), cuya
+# recursión profunda hace que tracemalloc sea demasiado lento y en las
+# que se mide con getrusage el aumento del máximo de memoria del proceso
+# durante la evaluación):
+#    >>> tiempo('binomial2(50000, 12)')   # 32 MiB
+#    0.25 segundos
+#    >>> tiempo('binomial3(50000, 12)')   # 28 MiB
+#    0.47 segundos
+#    >>> tiempo('binomial4(50000, 12)')   # 152 MiB (*)
+#    1.30 segundos
+#    >>> tiempo('binomial5(50000, 12)')   # 12 KiB
+#    0.33 segundos
+#    >>> tiempo('binomial6(50000, 12)')   # 12 KiB
+#    0.00 segundos
+#
+#    >>> tiempo('binomial2(5000, 2500)')
+#    6.55 segundos
+#    >>> tiempo('binomial5(5000, 2500)')
+#    5.28 segundos
+#    >>> tiempo('binomial6(5000, 2500)')
+#    0.00 segundos
+#    >>> tiempo('binomial6(10**6, 5 * 10**5)')
+#    0.18 segundos
 
 # Verificación
 # ============
@@ -122,6 +185,15 @@ def test_binomial() -> None:
     assert binomial3(6, 3) == 20
     assert binomial3(5, 2) == 10
     assert binomial3(5, 3) == 10
+    assert binomial4(6, 3) == 20
+    assert binomial4(5, 2) == 10
+    assert binomial4(5, 3) == 10
+    assert binomial5(6, 3) == 20
+    assert binomial5(5, 2) == 10
+    assert binomial5(5, 3) == 10
+    assert binomial6(6, 3) == 20
+    assert binomial6(5, 2) == 10
+    assert binomial6(5, 3) == 10
     print("Verificado")
 
 # La verificación es
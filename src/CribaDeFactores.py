@@ -0,0 +1,289 @@
+# CribaDeFactores.py
+# Factorización mediante la tabla de los menores factores primos.
+# José A. Alonso Jiménez <https://jaalonso.github.io>
+# Sevilla, 18-octubre-2026
+# ---------------------------------------------------------------------
+
+# ---------------------------------------------------------------------
+# Si se conoce el menor factor primo p de cada número menor que un
+# límite, la factorización de un número n menor que el límite se
+# obtiene dividiendo n por p, el cociente por su menor factor primo y
+# así sucesivamente, con a lo sumo log2(n) consultas a la tabla.
+#
+# La tabla se calcula con una criba sobre un vector de NumPy, se puede
+# guardar en un fichero .npy y cargarse de él sin leerlo entero (con
+# np.load y mmap_mode='r'), de forma que varios procesos comparten la
+# misma copia en memoria. Los números mayores o iguales que el límite
+# se descomponen con el método rho de Pollard hasta que los factores
+# son menores que el límite o primos.
+#
+# Se define la clase CribaDeFactores con los siguientes métodos:
+#    + limite() es el límite de la tabla.
+#    + factoriza(n) es el diccionario cuyas claves son los factores
+#      primos de n y cuyos valores son sus exponentes (como factorint).
+#    + factorizaLote(ns) es la lista de las factorizaciones de los
+#      elementos de ns.
+#    + divisores(n) es la lista ordenada de los divisores de n.
+#    + guarda(f) guarda la tabla en el fichero f.
+# y la función carga(f) que devuelve la criba guardada en el fichero
+# f. Por ejemplo,
+#    >>> c = CribaDeFactores(100)
+#    >>> c.factoriza(60)
+#    {2: 2, 3: 1, 5: 1}
+#    >>> c.factoriza(10**12 + 39)
+#    {1000000000039: 1}
+#    >>> c.factoriza(2**10 * 1000003**2)
+#    {2: 10, 1000003: 2}
+#    >>> c.factorizaLote([12, 97, 1])
+#    [{2: 2, 3: 1}, {97: 1}, {}]
+#    >>> c.divisores(60)
+#    [1, 2, 3, 4, 5, 6, 10, 12, 15, 20, 30, 60]
+#
+# Además, se definen las funciones factoriza, factorizaLote y
+# divisores que usan una criba con límite LIMITE (que se calcula la
+# primera vez que se usa). Por ejemplo,
+#    >>> factoriza(360)
+#    {2: 3, 3: 2, 5: 1}
+#    >>> divisores(28)
+#    [1, 2, 4, 7, 14, 28]
+# ---------------------------------------------------------------------
+
+from __future__ import annotations
+
+from collections import Counter
+from itertools import count
+from math import gcd
+from os import PathLike
+from tempfile import TemporaryDirectory
+from timeit import Timer, default_timer
+from typing import Iterable, Optional, Union
+
+import numpy as np
+import numpy.typing as npt
+from hypothesis import given
+from hypothesis import strategies as st
+from sympy import divisors as divisoresSympy
+from sympy import factorint, isprime
+
+from src.TablasAritmeticas import menoresFactores
+
+# LIMITE es el límite de la criba que usan las funciones factoriza,
+# factorizaLote y divisores.
+LIMITE = 10**7
+
+# tablaDeMenoresFactores(n) es el vector t tal que, para 2 <= x < n,
+# t[x] es el menor factor primo de x (y t[0] = 0 y t[1] = 1). Es el
+# vector menorFactor de TablasAritmeticas hasta n-1, con elementos de
+# 32 bits para que ocupe la mitad. Por ejemplo,
+#    >>> tablaDeMenoresFactores(13).tolist()
+#    [0, 1, 2, 3, 2, 5, 2, 7, 2, 3, 2, 11, 2]
+def tablaDeMenoresFactores(n: int) -> npt.NDArray[np.int32]:
+    return menoresFactores(max(n, 2) - 1, np.int32)
+
+# pollardRho(n) es un divisor propio de n, que se supone compuesto,
+# calculado con el método rho de Pollard. Por ejemplo,
+#    pollardRho(8051)  ==  97
+def pollardRho(n: int) -> int:
+    if n % 2 == 0:
+        return 2
+    for c in count(1):
+        x = y = 2
+        d = 1
+        while d == 1:
+            x = (x * x + c) % n
+            y = (y * y + c) % n
+            y = (y * y + c) % n
+            d = gcd(x - y, n)
+        if d != n:
+            return d
+    raise AssertionError('inalcanzable')
+
+Tabla = Union[npt.NDArray[np.int32], np.memmap]
+
+class CribaDeFactores:
+    def __init__(self, limite: int = LIMITE,
+                 tabla: Optional[Tabla] = None) -> None:
+        self._tabla = tablaDeMenoresFactores(limite) if tabla is None \
+            else tabla
+
+    def __repr__(self) -> str:
+        return f"CribaDeFactores({self.limite()})"
+
+    def limite(self) -> int:
+        """
+        Devuelve el límite de la tabla (los números menores que él se
+        factorizan con la tabla).
+        """
+        return len(self._tabla)
+
+    def _factorizaConTabla(self, n: int, r: Counter[int]) -> None:
+        """
+        Añade a r los factores primos de n (que es menor que el límite).
+        """
+        tabla = self._tabla
+        while n > 1:
+            p = int(tabla[n])
+            r[p] += 1
+            n //= p
+
+    def factoriza(self, n: int) -> dict[int, int]:
+        """
+        Devuelve el diccionario de los factores primos de n (ordenados)
+        con sus exponentes.
+        """
+        if n < 1:
+            raise ValueError(f'no se puede factorizar {n}')
+        r: Counter[int] = Counter()
+        pendientes = [n]
+        while pendientes:
+            m = pendientes.pop()
+            if m < self.limite():
+                self._factorizaConTabla(m, r)
+            elif isprime(m):
+                r[m] += 1
+            else:
+                d = pollardRho(m)
+                pendientes.extend([d, m // d])
+        return dict(sorted(r.items()))
+
+    def factorizaLote(self, ns: Iterable[int]) -> list[dict[int, int]]:
+        """
+        Devuelve la lista de las factorizaciones de los elementos de ns.
+        Los menores que el límite se factorizan a la vez con NumPy,
+        aplicando en cada paso la tabla a todos los cocientes mayores
+        que 1.
+        """
+        ns = list(ns)
+        if any(n < 1 for n in ns):
+            raise ValueError('sólo se pueden factorizar números positivos')
+        rs: list[dict[int, int]] = [{} for _ in ns]
+        grandes = [i for (i, n) in enumerate(ns) if n >= self.limite()]
+        for i in grandes:
+            rs[i] = self.factoriza(ns[i])
+        cocientes = np.array([n if n < self.limite() else 1 for n in ns],
+                             dtype=np.int64)
+        indices = np.flatnonzero(cocientes > 1)
+        cocientes = cocientes[indices]
+        # Los factores de cada número se obtienen de menor a mayor.
+        while indices.size:
+            ps = self._tabla[cocientes]
+            for (i, p) in zip(indices.tolist(), ps.tolist()):
+                r = rs[i]
+                r[p] = r.get(p, 0) + 1
+            cocientes //= ps
+            pendientes = cocientes > 1
+            indices = indices[pendientes]
+            cocientes = cocientes[pendientes]
+        return rs
+
+    def divisores(self, n: int) -> list[int]:
+        """
+        Devuelve la lista ordenada de los divisores de n.
+        """
+        ds = [1]
+        for (p, e) in self.factoriza(n).items():
+            ds = [d * p**k for d in ds for k in range(e + 1)]
+        return sorted(ds)
+
+    def guarda(self, f: Union[str, PathLike[str]]) -> None:
+        """
+        Guarda la tabla en el fichero f (en el formato .npy de NumPy).
+        """
+        np.save(f, np.asarray(self._tabla))
+
+def carga(f: Union[str, PathLike[str]]) -> CribaDeFactores:
+    """
+    Devuelve la criba guardada en el fichero f, proyectándolo en
+    memoria en lugar de leerlo.
+    """
+    return CribaDeFactores(tabla=np.load(f, mmap_mode='r'))
+
+# _cribas es la lista cuyo único elemento es la criba que usan las
+# funciones siguientes (o la lista vacía si aún no se ha calculado).
+_cribas: list[CribaDeFactores] = []
+
+def criba() -> CribaDeFactores:
+    if not _cribas:
+        _cribas.append(CribaDeFactores(LIMITE))
+    return _cribas[0]
+
+def factoriza(n: int) -> dict[int, int]:
+    return criba().factoriza(n)
+
+def factorizaLote(ns: Iterable[int]) -> list[dict[int, int]]:
+    return criba().factorizaLote(ns)
+
+def divisores(n: int) -> list[int]:
+    return criba().divisores(n)
+
+# Verificación
+# ============
+
+def test_CribaDeFactores() -> None:
+    c = CribaDeFactores(100)
+    assert c.factoriza(60) == {2: 2, 3: 1, 5: 1}
+    assert c.factoriza(1) == {}
+    assert c.factoriza(10**12 + 39) == {1000000000039: 1}
+    assert c.factoriza(2**10 * 1000003**2) == {2: 10, 1000003: 2}
+    assert c.factorizaLote([12, 97, 1]) == [{2: 2, 3: 1}, {97: 1}, {}]
+    assert c.factorizaLote([10**4, 99]) == [{2: 4, 5: 4}, {3: 2, 11: 1}]
+    assert c.divisores(60) == [1, 2, 3, 4, 5, 6, 10, 12, 15, 20, 30, 60]
+    assert tablaDeMenoresFactores(13).tolist() == \
+        [0, 1, 2, 3, 2, 5, 2, 7, 2, 3, 2, 11, 2]
+    assert pollardRho(8051) == 97
+    assert factoriza(360) == {2: 3, 3: 2, 5: 1}
+    assert divisores(28) == [1, 2, 4, 7, 14, 28]
+    with TemporaryDirectory() as d:
+        f = f'{d}/criba.npy'
+        c.guarda(f)
+        c2 = carga(f)
+        assert c2.limite() == 100
+        assert c2.factorizaLote(range(1, 200)) == \
+            c.factorizaLote(range(1, 200))
+    print("Verificado")
+
+# La verificación es
+#    >>> test_CribaDeFactores()
+#    Verificado
+
+# Comprobación de propiedades
+# ===========================
+
+# La propiedad es
+@given(st.integers(min_value=1, max_value=10**15),
+       st.integers(min_value=2, max_value=1000))
+def test_factoriza(n: int, k: int) -> None:
+    c = CribaDeFactores(k)
+    r = c.factoriza(n)
+    assert r == factorint(n)
+    assert c.factorizaLote([n, n % k + 1]) == [r, factorint(n % k + 1)]
+    if n < 10**6:
+        assert c.divisores(n) == divisoresSympy(n)
+
+# La comprobación es
+#    > poetry run pytest -q CribaDeFactores.py
+#    2 passed in 11.17s
+
+# Comparación de eficiencia
+# =========================
+
+def tiempo(e: str) -> None:
+    """Tiempo (en segundos) de evaluar la expresión e."""
+    t = Timer(e, "", default_timer, globals()).timeit(1)
+    print(f"{t:0.2f} segundos")
+
+# La comparación es
+#    >>> tiempo('criba()')
+#    0.26 segundos
+#    >>> tiempo('[factorint(n) for n in range(1, 10**6 + 1)]')
+#    13.80 segundos
+#    >>> tiempo('[factoriza(n) for n in range(1, 10**6 + 1)]')
+#    6.31 segundos
+#    >>> tiempo('factorizaLote(range(1, 10**6 + 1))')
+#    1.96 segundos
+#
+# Para números mayores que el límite de la tabla:
+#    >>> tiempo('[factorint(n) for n in range(10**12, 10**12 + 10**4)]')
+#    3.93 segundos
+#    >>> tiempo('[factoriza(n) for n in range(10**12, 10**12 + 10**4)]')
+#    1.13 segundos
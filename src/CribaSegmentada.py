@@ -0,0 +1,218 @@
+# CribaSegmentada.py
+# Criba de Eratóstenes segmentada.
+# José A. Alonso Jiménez <https://jaalonso.github.io>
+# Sevilla, 18-octubre-2026
+# ---------------------------------------------------------------------
+
+# ---------------------------------------------------------------------
+# La criba de Eratóstenes segmentada calcula los primos por bloques
+# (o ventanas) de números consecutivos. En cada ventana sólo se
+# representan los impares (un byte por cada uno en un bytearray) y se
+# tachan los múltiplos de los primos menores o iguales que la raíz
+# cuadrada del final de la ventana, asignando ceros a rebanadas del
+# bytearray (lo que se hace en C). Como la ventana cabe en la caché L2,
+# el coste es próximo al de la criba completa, pero la memoria es
+# constante y no hay que fijar de antemano una cota de los primos.
+#
+# Definir las funciones
+#    primos      : (int, int) -> Iterator[int]
+#    primosHasta : (int, int) -> list[int]
+#    pi          : (int, int) -> int
+# tales que
+# + primos(inicio, ventana) genera los primos mayores o iguales que
+#   inicio (por defecto, 2) usando ventanas de ventana impares (por
+#   defecto, VENTANA). Por ejemplo,
+#      >>> list(islice(primos(), 10))
+#      [2, 3, 5, 7, 11, 13, 17, 19, 23, 29]
+#      >>> list(islice(primos(10**12), 3))
+#      [1000000000039, 1000000000061, 1000000000063]
+# + primosHasta(n, ventana) es la lista de los primos menores o iguales
+#   que n. Por ejemplo,
+#      >>> primosHasta(30)
+#      [2, 3, 5, 7, 11, 13, 17, 19, 23, 29]
+# + pi(n, ventana) es el número de primos menores o iguales que n. Por
+#   ejemplo,
+#      >>> pi(30)
+#      10
+#      >>> pi(10**9)
+#      50847534
+# ---------------------------------------------------------------------
+
+from itertools import chain, compress, islice
+from math import isqrt
+from timeit import Timer, default_timer
+from typing import Iterator, Optional
+
+from hypothesis import given, settings
+from hypothesis import strategies as st
+from sympy import primepi, primerange
+
+# VENTANA es el número de impares de cada ventana. Con un byte por
+# impar, ocupa 256 KiB, que es el tamaño típico de la caché L2.
+VENTANA = 2**18
+
+# INICIAL es el número de impares de la primera ventana.
+INICIAL = 2**10
+
+# primosImparesHasta(n) es la lista de los primos impares menores o
+# iguales que n, calculada con la criba de Eratóstenes (no segmentada)
+# sobre los impares. Por ejemplo,
+#    >>> primosImparesHasta(30)
+#    [3, 5, 7, 11, 13, 17, 19, 23, 29]
+def primosImparesHasta(n: int) -> list[int]:
+    if n < 3:
+        return []
+    # criba[i] indica si 2*i+1 es primo.
+    m = (n + 1) // 2
+    criba = bytearray([1]) * m
+    criba[0] = 0
+    for i in range(1, (isqrt(n) + 1) // 2):
+        if criba[i]:
+            p = 2 * i + 1
+            j = p * p // 2
+            criba[j::p] = bytes(len(range(j, m, p)))
+    return list(compress(range(1, n + 1, 2), criba))
+
+# ventanas(inicio, fin, ventana) genera los pares (a, v) tales que v es
+# la criba de los impares a, a+2, ..., a+2*(len(v)-1) (es decir, v[i]
+# es 1 si a+2*i es primo y 0 en caso contrario). Las ventanas recorren
+# los impares desde inicio (mayores que 1) hasta fin (excluido), o
+# indefinidamente si fin es None. Las primeras ventanas son menores
+# (empiezan con INICIAL impares y se van duplicando hasta llegar a
+# ventana) para que calcular los primeros primos sea rápido. Por
+# ejemplo,
+#    >>> [(a, list(v)) for (a, v) in ventanas(3, 20, 4)]
+#    [(3, [1, 1, 1, 0]), (11, [1, 1, 0, 1]), (19, [1])]
+def ventanas(inicio: int,
+             fin: Optional[int] = None,
+             ventana: int = VENTANA) -> Iterator[tuple[int, bytearray]]:
+    a = max(3, inicio | 1)
+    k = min(INICIAL, ventana)
+    base: list[int] = []
+    cotaBase = 0
+    while fin is None or a < fin:
+        b = a + 2 * k
+        k = min(2 * k, ventana)
+        if fin is not None:
+            b = min(b, fin)
+        n = (b - a + 1) // 2
+        r = isqrt(b - 1)
+        if r > cotaBase:
+            cotaBase = max(r, 2 * cotaBase)
+            base = primosImparesHasta(cotaBase)
+        v = bytearray([1]) * n
+        for p in base:
+            pp = p * p
+            if pp >= b:
+                break
+            # m es el menor múltiplo impar de p que es mayor o igual
+            # que a y que p².
+            m = max(pp, (a + p - 1) // p * p)
+            if m % 2 == 0:
+                m += p
+            i = (m - a) // 2
+            if i < n:
+                v[i::p] = bytes((n - 1 - i) // p + 1)
+        yield (a, v)
+        a = a + 2 * n
+
+def primos(inicio: int = 2, ventana: int = VENTANA) -> Iterator[int]:
+    impares = chain.from_iterable(compress(range(a, a + 2 * len(v), 2), v)
+                                  for (a, v) in ventanas(inicio, None, ventana))
+    if inicio <= 2:
+        return chain([2], impares)
+    return impares
+
+def primosHasta(n: int, ventana: int = VENTANA) -> list[int]:
+    if n < 2:
+        return []
+    r = [2]
+    for (a, v) in ventanas(3, n + 1, ventana):
+        r.extend(compress(range(a, a + 2 * len(v), 2), v))
+    return r
+
+def pi(n: int, ventana: int = VENTANA) -> int:
+    if n < 2:
+        return 0
+    return 1 + sum(v.count(1) for (_, v) in ventanas(3, n + 1, ventana))
+
+# Verificación
+# ============
+
+def test_CribaSegmentada() -> None:
+    assert list(islice(primos(), 10)) == [2, 3, 5, 7, 11, 13, 17, 19, 23, 29]
+    assert list(islice(primos(10**12), 3)) == \
+        [1000000000039, 1000000000061, 1000000000063]
+    assert primosHasta(30) == [2, 3, 5, 7, 11, 13, 17, 19, 23, 29]
+    assert primosHasta(1) == []
+    assert pi(30) == 10
+    assert pi(10**6) == 78498
+    assert [(a, list(v)) for (a, v) in ventanas(3, 20, 4)] == \
+        [(3, [1, 1, 1, 0]), (11, [1, 1, 0, 1]), (19, [1])]
+    # El resultado no depende del tamaño de la ventana.
+    for k in [1, 2, 3, 7, 100]:
+        assert primosHasta(10**4, k) == primosHasta(10**4)
+        assert list(islice(primos(1000, k), 50)) == \
+            list(islice(primos(1000), 50))
+    print("Verificado")
+
+# La verificación es
+#    >>> test_CribaSegmentada()
+#    Verificado
+
+# Comprobación de propiedades
+# ===========================
+
+# La propiedad es
+@settings(deadline=None)
+@given(st.integers(min_value=0, max_value=3*10**4),
+       st.integers(min_value=8, max_value=1000))
+def test_primos(n: int, k: int) -> None:
+    ps = primosHasta(n, k)
+    assert ps == list(primerange(n + 1))
+    assert pi(n, k) == primepi(n)
+    assert list(islice(primos(n + 1, k), 5)) == \
+        [x for x in islice(primos(), len(ps), len(ps) + 5)]
+
+# La comprobación es
+#    > poetry run pytest -q CribaSegmentada.py
+#    2 passed in 11.23s
+
+# Comparación de eficiencia
+# =========================
+
+def tiempo(e: str) -> None:
+    """Tiempo (en segundos) de evaluar la expresión e."""
+    t = Timer(e, "", default_timer, globals()).timeit(1)
+    print(f"{t:0.2f} segundos")
+
+# La comparación es
+#    >>> from sympy import isprime
+#    >>> from itertools import count
+#    >>> def primosIsprime(): return (n for n in count() if isprime(n))
+#    >>> tiempo('sum(islice(primosIsprime(), 10**6))')
+#    29.02 segundos
+#    >>> tiempo('sum(islice(primos(), 10**6))')
+#    0.33 segundos
+#    >>> tiempo('sum(islice(primos(), 10**7))')
+#    3.73 segundos
+#    >>> tiempo('len(primosHasta(10**8))')
+#    2.25 segundos
+#    >>> tiempo('pi(10**9)')
+#    8.52 segundos
+#
+# Influencia del tamaño de la ventana:
+#    >>> tiempo('pi(10**9, 2**12)')
+#    279.85 segundos
+#    >>> tiempo('pi(10**9, 2**15)')
+#    43.30 segundos
+#    >>> tiempo('pi(10**9, 2**18)')
+#    7.68 segundos
+#    >>> tiempo('pi(10**9, 2**21)')
+#    3.97 segundos
+#    >>> tiempo('pi(10**9, 2**24)')
+#    4.30 segundos
+#
+# Con ventanas pequeñas domina el bucle (en Python) sobre los primos
+# base de cada ventana. A partir de 2^18 la mejora es pequeña y la
+# memoria crece con la ventana, por lo que ése es el valor por defecto.
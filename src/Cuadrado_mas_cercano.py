@@ -23,6 +23,8 @@ from timeit import Timer, default_timer
 from hypothesis import given
 from hypothesis import strategies as st
 
+from src.PotenciasPerfectas import raizEntera
+
 setrecursionlimit(10**6)
 
 # 1ª solución
@@ -101,12 +103,25 @@ def cuadradoCercano4(n: int) -> int:
 #    >>> cuadradoCercano3(10**46)
 #    10000000000000000000000000000000000000000000000
 
+# 5ª solución
+# ===========
+
+# Con la función raizEntera de PotenciasPerfectas.
+def cuadradoCercano5(n: int) -> int:
+    a = raizEntera(n)
+    b = a**2
+    c = (a+1)**2
+    if n - b < c - n:
+        return b
+    return c
+
 # Verificación
 # ============
 
 def test_cuadradoCercano() -> None:
     for cuadradoCercano in [cuadradoCercano1, cuadradoCercano2,
-                            cuadradoCercano3, cuadradoCercano4]:
+                            cuadradoCercano3, cuadradoCercano4,
+                            cuadradoCercano5]:
         assert cuadradoCercano(2) == 1
         assert cuadradoCercano(6) == 4
         assert cuadradoCercano(8) == 9
@@ -126,6 +141,7 @@ def test_cuadradoCercano_equiv(x: int) -> None:
     assert cuadradoCercano2(x) == r
     assert cuadradoCercano3(x) == r
     assert cuadradoCercano4(x) == r
+    assert cuadradoCercano5(x) == r
 
 # La comprobación es
 #    >>> test_cuadradoCercano_equiv()
@@ -146,8 +162,12 @@ def tiempo(e: str) -> None:
 #    0.00 segundos
 #    >>> tiempo('cuadradoCercano3(10**14)')
 #    0.00 segundos
+#    >>> tiempo('cuadradoCercano5(10**14)')
+#    0.00 segundos
 #
 #    >>> tiempo('cuadradoCercano2(10**6000)')
 #    1.21 segundos
 #    >>> tiempo('cuadradoCercano3(10**6000)')
 #    2.08 segundos
+#    >>> tiempo('cuadradoCercano5(10**6000)')
+#    0.00 segundos
@@ -46,15 +46,32 @@
 #    720
 #    >>> len(calendario(5))
 #    0
+#
+# Además, definir la función
+#    primerCalendario : (int) -> Optional[Calendario]
+# tal que primerCalendario(n) es la primera solución del problema del
+# calendario con n participantes (sin calcular las restantes), si la
+# tiene. Por ejemplo,
+#    >>> primerCalendario(6)
+#    array([[6, 5, 4, 3, 2],
+#           [5, 4, 3, 6, 1],
+#           [4, 6, 2, 1, 5],
+#           [3, 2, 1, 5, 6],
+#           [2, 1, 6, 4, 3],
+#           [1, 3, 5, 2, 4]])
+#    >>> primerCalendario(5) is None
+#    True
 # ---------------------------------------------------------------------
 
 from copy import deepcopy
+from timeit import Timer, default_timer
 from typing import Optional
 
 import numpy as np
 import numpy.typing as npt
 
-from src.BusquedaEnProfundidad import buscaProfundidad
+from src.BusquedaEnProfundidad import (buscaProfundidad,
+                                       buscaProfundidadPerezosa)
 
 Calendario = npt.NDArray[np.int_]
 
@@ -146,6 +163,10 @@ def esFinal(c: Calendario) -> bool:
 def calendario(n: int) -> list[Calendario]:
     return buscaProfundidad(sucesores, esFinal, inicial(n))
 
+def primerCalendario(n: int) -> Optional[Calendario]:
+    return next(buscaProfundidadPerezosa(sucesores, esFinal, inicial(n)),
+                None)
+
 # Verificación
 # ============
 
@@ -162,4 +183,28 @@ def test_calendario() -> None:
          [1, 3, 5, 2, 4]]
     assert len(calendario(6)) == 720
     assert len(calendario(5)) == 0
+    c = primerCalendario(6)
+    assert c is not None
+    assert filas(c) == filas(calendario(6)[0])
+    assert primerCalendario(5) is None
     print("Verificado")
+
+# La verificación es
+#    >>> test_calendario()
+#    Verificado
+
+# Comparación de eficiencia
+# =========================
+
+def tiempo(e: str) -> None:
+    """Tiempo (en segundos) de evaluar la expresión e."""
+    t = Timer(e, "", default_timer, globals()).timeit(1)
+    print(f"{t:0.2f} segundos")
+
+# La comparación es
+#    >>> tiempo('calendario(6)[0]')
+#    1.75 segundos
+#    >>> tiempo('primerCalendario(6)')
+#    0.00 segundos
+#    >>> tiempo('primerCalendario(10)')
+#    0.01 segundos
@@ -24,7 +24,9 @@
 #    []
 # ---------------------------------------------------------------------
 
-from src.BusquedaEnProfundidad import buscaProfundidad
+from typing import Optional
+
+from src.BusquedaEnProfundidad import buscaProfundidadPerezosa
 
 # Las fichas son pares de números enteros.
 Ficha  = tuple[int, int]
@@ -82,11 +84,23 @@ def sucesores(e: Estado) -> list[Estado]:
 #    >>> soluciones([(1,2),(2,3),(1,4)])
 #    [([], [(3, 2), (2, 1), (1, 4)]), ([], [(4, 1), (1, 2), (2, 3)])]
 def soluciones(p: Problema) -> list[Estado]:
-    return buscaProfundidad(sucesores, esFinal, inicial(p))
+    return list(buscaProfundidadPerezosa(sucesores, esFinal, inicial(p)))
 
 def domino(p: Problema) -> list[list[Ficha]]:
     return [s[1] for s in soluciones(p)]
 
+# primeraSolucion(p) es la primera solución del problema p, si la
+# tiene, calculada sin buscar las restantes. Por ejemplo,
+#    >>> primeraSolucion([(1,2),(2,3),(1,4)])
+#    [(3, 2), (2, 1), (1, 4)]
+#    >>> primeraSolucion([(1,2),(2,3),(5,4)])
+#    None
+def primeraSolucion(p: Problema) -> Optional[list[Ficha]]:
+    s = next(buscaProfundidadPerezosa(sucesores, esFinal, inicial(p)), None)
+    if s is None:
+        return None
+    return s[1]
+
 # # Verificación
 # # ============
 
@@ -99,6 +113,9 @@ def test_domino() -> None:
         [[(4, 3), (3, 2), (2, 1)], [(1, 2), (2, 3), (3, 4)]]
     assert domino([(1,2),(2,3),(5,4)]) == \
         []
+    assert primeraSolucion([(1,2),(2,3),(1,4)]) == \
+        [(3, 2), (2, 1), (1, 4)]
+    assert primeraSolucion([(1,2),(2,3),(5,4)]) is None
     print("Verificado")
 
 # La verificación es
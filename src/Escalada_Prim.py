@@ -64,11 +64,16 @@
 #    prim(g4) == [((5,7),9),((5,4),5),((5,3),1),((6,5),3),((1,6),6),((1,2),5)]
 # ---------------------------------------------------------------------
 
+from heapq import heappop, heappush
+from timeit import Timer, default_timer
 from typing import Optional
 
+from hypothesis import given
+
 from src.BusquedaEnEscalada import buscaEscalada
-from src.TAD.Grafo import (Grafo, Orientacion, Peso, Vertice, aristaEn,
-                           creaGrafo, nodos, peso)
+from src.TAD.Grafo import (Grafo, Orientacion, Peso, Vertice, adyacentes,
+                           aristaEn, creaGrafo, nodos, peso)
+from src.TAD.GrafoGenerador import gen_grafoConexoPonderado
 
 g1 = creaGrafo (Orientacion.ND,
                 (1,5),
@@ -132,22 +137,111 @@ def sucesores(g: Grafo, e: Estado) -> list[Estado]:
              [((x,y),peso(x, y, g))] + aem)
             for x in t for y in r if aristaEn(g, (x, y))]
 
-def prim(g: Grafo) -> Optional[list[Arista]]:
+# 1ª solución
+# ===========
+
+def prim1(g: Grafo) -> Optional[list[Arista]]:
     r = buscaEscalada(lambda e: sucesores(g, e), esFinal, inicial(g))
     if r is None:
         return None
     return r[3]
 
+# 2ª solución
+# ===========
+
+# En la solución anterior cada paso de la escalada genera todos los
+# sucesores (uno por cada arista entre el árbol y el resto de los
+# vértices), copiando las listas de nodos y del árbol en cada uno. En
+# esta, el paso de la escalada se hace con un montículo de los
+# candidatos (p, y, x), correspondientes a las aristas ((x, y), p) con x
+# en el árbol, al que se añaden las aristas de cada vértice cuando entra
+# en el árbol y del que se descartan (al extraerlos) los candidatos
+# cuyo vértice y ya está en el árbol. El mínimo del montículo es el
+# sucesor que elige buscaEscalada (el de menor peso y, en caso de
+# empate, el de menor vértice y y luego menor x), por lo que se obtiene
+# el mismo árbol.
+def prim2(g: Grafo) -> Optional[list[Arista]]:
+    n, *ns = nodos(g)
+    enArbol = {n}
+    monticulo = [(peso(n, y, g), y, n) for y in adyacentes(g, n)]
+    monticulo.sort()
+    aem: list[Arista] = []
+    while len(enArbol) <= len(ns):
+        if not monticulo:
+            return None
+        (p, y, x) = heappop(monticulo)
+        if y in enArbol:
+            continue
+        enArbol.add(y)
+        aem.append(((x, y), p))
+        for z in adyacentes(g, y):
+            if z not in enArbol:
+                heappush(monticulo, (peso(y, z, g), z, y))
+    aem.reverse()
+    return aem
+
+def prim(g: Grafo) -> Optional[list[Arista]]:
+    return prim2(g)
+
 # Verificación
 # ============
 
 def test_prim() -> None:
-    assert prim(g1) == [((2,4),55),((1,3),34),((2,5),32),((1,2),12)]
-    assert prim(g2) == [((2,5),32),((2,4),12),((1,2),13),((1,3),11)]
-    assert prim(g3) == [((5,7),9),((2,3),7),((5,4),5),((6,5),3),((1,6),6),((1,2),5)]
-    assert prim(g4) == [((5,7),9),((5,4),5),((5,3),1),((6,5),3),((1,6),6),((1,2),5)]
+    for prim_ in [prim1, prim2]:
+        assert prim_(g1) == [((2,4),55),((1,3),34),((2,5),32),((1,2),12)]
+        assert prim_(g2) == [((2,5),32),((2,4),12),((1,2),13),((1,3),11)]
+        assert prim_(g3) == [((5,7),9),((2,3),7),((5,4),5),((6,5),3),((1,6),6),((1,2),5)]
+        assert prim_(g4) == [((5,7),9),((5,4),5),((5,3),1),((6,5),3),((1,6),6),((1,2),5)]
     print("Verificado")
 
 # La verificación es
 #    >>> test_prim()
 #    Verificado
+
+# Comprobación de equivalencia
+# ============================
+
+# La propiedad es
+@given(gen_grafoConexoPonderado())
+def test_prim_equiv(g: Grafo) -> None:
+    assert prim1(g) == prim2(g)
+
+# La comprobación es
+#    > poetry run pytest -q Escalada_Prim.py
+#    2 passed in 2.39s
+
+# Comparación de eficiencia
+# =========================
+
+# Se usan los grafos conexos ponderados de grafoConexoAleatorio (ver
+# GrafoGenerador).
+
+def tiempo(e: str) -> None:
+    """Tiempo (en segundos) de evaluar la expresión e."""
+    t = Timer(e, "", default_timer, globals()).timeit(1)
+    print(f"{t:0.2f} segundos")
+
+# La comparación es
+#    >>> from src.TAD.GrafoGenerador import grafoConexoAleatorio
+#    >>> g = grafoConexoAleatorio(200, 800)
+#    >>> tiempo('prim1(g)')
+#    0.84 segundos
+#    >>> tiempo('prim2(g)')
+#    0.00 segundos
+#    >>> g = grafoConexoAleatorio(400, 1600)
+#    >>> tiempo('prim1(g)')
+#    7.25 segundos
+#    >>> tiempo('prim2(g)')
+#    0.00 segundos
+#    >>> g = grafoConexoAleatorio(800, 3200)
+#    >>> tiempo('prim1(g)')
+#    57.85 segundos
+#    >>> tiempo('prim2(g)')
+#    0.01 segundos
+#
+#    >>> g = grafoConexoAleatorio(10**4, 10**5)
+#    >>> tiempo('prim2(g)')
+#    0.36 segundos
+#    >>> g = grafoConexoAleatorio(10**5, 10**6)
+#    >>> tiempo('prim2(g)')
+#    5.97 segundos
@@ -64,8 +64,11 @@
 #    kruskal(g4) == [(9,5,7),(6,1,6),(5,4,5),(5,1,2),(3,5,6),(1,3,5)]
 # ---------------------------------------------------------------------
 
+from timeit import Timer, default_timer
+
 from src.TAD.Grafo import (Grafo, Orientacion, Peso, Vertice, aristas,
                            creaGrafo, nodos)
+from src.TAD.UnionBusqueda import UnionBusqueda
 
 g1 = creaGrafo (Orientacion.ND,
                 (1,5),
@@ -96,6 +99,9 @@ g4 = creaGrafo (Orientacion.ND,
                  ((5,6),3),((5,7),9),
                  ((6,7),11)])
 
+# 1ª solución
+# ===========
+
 # raiz(d, n) es la raíz de n en el diccionario. Por ejemplo,
 #    raiz({1:1, 3:1, 4:3, 5:4, 2:6, 6:6}, 5)  == 1
 #    raiz({1:1, 3:1, 4:3, 5:4, 2:6, 6:6}, 2)  == 6
@@ -161,7 +167,7 @@ def buscaActualiza(a: tuple[Vertice, Vertice],
         return True, modificaR(x, d[x], y_, d)
     return True, modificaR(y, d[y], x_, d)
 
-def kruskal(g: Grafo) -> list[tuple[Peso, Vertice, Vertice]]:
+def kruskal1(g: Grafo) -> list[tuple[Peso, Vertice, Vertice]]:
     def aux(as_: list[tuple[Peso, Vertice, Vertice]],
             d: dict[Vertice, Vertice],
             ae: list[tuple[Peso, Vertice, Vertice]],
@@ -216,16 +222,69 @@ def kruskal(g: Grafo) -> list[tuple[Peso, Vertice, Vertice]]:
 #
 # No es posible añadir más aristas, pues formarían ciclos.
 
+# 2ª solución
+# ===========
+
+# En la solución anterior cada unión recorre todo el diccionario y cada
+# llamada recursiva copia la lista de aristas, por lo que su coste es
+# cuadrático. En esta se recorren iterativamente las aristas ordenadas y
+# el bosque se representa mediante la estructura de unión-búsqueda, con
+# compresión de caminos y unión por rango.
+def kruskal2(g: Grafo) -> list[tuple[Peso, Vertice, Vertice]]:
+    bosque: UnionBusqueda[Vertice] = UnionBusqueda(nodos(g))
+    n = len(nodos(g)) - 1
+    ae: list[tuple[Peso, Vertice, Vertice]] = []
+    for (p, x, y) in sorted((p, x, y) for ((x, y), p) in aristas(g)):
+        if len(ae) == n:
+            break
+        if bosque.une(x, y):
+            ae.append((p, x, y))
+    ae.reverse()
+    return ae
+
+def kruskal(g: Grafo) -> list[tuple[Peso, Vertice, Vertice]]:
+    return kruskal2(g)
+
 # Verificación
 # ============
 
 def test_kruskal() -> None:
-    assert kruskal(g1) == [(55,2,4),(34,1,3),(32,2,5),(12,1,2)]
-    assert kruskal(g2) == [(32,2,5),(13,1,2),(12,2,4),(11,1,3)]
-    assert kruskal(g3) == [(9,5,7),(7,2,3),(6,1,6),(5,4,5),(5,1,2),(3,5,6)]
-    assert kruskal(g4) == [(9,5,7),(6,1,6),(5,4,5),(5,1,2),(3,5,6),(1,3,5)]
+    for kruskal_ in [kruskal1, kruskal2]:
+        assert kruskal_(g1) == [(55,2,4),(34,1,3),(32,2,5),(12,1,2)]
+        assert kruskal_(g2) == [(32,2,5),(13,1,2),(12,2,4),(11,1,3)]
+        assert kruskal_(g3) == [(9,5,7),(7,2,3),(6,1,6),(5,4,5),(5,1,2),(3,5,6)]
+        assert kruskal_(g4) == [(9,5,7),(6,1,6),(5,4,5),(5,1,2),(3,5,6),(1,3,5)]
     print("Vefificado")
 
 # La verificación es
 #    >>> test_kruskal()
 #    Vefificado
+
+# Comparación de eficiencia
+# =========================
+
+# Se usan los grafos conexos ponderados de grafoConexoAleatorio (ver
+# GrafoGenerador).
+
+def tiempo(e: str) -> None:
+    """Tiempo (en segundos) de evaluar la expresión e."""
+    t = Timer(e, "", default_timer, globals()).timeit(1)
+    print(f"{t:0.2f} segundos")
+
+# La comparación es
+#    >>> from src.TAD.GrafoGenerador import grafoConexoAleatorio
+#    >>> tiempo('kruskal1(grafoConexoAleatorio(300, 100))')
+#    0.02 segundos
+#    >>> tiempo('kruskal2(grafoConexoAleatorio(300, 100))')
+#    0.00 segundos
+#    >>> tiempo('kruskal1(grafoConexoAleatorio(400, 400))')
+#    RecursionError: maximum recursion depth exceeded
+#    >>> tiempo('kruskal2(grafoConexoAleatorio(400, 400))')
+#    0.01 segundos
+#
+#    >>> g = grafoConexoAleatorio(10**4, 10**5)
+#    >>> tiempo('kruskal2(g)')
+#    0.40 segundos
+#    >>> g = grafoConexoAleatorio(10**5, 10**6)
+#    >>> tiempo('kruskal2(g)')
+#    5.64 segundos
@@ -61,8 +61,14 @@
 #    prim(g3)  == [(9,5,7),(7,2,3),(5,5,4),(3,6,5),(6,1,6),(5,1,2)]
 # ---------------------------------------------------------------------
 
-from src.TAD.Grafo import (Grafo, Orientacion, Peso, Vertice, aristas,
-                           creaGrafo, nodos)
+from heapq import heappop, heappush
+from timeit import Timer, default_timer
+
+from hypothesis import given
+
+from src.TAD.Grafo import (Grafo, Orientacion, Peso, Vertice, adyacentes,
+                           aristas, creaGrafo, nodos, peso)
+from src.TAD.GrafoGenerador import gen_grafoConexoPonderado
 
 g1 = creaGrafo (Orientacion.ND,
                 (1,5),
@@ -93,7 +99,10 @@ g4 = creaGrafo (Orientacion.ND,
                  ((5,6),3),((5,7),9),
                  ((6,7),11)])
 
-def prim(g: Grafo) -> list[tuple[Peso, Vertice, Vertice]]:
+# 1ª solución
+# ===========
+
+def prim1(g: Grafo) -> list[tuple[Peso, Vertice, Vertice]]:
     n, *ns = nodos(g)
     def prim_(t: list[Vertice],
               r: list[Vertice],
@@ -111,15 +120,100 @@ def prim(g: Grafo) -> list[tuple[Peso, Vertice, Vertice]]:
         return prim_([v_] + t, [x for x in r if x != v_], [e] + ae, as_)
     return prim_([n], ns, [], aristas(g))
 
+# 2ª solución
+# ===========
+
+# En la solución anterior, para añadir cada vértice se recorren todas
+# las aristas del grafo comprobando la pertenencia en listas, por lo que
+# su coste es O(V·E·V). En esta se usa un montículo binario con las
+# aristas (c, u, v) que salen de los vértices u del árbol, añadiendo
+# las de cada vértice (mediante sus adyacentes) cuando entra en el
+# árbol. Las aristas cuyo extremo v ya está en el árbol no se borran
+# del montículo, sino que se descartan al extraerlas. Como el mínimo del
+# montículo es el mínimo de las aristas (c, u, v) con u en el árbol y v
+# fuera de él, se eligen las mismas aristas que en la 1ª solución y su
+# coste es O(E·log(V)).
+def prim2(g: Grafo) -> list[tuple[Peso, Vertice, Vertice]]:
+    n, *_ = nodos(g)
+    enArbol = {n}
+    pendientes = len(nodos(g)) - 1
+    monticulo = [(peso(n, v, g), n, v) for v in adyacentes(g, n)]
+    monticulo.sort()
+    ae: list[tuple[Peso, Vertice, Vertice]] = []
+    while monticulo and pendientes > 0:
+        (c, u, v) = heappop(monticulo)
+        if v in enArbol:
+            continue
+        enArbol.add(v)
+        pendientes -= 1
+        ae.append((c, u, v))
+        for w in adyacentes(g, v):
+            if w not in enArbol:
+                heappush(monticulo, (peso(v, w, g), v, w))
+    ae.reverse()
+    return ae
+
+def prim(g: Grafo) -> list[tuple[Peso, Vertice, Vertice]]:
+    return prim2(g)
+
 # Verificación
 # ============
 
 def test_prim() -> None:
-    assert prim(g1)  == [(55,2,4),(34,1,3),(32,2,5),(12,1,2)]
-    assert prim(g2)  == [(32,2,5),(12,2,4),(13,1,2),(11,1,3)]
-    assert prim(g3)  == [(9,5,7),(7,2,3),(5,5,4),(3,6,5),(6,1,6),(5,1,2)]
+    for prim_ in [prim1, prim2]:
+        assert prim_(g1)  == [(55,2,4),(34,1,3),(32,2,5),(12,1,2)]
+        assert prim_(g2)  == [(32,2,5),(12,2,4),(13,1,2),(11,1,3)]
+        assert prim_(g3)  == [(9,5,7),(7,2,3),(5,5,4),(3,6,5),(6,1,6),(5,1,2)]
     print("Verificado")
 
 # La verificación es
 #    >>> test_prim()
 #    Verificado
+
+# Comprobación de equivalencia
+# ============================
+
+# La propiedad es
+@given(gen_grafoConexoPonderado())
+def test_prim_equiv(g: Grafo) -> None:
+    assert prim1(g) == prim2(g)
+
+# La comprobación es
+#    > poetry run pytest -q Grafo_Algoritmo_de_Prim.py
+#    2 passed in 2.39s
+
+# Comparación de eficiencia
+# =========================
+
+# Se usan los grafos conexos ponderados de grafoConexoAleatorio (ver
+# GrafoGenerador).
+
+def tiempo(e: str) -> None:
+    """Tiempo (en segundos) de evaluar la expresión e."""
+    t = Timer(e, "", default_timer, globals()).timeit(1)
+    print(f"{t:0.2f} segundos")
+
+# La comparación es
+#    >>> from src.TAD.GrafoGenerador import grafoConexoAleatorio
+#    >>> g = grafoConexoAleatorio(200, 800)
+#    >>> tiempo('prim1(g)')
+#    0.66 segundos
+#    >>> tiempo('prim2(g)')
+#    0.00 segundos
+#    >>> g = grafoConexoAleatorio(400, 1600)
+#    >>> tiempo('prim1(g)')
+#    5.21 segundos
+#    >>> tiempo('prim2(g)')
+#    0.00 segundos
+#    >>> g = grafoConexoAleatorio(800, 3200)
+#    >>> tiempo('prim1(g)')
+#    38.79 segundos
+#    >>> tiempo('prim2(g)')
+#    0.01 segundos
+#
+#    >>> g = grafoConexoAleatorio(10**4, 10**5)
+#    >>> tiempo('prim2(g)')
+#    0.45 segundos
+#    >>> g = grafoConexoAleatorio(10**5, 10**6)
+#    >>> tiempo('prim2(g)')
+#    5.31 segundos
@@ -0,0 +1,313 @@
+# Grafo_Caminos_minimos.py
+# TAD de los grafos: Caminos mínimos.
+# José A. Alonso Jiménez <https://jaalonso.github.io>
+# Sevilla, 18-octubre-2026
+# ---------------------------------------------------------------------
+
+# ---------------------------------------------------------------------
+# Usando el [tipo abstracto de datos de los grafos](https://bit.ly/45cQ3Fo),
+# definir las funciones
+#    dijkstra      : (Vertice, Grafo) -> dict[Vertice, Peso]
+#    caminoMinimo  : (Vertice, Vertice, Grafo)
+#                    -> Optional[tuple[Peso, list[Vertice]]]
+#    bellmanFord   : (Vertice, Grafo) -> Optional[dict[Vertice, Peso]]
+#    floydWarshall : (Grafo) -> npt.NDArray[np.float64]
+# tales que
+# + dijkstra(o, g) es el diccionario cuyas claves son los vértices
+#   alcanzables desde o en el grafo g (cuyos pesos son no negativos) y
+#   sus valores son las distancias mínimas desde o, calculadas con el
+#   algoritmo de Dijkstra.
+# + caminoMinimo(o, d, g) es el par formado por el coste y la lista de
+#   vértices de un camino mínimo desde o hasta d en el grafo g (cuyos
+#   pesos son no negativos), o None si d no es alcanzable desde o. Se
+#   calcula con el algoritmo de Dijkstra, terminando en cuanto se
+#   extrae d del montículo.
+# + bellmanFord(o, g) es el diccionario de las distancias mínimas desde
+#   o a los vértices alcanzables del grafo g (cuyos pesos pueden ser
+#   negativos) calculadas con el algoritmo de Bellman-Ford, o None si
+#   desde o se alcanza un ciclo de peso negativo.
+# + floydWarshall(g) es la matriz de las distancias mínimas entre todos
+#   los pares de vértices del grafo g calculada con el algoritmo de
+#   Floyd-Warshall; el elemento (i, j) es la distancia desde el i-ésimo
+#   vértice hasta el j-ésimo (inf si no es alcanzable). Si el grafo
+#   tiene ciclos de peso negativo, algún elemento de la diagonal es
+#   negativo.
+#
+# Por ejemplo, en el grafo
+#             12
+#        1 -------- 2
+#        | \78     /|
+#        |  \   32/ |
+#        |   \   /  |
+#      34|     5    |55
+#        |   /   \  |
+#        |  /44   \ |
+#        | /     93\|
+#        3 -------- 4
+#             61
+# definido por
+#    g1 = creaGrafo(Orientacion.ND,
+#                   (1,5),
+#                   [((1,2),12),((1,3),34),((1,5),78),
+#                    ((2,4),55),((2,5),32),
+#                    ((3,4),61),((3,5),44),
+#                    ((4,5),93)])
+# y en los grafos dirigidos
+#    g2 = creaGrafo(Orientacion.D,
+#                   (1,5),
+#                   [((1,2),4),((1,3),2),((3,2),-1),
+#                    ((2,4),2),((4,5),3),((3,5),10)])
+#    g3 = creaGrafo(Orientacion.D,
+#                   (1,3),
+#                   [((1,2),1),((2,3),-2),((3,1),-1)])
+# se tiene
+#    >>> dijkstra(1, g1)
+#    {1: 0, 2: 12, 3: 34, 5: 44, 4: 67}
+#    >>> caminoMinimo(1, 4, g1)
+#    (67, [1, 2, 4])
+#    >>> caminoMinimo(3, 2, g1)
+#    (46, [3, 1, 2])
+#    >>> bellmanFord(1, g2)
+#    {1: 0, 2: 1, 3: 2, 4: 3, 5: 6}
+#    >>> bellmanFord(1, g3) is None
+#    True
+#    >>> floydWarshall(g1)
+#    array([[ 0., 12., 34., 67., 44.],
+#           [12.,  0., 46., 55., 32.],
+#           [34., 46.,  0., 61., 44.],
+#           [67., 55., 61.,  0., 87.],
+#           [44., 32., 44., 87.,  0.]])
+# ---------------------------------------------------------------------
+
+from heapq import heappop, heappush
+from timeit import Timer, default_timer
+from typing import Optional
+
+import numpy as np
+import numpy.typing as npt
+from hypothesis import given
+
+from src.TAD.Grafo import (Grafo, Orientacion, Peso, Vertice, adyacentes,
+                           aristas, creaGrafo, nodos, peso)
+from src.TAD.GrafoGenerador import gen_grafoConexoPonderado
+
+g1 = creaGrafo(Orientacion.ND,
+               (1,5),
+               [((1,2),12),((1,3),34),((1,5),78),
+                ((2,4),55),((2,5),32),
+                ((3,4),61),((3,5),44),
+                ((4,5),93)])
+g2 = creaGrafo(Orientacion.D,
+               (1,5),
+               [((1,2),4),((1,3),2),((3,2),-1),
+                ((2,4),2),((4,5),3),((3,5),10)])
+g3 = creaGrafo(Orientacion.D,
+               (1,3),
+               [((1,2),1),((2,3),-2),((3,1),-1)])
+
+# Algoritmo de Dijkstra
+# =====================
+
+# Se usa un montículo binario de pares (distancia, vértice). Cuando se
+# mejora la distancia a un vértice se inserta de nuevo y, al extraer
+# pares antiguos (con distancia mayor que la conocida), se descartan.
+
+def dijkstra(o: Vertice, g: Grafo) -> dict[Vertice, Peso]:
+    distancias: dict[Vertice, Peso] = {}
+    monticulo: list[tuple[Peso, Vertice]] = [(0, o)]
+    while monticulo:
+        (dx, x) = heappop(monticulo)
+        if x in distancias:
+            continue
+        distancias[x] = dx
+        for y in adyacentes(g, x):
+            if y not in distancias:
+                heappush(monticulo, (dx + peso(x, y, g), y))
+    return distancias
+
+def caminoMinimo(o: Vertice,
+                 d: Vertice,
+                 g: Grafo) -> Optional[tuple[Peso, list[Vertice]]]:
+    mejor: dict[Vertice, Peso] = {o: 0}
+    padre: dict[Vertice, Vertice] = {}
+    cerrados: set[Vertice] = set()
+    monticulo: list[tuple[Peso, Vertice]] = [(0, o)]
+    while monticulo:
+        (dx, x) = heappop(monticulo)
+        if x in cerrados:
+            continue
+        if x == d:
+            camino = [d]
+            while camino[-1] != o:
+                camino.append(padre[camino[-1]])
+            camino.reverse()
+            return (dx, camino)
+        cerrados.add(x)
+        for y in adyacentes(g, x):
+            dy = dx + peso(x, y, g)
+            if y not in cerrados and (y not in mejor or dy < mejor[y]):
+                mejor[y] = dy
+                padre[y] = x
+                heappush(monticulo, (dy, y))
+    return None
+
+# Algoritmo de Bellman-Ford
+# =========================
+
+# Se relajan todas las aristas hasta que no cambie ninguna distancia. Si
+# no hay ciclos negativos alcanzables, basta con n-1 rondas (siendo n el
+# número de vértices); si en la ronda n todavía cambia alguna, hay un
+# ciclo negativo.
+
+def bellmanFord(o: Vertice, g: Grafo) -> Optional[dict[Vertice, Peso]]:
+    distancias: dict[Vertice, Peso] = {o: 0}
+    as_ = aristas(g)
+    for _ in range(len(nodos(g))):
+        cambio = False
+        for ((x, y), p) in as_:
+            if x in distancias and \
+               (y not in distancias or distancias[x] + p < distancias[y]):
+                distancias[y] = distancias[x] + p
+                cambio = True
+        if not cambio:
+            return dict(sorted(distancias.items()))
+    return None
+
+# Algoritmo de Floyd-Warshall
+# ===========================
+
+# Se parte de la matriz de pesos de las aristas (con 0 en la diagonal e
+# inf donde no hay arista) y, para cada vértice k, se actualiza a la vez
+# toda la matriz con los caminos que pasan por k, mediante las
+# operaciones vectoriales de NumPy. Por tanto, sólo hay n iteraciones
+# en Python, cada una con O(n²) operaciones en NumPy.
+
+def floydWarshall(g: Grafo) -> npt.NDArray[np.float64]:
+    vs = nodos(g)
+    n = len(vs)
+    m = np.full((n, n), np.inf)
+    as_ = aristas(g)
+    if as_:
+        xs = np.array([x for ((x, _), _) in as_]) - vs[0]
+        ys = np.array([y for ((_, y), _) in as_]) - vs[0]
+        ps = np.array([p for (_, p) in as_], dtype=np.float64)
+        np.minimum.at(m, (xs, ys), ps)
+    np.fill_diagonal(m, np.minimum(m.diagonal(), 0))
+    for k in range(n):
+        np.minimum(m, m[:, k, None] + m[None, k, :], out=m)
+    return m
+
+# Verificación
+# ============
+
+def test_caminosMinimos() -> None:
+    assert dijkstra(1, g1) == {1: 0, 2: 12, 3: 34, 5: 44, 4: 67}
+    assert caminoMinimo(1, 4, g1) == (67, [1, 2, 4])
+    assert caminoMinimo(3, 2, g1) == (46, [3, 1, 2])
+    assert caminoMinimo(1, 1, g1) == (0, [1])
+    assert caminoMinimo(5, 1, g2) is None
+    assert bellmanFord(1, g1) == dijkstra(1, g1)
+    assert bellmanFord(1, g2) == {1: 0, 2: 1, 3: 2, 4: 3, 5: 6}
+    assert bellmanFord(1, g3) is None
+    assert floydWarshall(g1).tolist() == \
+        [[0, 12, 34, 67, 44],
+         [12, 0, 46, 55, 32],
+         [34, 46, 0, 61, 44],
+         [67, 55, 61, 0, 87],
+         [44, 32, 44, 87, 0]]
+    assert floydWarshall(g2)[0].tolist() == [0, 1, 2, 3, 6]
+    assert floydWarshall(g2)[4].tolist() == [np.inf] * 4 + [0]
+    assert min(floydWarshall(g3).diagonal()) < 0
+    print("Verificado")
+
+# La verificación es
+#    >>> test_caminosMinimos()
+#    Verificado
+
+# Comprobación de equivalencia
+# ============================
+
+# La propiedad es que, en los grafos conexos con pesos positivos, los
+# tres algoritmos calculan las mismas distancias.
+@given(gen_grafoConexoPonderado())
+def test_caminosMinimos_equiv(g: Grafo) -> None:
+    m = floydWarshall(g)
+    for (i, v) in enumerate(nodos(g)):
+        ds = dijkstra(v, g)
+        assert bellmanFord(v, g) == ds
+        assert [ds[w] for w in nodos(g)] == m[i].tolist()
+        (c, camino) = caminoMinimo(v, nodos(g)[-1], g) or (None, [])
+        assert c == ds[nodos(g)[-1]]
+        assert c == sum(peso(x, y, g) for (x, y) in zip(camino, camino[1:]))
+
+# La comprobación es
+#    > poetry run pytest -q Grafo_Caminos_minimos.py
+#    2 passed in 3.12s
+
+# Comparación de eficiencia
+# =========================
+
+# Se usan los grafos conexos ponderados de grafoConexoAleatorio (ver
+# GrafoGenerador), que son como g1 pero con más vértices y aristas.
+
+# todasDijkstra(g) es la lista de las distancias desde cada vértice de
+# g calculadas con dijkstra.
+def todasDijkstra(g: Grafo) -> list[dict[Vertice, Peso]]:
+    return [dijkstra(v, g) for v in nodos(g)]
+
+# todasBellmanFord(g) es la lista de las distancias desde cada vértice
+# de g calculadas con bellmanFord.
+def todasBellmanFord(g: Grafo) -> list[Optional[dict[Vertice, Peso]]]:
+    return [bellmanFord(v, g) for v in nodos(g)]
+
+def tiempo(e: str) -> None:
+    """Tiempo (en segundos) de evaluar la expresión e."""
+    t = Timer(e, "", default_timer, globals()).timeit(1)
+    print(f"{t:0.2f} segundos")
+
+# La comparación, con todos los pares de vértices en grafos densos, es
+#    >>> from src.TAD.GrafoGenerador import grafoConexoAleatorio
+#    >>> g = grafoConexoAleatorio(100, 2500)
+#    >>> tiempo('todasDijkstra(g)')
+#    0.32 segundos
+#    >>> tiempo('todasBellmanFord(g)')
+#    0.59 segundos
+#    >>> tiempo('floydWarshall(g)')
+#    0.00 segundos
+#    >>> g = grafoConexoAleatorio(200, 10000)
+#    >>> tiempo('todasDijkstra(g)')
+#    3.05 segundos
+#    >>> tiempo('todasBellmanFord(g)')
+#    5.55 segundos
+#    >>> tiempo('floydWarshall(g)')
+#    0.02 segundos
+#    >>> g = grafoConexoAleatorio(400, 40000)
+#    >>> tiempo('todasDijkstra(g)')
+#    30.99 segundos
+#    >>> tiempo('floydWarshall(g)')
+#    0.16 segundos
+#    >>> g = grafoConexoAleatorio(800, 160000)
+#    >>> tiempo('todasDijkstra(g)')
+#    351.57 segundos
+#    >>> tiempo('floydWarshall(g)')
+#    1.56 segundos
+#
+# y, desde un único vértice en grafos dispersos, es
+#    >>> g = grafoConexoAleatorio(10**4, 10**5)
+#    >>> tiempo('dijkstra(1, g)')
+#    0.40 segundos
+#    >>> tiempo('caminoMinimo(1, 2, g)')
+#    0.04 segundos
+#    >>> tiempo('bellmanFord(1, g)')
+#    1.65 segundos
+#    >>> g = grafoConexoAleatorio(10**5, 10**6)
+#    >>> tiempo('dijkstra(1, g)')
+#    7.42 segundos
+#    >>> tiempo('caminoMinimo(1, 2, g)')
+#    3.94 segundos
+#    >>> tiempo('bellmanFord(1, g)')
+#    31.44 segundos
+#
+# Por tanto, para todos los pares en grafos densos conviene
+# floydWarshall; para un origen, dijkstra (o caminoMinimo si sólo
+# interesa un destino) y bellmanFord sólo cuando hay pesos negativos.
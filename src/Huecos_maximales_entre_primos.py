@@ -36,20 +36,31 @@
 #    [(2,1),(3,2),(7,4),(23,6),(89,8),(113,14),(523,18),(887,20)]
 # ---------------------------------------------------------------------
 
-from itertools import count, islice, pairwise, takewhile
+import json
+import os
+from collections import deque
+from concurrent.futures import Future, ProcessPoolExecutor
+from dataclasses import asdict, dataclass, field
+from itertools import chain, islice, pairwise, takewhile
+from tempfile import TemporaryDirectory
+from time import perf_counter
 from timeit import Timer, default_timer
-from typing import Iterator
+from typing import Callable, Iterator, Optional
 
-from sympy import isprime, nextprime
+import numpy as np
+from hypothesis import given, settings
+from hypothesis import strategies as st
+from sympy import nextprime
+
+from src.CribaSegmentada import primos, ventanas
 
 # 1ª solución
 # ===========
 
-# primos() genera la lista de los primos. Por ejemplo,
+# primos() genera la lista de los primos, mediante la criba segmentada
+# de CribaSegmentada. Por ejemplo,
 #    >>> list(islice(primos(), 10))
 #    [2, 3, 5, 7, 11, 13, 17, 19, 23, 29]
-def primos() -> Iterator[int]:
-    return (n for n in count() if isprime(n))
 
 # huecoPrimo(p) es la distancia del primo p hasta el siguiente
 # primo. Por ejemplo,
@@ -85,6 +96,206 @@ def primosYhuecosMaximales2() -> Iterator[tuple[int, int]]:
             yield (x,y)
             n = y
 
+# 3ª solución
+# ===========
+
+# En esta solución los primos se calculan por segmentos [a, b) con la
+# criba segmentada y cada segmento se resume en su primer primo, su
+# último primo, su número de primos y sus huecos récord locales (los
+# huecos entre primos del segmento mayores que todos los anteriores
+# del segmento). Los huecos maximales son el hueco entre el último primo
+# de un segmento y el primero del siguiente o alguno de los récords
+# locales, por lo que basta recorrer los resúmenes en orden. Como los
+# segmentos son independientes, sus resúmenes se pueden calcular en
+# paralelo.
+
+# Resumen es el tipo de los resúmenes de los segmentos: (primero,
+# último, número de primos, récords locales). Si el segmento no tiene
+# primos, el resumen es (0, 0, 0, []).
+Resumen = tuple[int, int, int, list[tuple[int, int]]]
+
+# SEGMENTO es el tamaño máximo de los segmentos.
+SEGMENTO = 2**24
+
+# resumenSegmento(a, b) es el resumen del segmento [a, b). Por ejemplo,
+#    >>> resumenSegmento(2, 100)
+#    (2, 97, 25, [(2, 1), (3, 2), (7, 4), (23, 6), (89, 8)])
+#    >>> resumenSegmento(100, 200)
+#    (101, 199, 21, [(101, 2), (103, 4), (113, 14)])
+def resumenSegmento(a: int, b: int) -> Resumen:
+    trozos = [x + 2 * np.flatnonzero(np.frombuffer(v, dtype=np.uint8))
+              for (x, v) in ventanas(a, b)]
+    if a <= 2 < b:
+        trozos.insert(0, np.array([2]))
+    if not trozos:
+        return (0, 0, 0, [])
+    ps = np.concatenate(trozos)
+    if ps.size == 0:
+        return (0, 0, 0, [])
+    hs = np.diff(ps)
+    maximos = np.maximum.accumulate(hs)
+    nuevos = np.flatnonzero(hs > np.concatenate(([0], maximos[:-1])))
+    return (ps[0].item(),
+            ps[-1].item(),
+            ps.size,
+            list(zip(ps[nuevos].tolist(), hs[nuevos].tolist())))
+
+# limites(a, fin, segmento) genera los segmentos [x, y) que recorren los
+# números desde a hasta fin (o indefinidamente si fin es None). Los
+# primeros segmentos son pequeños y se van duplicando hasta llegar a
+# segmento. Por ejemplo,
+#    >>> list(limites(2, 20000, 5000))
+#    [(2, 4098), (4098, 9098), (9098, 14098), (14098, 19098), (19098, 20000)]
+def limites(a: int,
+            fin: Optional[int],
+            segmento: int) -> Iterator[tuple[int, int]]:
+    k = min(2**12, segmento)
+    while fin is None or a < fin:
+        b = a + k if fin is None else min(a + k, fin)
+        yield (a, b)
+        a = b
+        k = min(2 * k, segmento)
+
+# resumenes(a, fin, procesos, segmento) genera los pares (b, r) tales
+# que r es el resumen del segmento [x, b), para los segmentos de
+# limites(a, fin, segmento) y en el mismo orden. Si procesos es mayor
+# que 1, se calculan en paralelo con dicho número de procesos, pero sin
+# tener más de 2*procesos segmentos pendientes.
+def resumenes(a: int,
+              fin: Optional[int],
+              procesos: int,
+              segmento: int) -> Iterator[tuple[int, Resumen]]:
+    if procesos <= 1:
+        for (x, y) in limites(a, fin, segmento):
+            yield (y, resumenSegmento(x, y))
+        return
+    with ProcessPoolExecutor(procesos) as ejecutor:
+        pendientes: deque[tuple[int, Future[Resumen]]] = deque()
+        for (x, y) in limites(a, fin, segmento):
+            pendientes.append((y, ejecutor.submit(resumenSegmento, x, y)))
+            if len(pendientes) >= 2 * procesos:
+                (b, r) = pendientes.popleft()
+                yield (b, r.result())
+        while pendientes:
+            (b, r) = pendientes.popleft()
+            yield (b, r.result())
+
+# Estado es el estado de una búsqueda de huecos maximales:
+# + siguiente: el primer número aún no examinado,
+# + ultimo: el último primo encontrado (0 si aún no hay ninguno),
+# + record: el mayor hueco encontrado,
+# + huecos: los primos con huecos maximales junto con sus huecos,
+# + primos: el número de primos encontrados y
+# + segundos: el tiempo empleado.
+@dataclass
+class Estado:
+    siguiente: int = 2
+    ultimo: int = 0
+    record: int = 0
+    huecos: list[tuple[int, int]] = field(default_factory=list)
+    primos: int = 0
+    segundos: float = 0.0
+
+    def rendimiento(self) -> float:
+        """
+        Devuelve el número de primos por segundo de la búsqueda.
+        """
+        return self.primos / self.segundos if self.segundos else 0.0
+
+# avanza(e, fin, procesos, segmento) recorre los segmentos desde
+# e.siguiente hasta fin (o indefinidamente si fin es None), actualizando
+# el estado e, y genera la lista de los nuevos huecos maximales de cada
+# segmento.
+def avanza(e: Estado,
+           fin: Optional[int] = None,
+           procesos: int = 1,
+           segmento: int = SEGMENTO) -> Iterator[list[tuple[int, int]]]:
+    t = perf_counter()
+    for (b, (primero, ultimo, n, locales)) in resumenes(e.siguiente, fin,
+                                                        procesos, segmento):
+        nuevos = []
+        if n:
+            candidatos = locales
+            if e.ultimo:
+                candidatos = [(e.ultimo, primero - e.ultimo)] + locales
+            for (p, h) in candidatos:
+                if h > e.record:
+                    e.record = h
+                    nuevos.append((p, h))
+            e.ultimo = ultimo
+            e.primos += n
+        e.huecos.extend(nuevos)
+        e.siguiente = b
+        t1 = perf_counter()
+        e.segundos += t1 - t
+        t = t1
+        yield nuevos
+
+def primosYhuecosMaximales3() -> Iterator[tuple[int, int]]:
+    return chain.from_iterable(avanza(Estado()))
+
+# guardaEstado(e, f) escribe el estado e en el fichero f (a través de un
+# fichero temporal, para que una interrupción no lo deje a medias) y
+# leeEstado(f) lo lee (o devuelve el estado inicial si f no existe).
+def guardaEstado(e: Estado, f: str) -> None:
+    temporal = f + '.tmp'
+    with open(temporal, 'w', encoding='utf-8') as g:
+        json.dump(asdict(e), g)
+    os.replace(temporal, f)
+
+def leeEstado(f: str) -> Estado:
+    if not os.path.exists(f):
+        return Estado()
+    with open(f, encoding='utf-8') as g:
+        d = json.load(g)
+    d['huecos'] = [tuple(x) for x in d['huecos']]
+    return Estado(**d)
+
+# informa(e) escribe el progreso de la búsqueda con estado e. Por
+# ejemplo,
+#    >>> informa(huecosMaximales(10**9, procesos=4))
+#    1000000000: 50847534 primos, récord 282 en 436273009 (4107449 primos/s)
+def informa(e: Estado) -> None:
+    (p, h) = e.huecos[-1] if e.huecos else (0, 0)
+    print(f"{e.siguiente}: {e.primos} primos, récord {h} en {p} "
+          f"({e.rendimiento():.0f} primos/s)")
+
+# huecosMaximales(fin, fichero, procesos, segmento, intervalo, informe)
+# es el estado final de la búsqueda de huecos maximales entre los
+# primos menores que fin, con los segmentos calculados por procesos
+# procesos. Si se indica un fichero, la búsqueda continúa desde el
+# estado guardado en él y cada intervalo segundos (y al terminar) se
+# guarda en él el estado. Además, cada vez que se guarda el estado se
+# aplica la función informe al estado. Por ejemplo,
+#    >>> huecosMaximales(10**6).huecos[-3:]
+#    [(360653, 96), (370261, 112), (492113, 114)]
+#    >>> e = huecosMaximales(10**7, procesos=2)
+#    >>> e.huecos[-1]
+#    (4652353, 154)
+#    >>> e.primos
+#    664579
+def huecosMaximales(fin: int,
+                    fichero: Optional[str] = None,
+                    procesos: int = 1,
+                    segmento: int = SEGMENTO,
+                    intervalo: float = 60,
+                    informe: Optional[Callable[[Estado], None]] = None
+                    ) -> Estado:
+    e = leeEstado(fichero) if fichero else Estado()
+    ultimoGuardado = perf_counter()
+    for _ in avanza(e, fin, procesos, segmento):
+        if perf_counter() - ultimoGuardado >= intervalo:
+            if fichero:
+                guardaEstado(e, fichero)
+            if informe:
+                informe(e)
+            ultimoGuardado = perf_counter()
+    if fichero:
+        guardaEstado(e, fichero)
+    if informe:
+        informe(e)
+    return e
+
 # Verificación
 # ============
 
@@ -92,12 +303,51 @@ def test_primosYhuecosMaximales() -> None:
     r = [(2,1),(3,2),(7,4),(23,6),(89,8),(113,14),(523,18),(887,20)]
     assert list(islice(primosYhuecosMaximales1(), 8)) == r
     assert list(islice(primosYhuecosMaximales2(), 8)) == r
+    assert list(islice(primosYhuecosMaximales3(), 8)) == r
+    # La búsqueda en paralelo y la reanudada desde el fichero de estado
+    # coinciden con la secuencial.
+    e = huecosMaximales(10**6)
+    assert e.huecos == list(takewhile(lambda x: sum(x) < 10**6,
+                                      primosYhuecosMaximales2()))
+    assert e.primos == 78498
+    assert huecosMaximales(10**6, procesos=2, segmento=10**5).huecos == \
+        e.huecos
+    with TemporaryDirectory() as d:
+        f = os.path.join(d, 'huecos.json')
+        huecosMaximales(3*10**5, fichero=f)
+        assert leeEstado(f).siguiente == 3*10**5
+        assert huecosMaximales(10**6, fichero=f) == \
+            leeEstado(f)
+        assert leeEstado(f).huecos == e.huecos
+        assert leeEstado(f).primos == e.primos
     print("Verificado")
 
 # La verificación es
 #    >>> test_primosYhuecosMaximales()
 #    Verificado
 
+# Comprobación de propiedades
+# ===========================
+
+# La propiedad es que, para cualquier tamaño de los segmentos y
+# cualquier punto de interrupción, la búsqueda reanudada calcula los
+# mismos huecos maximales que la 2ª solución.
+@settings(deadline=None)
+@given(st.integers(min_value=2, max_value=2*10**4),
+       st.integers(min_value=1, max_value=5000),
+       st.integers(min_value=2, max_value=2*10**4))
+def test_huecosMaximales(n: int, k: int, m: int) -> None:
+    e = Estado()
+    list(avanza(e, min(m, n), 1, k))
+    list(avanza(e, n, 1, k))
+    assert e.huecos == list(takewhile(lambda x: sum(x) < n,
+                                      primosYhuecosMaximales2()))
+    assert e.primos == len(list(takewhile(lambda x: x < n, primos())))
+
+# La comprobación es
+#    > poetry run pytest -q Huecos_maximales_entre_primos.py
+#    2 passed in 12.69s
+
 
 # Comparación de eficiencia
 # =========================
@@ -109,9 +359,30 @@ def tiempo(e: str) -> None:
 
 # La comparación es
 #    >>> tiempo('list(islice(primosYhuecosMaximales1(), 15))')
-#    8.08 segundos
+#    5.07 segundos
 #    >>> tiempo('list(islice(primosYhuecosMaximales2(), 15))')
-#    0.17 segundos
+#    0.01 segundos
+#    >>> tiempo('list(islice(primosYhuecosMaximales3(), 15))')
+#    0.00 segundos
+#
+#    >>> tiempo('list(islice(primosYhuecosMaximales2(), 30))')
+#    14.39 segundos
+#    >>> tiempo('list(islice(primosYhuecosMaximales3(), 30))')
+#    4.44 segundos
+#
+#    >>> tiempo('huecosMaximales(10**9)')
+#    12.29 segundos
+#    >>> tiempo('huecosMaximales(10**9, procesos=4)')
+#    13.37 segundos
+#
+# Los tiempos anteriores se han medido en una máquina con un único
+# núcleo, por lo que el cálculo en paralelo no mejora el tiempo. En una
+# máquina con k núcleos el tiempo de huecosMaximales se divide por algo
+# menos de k, ya que los segmentos son independientes.
+#
+# Para una búsqueda larga, se puede interrumpir y reanudar en cualquier
+# momento con
+#    >>> huecosMaximales(10**12, 'huecos.json', procesos=8, informe=informa)
 
 # ---------------------------------------------------------------------
 # § Referencias                                                      --
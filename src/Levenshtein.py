@@ -31,8 +31,15 @@
 #    levenshtein("agua",  "manantial") ==  7
 # ---------------------------------------------------------------------
 
+from random import choice, randrange
 from sys import setrecursionlimit
 from timeit import Timer, default_timer
+from typing import Iterable, Optional
+
+from hypothesis import given
+from hypothesis import strategies as st
+
+from src.ProgramacionDinamica import Consulta, ascendente
 
 setrecursionlimit(10**6)
 
@@ -93,6 +100,165 @@ def levenshtein2(xs: str, ys: str) -> int:
     n = len(ys)
     return matrizLevenshtein(xs, ys)[m][n]
 
+# 3ª definición (con programación dinámica en dos filas)
+# ======================================================
+
+# Cada fila de la matriz de Levenshtein sólo depende de la anterior,
+# por lo que basta guardar dos filas. Además, las filas se toman en la
+# cadena más corta, por lo que la memoria es O(min(n,m)).
+def levenshtein3(xs: str, ys: str) -> int:
+    if len(xs) < len(ys):
+        (xs, ys) = (ys, xs)
+    anterior = list(range(len(ys) + 1))
+    for (i, x) in enumerate(xs, 1):
+        actual = [i]
+        for (j, y) in enumerate(ys, 1):
+            if x == y:
+                actual.append(anterior[j - 1])
+            else:
+                actual.append(1 + min(anterior[j], actual[j - 1],
+                                      anterior[j - 1]))
+        anterior = actual
+    return anterior[-1]
+
+# 4ª definición (con el algoritmo de Myers)
+# =========================================
+
+# El algoritmo de Myers (en la versión de Hyyrö) representa cada
+# columna de la matriz de Levenshtein por las diferencias entre cada
+# elemento y el anterior (que son -1, 0 ó 1), codificadas en los bits de
+# dos números (Pv para los +1 y Mv para los -1). Cada columna se obtiene
+# de la anterior con unas pocas operaciones lógicas y aritméticas sobre
+# números de len(xs) bits, que Python realiza en C.
+
+# tablaDePatron(xs) es el diccionario que asigna a cada carácter c de
+# xs el número cuyo bit i-ésimo es 1 si xs[i] es c. Por ejemplo,
+#    >>> tablaDePatron("casa")
+#    {'c': 1, 'a': 10, 's': 4}
+def tablaDePatron(xs: str) -> dict[str, int]:
+    t: dict[str, int] = {}
+    for (i, x) in enumerate(xs):
+        t[x] = t.get(x, 0) | (1 << i)
+    return t
+
+# distanciaConPatron(t, n, ys, k) es la distancia de Levenshtein entre
+# una cadena xs de longitud n cuya tabla de patrón es t e ys, si es
+# menor o igual que k, y None en caso contrario (si k es None, no se
+# acota). Se termina en cuanto la distancia de los prefijos menos lo que
+# queda de ys supera k, ya que cada carácter de ys la reduce a lo sumo
+# en uno. Por ejemplo,
+#    distanciaConPatron(tablaDePatron("casa"), 4, "calle", None)  ==  3
+#    distanciaConPatron(tablaDePatron("casa"), 4, "calle", 2)     ==  None
+def distanciaConPatron(t: dict[str, int],
+                       n: int,
+                       ys: str,
+                       k: Optional[int]) -> Optional[int]:
+    if n == 0:
+        d = len(ys)
+        return d if k is None or d <= k else None
+    todos = (1 << n) - 1
+    ultimo = 1 << (n - 1)
+    (pv, mv, d) = (todos, 0, n)
+    for (j, y) in enumerate(ys, 1):
+        eq = t.get(y, 0)
+        xv = eq | mv
+        xh = ((((eq & pv) + pv) & todos) ^ pv) | eq
+        ph = mv | (~(xh | pv) & todos)
+        mh = pv & xh
+        if ph & ultimo:
+            d += 1
+        elif mh & ultimo:
+            d -= 1
+        if k is not None and d - (len(ys) - j) > k:
+            return None
+        ph = ((ph << 1) | 1) & todos
+        mh = (mh << 1) & todos
+        pv = mh | (~(xv | ph) & todos)
+        mv = ph & xv
+    return d if k is None or d <= k else None
+
+def levenshtein4(xs: str, ys: str) -> int:
+    d = distanciaConPatron(tablaDePatron(xs), len(xs), ys, None)
+    assert d is not None
+    return d
+
+# 5ª definición (con una banda)
+# =============================
+
+# levenshteinAcotada(xs, ys, k) es la distancia de Levenshtein entre xs
+# e ys si es menor o igual que k y None en caso contrario. Sólo se
+# calculan los elementos (i,j) de la matriz de Levenshtein tales que
+# |i-j| <= k (los demás son mayores que k) y se termina en cuanto todos
+# los de una fila son mayores que k. Por ejemplo,
+#    levenshteinAcotada("casa", "calle", 3)  ==  3
+#    levenshteinAcotada("casa", "calle", 2)  ==  None
+def levenshteinAcotada(xs: str, ys: str, k: int) -> Optional[int]:
+    (n, m) = (len(xs), len(ys))
+    if abs(n - m) > k:
+        return None
+    infinito = k + 1
+    anterior = [j if j <= k else infinito for j in range(m + 1)]
+    for i in range(1, n + 1):
+        actual = [infinito] * (m + 1)
+        if i <= k:
+            actual[0] = i
+        x = xs[i - 1]
+        for j in range(max(1, i - k), min(m, i + k) + 1):
+            if x == ys[j - 1]:
+                actual[j] = anterior[j - 1]
+            else:
+                actual[j] = min(infinito, 1 + min(anterior[j], actual[j - 1],
+                                                  anterior[j - 1]))
+        if min(actual[max(0, i - k):min(m, i + k) + 1]) > k:
+            return None
+        anterior = actual
+    return anterior[m] if anterior[m] <= k else None
+
+def levenshtein5(xs: str, ys: str) -> int:
+    k = 1
+    while (d := levenshteinAcotada(xs, ys, k)) is None:
+        k *= 2
+    return d
+
+# Cálculo en lote
+# ===============
+
+# distancias(xs, yss, k) es la lista de las distancias de Levenshtein
+# entre xs y cada una de las cadenas de yss que sean menores o iguales
+# que k (y None para las mayores); si k es None, no se acotan. Se usa el
+# algoritmo de Myers calculando una única vez la tabla de patrón de xs y
+# se descartan, sin calcularlas, las cadenas cuya longitud se diferencia
+# de la de xs en más de k. Por ejemplo,
+#    >>> distancias("casa", ["calle", "casa", "cosas", "ca"])
+#    [3, 0, 2, 2]
+#    >>> distancias("casa", ["calle", "casa", "cosas", "ca"], 2)
+#    [None, 0, 2, 2]
+def distancias(xs: str,
+               yss: Iterable[str],
+               k: Optional[int] = None) -> list[Optional[int]]:
+    t = tablaDePatron(xs)
+    n = len(xs)
+    return [None if k is not None and abs(len(ys) - n) > k
+            else distanciaConPatron(t, n, ys, k)
+            for ys in yss]
+
+# 6ª definición (con el esquema de programación dinámica)
+# =======================================================
+
+# Se usa la función ascendente del módulo ProgramacionDinamica con la
+# recurrencia de la matriz de Levenshtein, guardando sólo dos filas.
+def levenshtein6(xs: str, ys: str) -> int:
+    def f(v: Consulta[int], i: int, j: int) -> int:
+        if i == 0:
+            return j
+        if j == 0:
+            return i
+        if xs[i - 1] == ys[j - 1]:
+            return v(i - 1, j - 1)
+        return 1 + min(v(i - 1, j), v(i, j - 1), v(i - 1, j - 1))
+
+    return ascendente(f, len(xs) + 1, len(ys) + 1)[-1][-1]
+
 # Comparación de eficiencia
 # =========================
 
@@ -101,11 +267,89 @@ def tiempo(e: str) -> None:
     t = Timer(e, "", default_timer, globals()).timeit(1)
     print(f"{t:0.2f} segundos")
 
+# cadenaAleatoria(n) es una cadena aleatoria de n letras minúsculas.
+def cadenaAleatoria(n: int) -> str:
+    return "".join(choice("abcdefghijklmnopqrstuvwxyz") for _ in range(n))
+
+# mutacion(xs, k) es la cadena obtenida aplicando a xs k ediciones
+# aleatorias (inserciones, eliminaciones o sustituciones).
+def mutacion(xs: str, k: int) -> str:
+    for _ in range(k):
+        i = randrange(len(xs) + 1)
+        c = choice("abcdefghijklmnopqrstuvwxyz")
+        xs = choice([xs[:i] + c + xs[i:],
+                     xs[:i] + xs[i + 1:],
+                     xs[:i] + c + xs[i + 1:]])
+    return xs
+
 # La comparación es
 #    >>> tiempo('levenshtein1(str(2**33), str(3**33))')
 #    13.78 segundos
 #    >>> tiempo('levenshtein2(str(2**33), str(3**33))')
 #    0.00 segundos
+#
+# Con cadenas de 300 caracteres (xs e ys aleatorias y zs obtenida de xs
+# con 10 ediciones; la distancia entre xs e ys es 267 y entre xs y zs
+# es 9):
+#    >>> from random import seed
+#    >>> seed(2026)
+#    >>> xs = cadenaAleatoria(300)
+#    >>> ys = cadenaAleatoria(300)
+#    >>> zs = mutacion(xs, 10)
+#    >>> tiempo('levenshtein2(xs, ys)')
+#    0.07 segundos
+#    >>> tiempo('levenshtein3(xs, ys)')
+#    0.04 segundos
+#    >>> tiempo('levenshtein4(xs, ys)')
+#    0.00 segundos
+#    >>> tiempo('levenshtein5(xs, ys)')
+#    0.17 segundos
+#    >>> tiempo('levenshtein5(xs, zs)')
+#    0.01 segundos
+#    >>> tiempo('levenshteinAcotada(xs, ys, 20)')
+#    0.00 segundos
+#    >>> tiempo('levenshteinAcotada(xs, zs, 20)')
+#    0.01 segundos
+#
+# Con cadenas de 3000 caracteres:
+#    >>> tiempo('levenshtein3(xs * 10, ys * 10)')
+#    4.30 segundos
+#    >>> tiempo('levenshtein4(xs * 10, ys * 10)')
+#    0.01 segundos
+#
+# En lote, comparando xs con 10^4 cadenas obtenidas con menos de 40
+# ediciones (yss) y con 10^4 cadenas aleatorias (aleatorias):
+#    >>> yss = [mutacion(xs, randrange(40)) for _ in range(10**4)]
+#    >>> aleatorias = [cadenaAleatoria(300) for _ in range(10**4)]
+#    >>> tiempo('[levenshtein2(xs, ys) for ys in yss[:100]]')
+#    5.85 segundos
+#    >>> tiempo('[levenshtein4(xs, ys) for ys in yss]')
+#    4.99 segundos
+#    >>> tiempo('distancias(xs, yss)')
+#    4.06 segundos
+#    >>> tiempo('distancias(xs, yss, 20)')
+#    4.06 segundos
+#    >>> tiempo('distancias(xs, aleatorias, 20)')
+#    0.85 segundos
+#
+# Es decir, el algoritmo de Myers es más de 100 veces más rápido que la
+# matriz completa con cadenas de 300 caracteres. La cota k sólo ahorra
+# tiempo cuando las cadenas están lejos (como las aleatorias), ya que
+# el cálculo se termina en cuanto la distancia no puede bajar de k. La
+# banda es útil para k pequeños, pero en Python recorrer los elementos
+# de la banda es más lento que las operaciones de bits de Myers.
+#
+# Con el esquema de programación dinámica (la memoria es el pico de la
+# reservada durante la evaluación, medido con tracemalloc en un proceso
+# nuevo para cada expresión):
+#    >>> tiempo('levenshtein2(str(2**3000), str(3**2000))')   # 27 MiB
+#    0.45 segundos
+#    >>> tiempo('levenshtein3(str(2**3000), str(3**2000))')   # 81 KiB
+#    0.23 segundos
+#    >>> tiempo('levenshtein6(str(2**3000), str(3**2000))')   # 92 KiB
+#    0.59 segundos
+# El esquema general tiene la memoria de levenshtein3, pero es más
+# lento porque cada valor se calcula con dos llamadas a funciones.
 
 # Verificación
 # ============
@@ -121,4 +365,50 @@ def test_levenshtein() -> None:
     assert levenshtein2("casa",  "casa")      ==  0
     assert levenshtein2("ana",   "maria")     ==  3
     assert levenshtein2("agua",  "manantial") ==  7
+    for levenshtein in [levenshtein3, levenshtein4, levenshtein5]:
+        assert levenshtein("casa",  "calle")     ==  3
+        assert levenshtein("calle", "casa")      ==  3
+        assert levenshtein("casa",  "casa")      ==  0
+        assert levenshtein("ana",   "maria")     ==  3
+        assert levenshtein("agua",  "manantial") ==  7
+        assert levenshtein("",      "agua")      ==  4
+    assert tablaDePatron("casa") == {'c': 1, 'a': 10, 's': 4}
+    assert distanciaConPatron(tablaDePatron("casa"), 4, "calle", None) == 3
+    assert distanciaConPatron(tablaDePatron("casa"), 4, "calle", 2) is None
+    assert levenshteinAcotada("casa", "calle", 3) == 3
+    assert levenshteinAcotada("casa", "calle", 2) is None
+    assert distancias("casa", ["calle", "casa", "cosas", "ca"]) == \
+        [3, 0, 2, 2]
+    assert distancias("casa", ["calle", "casa", "cosas", "ca"], 2) == \
+        [None, 0, 2, 2]
+    assert levenshtein6("casa",  "calle")     ==  3
+    assert levenshtein6("calle", "casa")      ==  3
+    assert levenshtein6("casa",  "casa")      ==  0
+    assert levenshtein6("ana",   "maria")     ==  3
+    assert levenshtein6("agua",  "manantial") ==  7
     print("Verificado")
+
+# La verificación es
+#    >>> test_levenshtein()
+#    Verificado
+
+# Comprobación de equivalencia
+# ============================
+
+# La propiedad es
+@given(st.text(alphabet="abc", max_size=100),
+       st.text(alphabet="abc", max_size=100),
+       st.integers(min_value=0, max_value=10))
+def test_levenshtein_equiv(xs: str, ys: str, k: int) -> None:
+    d = levenshtein2(xs, ys)
+    assert levenshtein3(xs, ys) == d
+    assert levenshtein4(xs, ys) == d
+    assert levenshtein5(xs, ys) == d
+    assert levenshtein6(xs, ys) == d
+    r = d if d <= k else None
+    assert levenshteinAcotada(xs, ys, k) == r
+    assert distancias(xs, [ys, xs], k) == [r, 0]
+
+# La comprobación es
+#    > poetry run pytest -q Levenshtein.py
+#    2 passed in 2.39s
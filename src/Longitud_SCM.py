@@ -37,6 +37,9 @@
 
 from timeit import Timer, default_timer
 
+from src.AlineamientoSCM import filaSCM, paresSCM
+from src.ProgramacionDinamica import Consulta, ascendente
+
 # 1ª definición (por recursión)
 # =============================
 
@@ -92,6 +95,35 @@ def longitudSCM2(xs: str, ys: str) -> int:
     m = len(ys)
     return matrizLongitudSCM2(xs, ys)[n][m]
 
+# 3ª definición (guardando una única fila)
+# ========================================
+
+# Con la función filaSCM de AlineamientoSCM, que calcula la última fila
+# de la matriz anterior guardando sólo una fila.
+def longitudSCM3(xs: str, ys: str) -> int:
+    return filaSCM(xs, ys, range(len(xs)), range(len(ys)))[-1]
+
+# 4ª definición (con el algoritmo de Hunt y Szymanski)
+# ====================================================
+
+def longitudSCM4(xs: str, ys: str) -> int:
+    return len(paresSCM(xs, ys))
+
+# 5ª definición (con el esquema de programación dinámica)
+# =======================================================
+
+# Se usa la función ascendente del módulo ProgramacionDinamica con la
+# recurrencia de matrizLongitudSCM2, guardando sólo dos filas.
+def longitudSCM5(xs: str, ys: str) -> int:
+    def f(v: Consulta[int], i: int, j: int) -> int:
+        if i == 0 or j == 0:
+            return 0
+        if xs[i - 1] == ys[j - 1]:
+            return 1 + v(i - 1, j - 1)
+        return max(v(i, j - 1), v(i - 1, j))
+
+    return ascendente(f, len(xs) + 1, len(ys) + 1)[-1][-1]
+
 # Comparación de eficiencia
 # =========================
 
@@ -105,6 +137,25 @@ def tiempo(e: str) -> None:
 #    8.04 segundos
 #    >>> tiempo('longitudSCM2([1,3]*9, [2,3]*9)')
 #    0.00 segundos
+#    >>> tiempo('longitudSCM3([1,3]*9, [2,3]*9)')
+#    0.00 segundos
+#    >>> tiempo('longitudSCM4([1,3]*9, [2,3]*9)')
+#    0.00 segundos
+#
+#    >>> tiempo('longitudSCM2([1,3]*1000, [2,3]*1000)')
+#    1.79 segundos
+#    >>> tiempo('longitudSCM3([1,3]*1000, [2,3]*1000)')
+#    0.46 segundos
+#    >>> tiempo('longitudSCM4([1,3]*1000, [2,3]*1000)')
+#    0.51 segundos
+#
+# Con el esquema de programación dinámica (la memoria es el pico de la
+# reservada durante la evaluación, medido con tracemalloc en un proceso
+# nuevo para cada expresión):
+#    >>> tiempo('longitudSCM2([1,3]*1000, [2,3]*1000)')   # 48 MiB
+#    1.22 segundos
+#    >>> tiempo('longitudSCM5([1,3]*1000, [2,3]*1000)')   # 135 KiB
+#    2.06 segundos
 
 # Verificación
 # ============
@@ -116,6 +167,15 @@ def test_longitudSCM() -> None:
     assert longitudSCM2("amapola", "matamoscas") == 4
     assert longitudSCM2("atamos", "matamoscas")  == 6
     assert longitudSCM2("aaa", "bbbb")           == 0
+    assert longitudSCM3("amapola", "matamoscas") == 4
+    assert longitudSCM3("atamos", "matamoscas")  == 6
+    assert longitudSCM3("aaa", "bbbb")           == 0
+    assert longitudSCM4("amapola", "matamoscas") == 4
+    assert longitudSCM4("atamos", "matamoscas")  == 6
+    assert longitudSCM4("aaa", "bbbb")           == 0
+    assert longitudSCM5("amapola", "matamoscas") == 4
+    assert longitudSCM5("atamos", "matamoscas")  == 6
+    assert longitudSCM5("aaa", "bbbb")           == 0
     print("Verificado")
 
 # La verificación es
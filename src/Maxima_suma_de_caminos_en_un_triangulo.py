@@ -28,6 +28,8 @@
 
 from timeit import Timer, default_timer
 
+from src.AgregadosDeCaminos import maximaSumaTriangulo
+
 # 1ª solución
 # ===========
 
@@ -62,14 +64,23 @@ def maximaSuma2(xss: list[list[int]]) -> int:
     return x + max(maximaSuma2([[y1]] + [us[:-1] for us in zss]),
                    maximaSuma2([[y2]] + [us[1:] for us in zss]))
 
+# 3ª solución (con vectores de NumPy)
+# ===================================
+
+# Se usa la función maximaSumaTriangulo del módulo AgregadosDeCaminos,
+# que calcula las máximas sumas fila a fila.
+def maximaSuma3(xss: list[list[int]]) -> int:
+    return maximaSumaTriangulo(xss)
+
 # Verificación
 # ============
 
 def test_maximaSuma() -> None:
-    for maximaSuma in [maximaSuma1, maximaSuma2]:
+    for maximaSuma in [maximaSuma1, maximaSuma2, maximaSuma3]:
         assert maximaSuma([[3],[7,4]]) == 10
         assert maximaSuma([[3],[7,4],[2,4,6]]) == 14
         assert maximaSuma([[3],[7,4],[2,4,6],[8,5,9,3]]) == 23
+        assert maximaSuma([[2**62],[2**62,1]]) == 2**63
     print("Verificado")
 
 # La verificación es
@@ -100,3 +111,7 @@ def tiempo(e: str) -> None:
 #    3.21 segundos
 #    >>> tiempo('maximaSuma2(triangulo(20))')
 #    0.59 segundos
+#    >>> tiempo('maximaSuma3(triangulo(20))')
+#    0.00 segundos
+#    >>> tiempo('maximaSuma3(triangulo(3000))')
+#    0.23 segundos
@@ -42,7 +42,11 @@ from collections import defaultdict
 from sys import setrecursionlimit
 from timeit import Timer, default_timer
 
+import numpy as np
+
+from src.AgregadosDeCaminos import maximaSuma as maximaSumaPorFilas
 from src.Caminos_en_una_matriz import caminos1, caminos2
+from src.ProgramacionDinamica import Consulta, Recurrencia, ascendente
 
 setrecursionlimit(10**6)
 
@@ -123,6 +127,45 @@ def diccionarioMaxSuma(p: list[list[int]]) -> dict[tuple[int, int], int]:
                 q[(i, j)] = max(q[(i,j-1)], q[(i-1,j)]) + p[i-1][j-1]
     return q
 
+# 5ª solución (con el esquema de programación dinámica)
+# =====================================================
+
+# recurrenciaMaxSuma(p) es la recurrencia de las máximas sumas de los
+# caminos en la matriz p (con las posiciones numeradas desde 0).
+def recurrenciaMaxSuma(p: list[list[int]]) -> Recurrencia[int]:
+    def f(v: Consulta[int], i: int, j: int) -> int:
+        if i == 0 and j == 0:
+            return p[0][0]
+        if i == 0:
+            return v(0, j - 1) + p[0][j]
+        if j == 0:
+            return v(i - 1, 0) + p[i][0]
+        return max(v(i, j - 1), v(i - 1, j)) + p[i][j]
+    return f
+
+# Se usa la función ascendente del módulo ProgramacionDinamica
+# guardando sólo dos filas (en listas).
+def maximaSuma5(p: list[list[int]]) -> int:
+    return ascendente(recurrenciaMaxSuma(p), len(p), len(p[0]))[-1][-1]
+
+# 6ª solución (con el esquema de programación dinámica y NumPy)
+# =============================================================
+
+# Como la 5ª, pero con las filas en vectores de NumPy de enteros de 64
+# bits.
+def maximaSuma6(p: list[list[int]]) -> int:
+    return int(ascendente(recurrenciaMaxSuma(p), len(p), len(p[0]),
+                          tabla='numpy', tipo=np.int64)[-1][-1])
+
+# 7ª solución (con vectores de NumPy)
+# ===================================
+
+# Se usa la función maximaSuma del módulo AgregadosDeCaminos, que
+# calcula cada fila de las máximas sumas con operaciones sobre vectores
+# de NumPy.
+def maximaSuma7(p: list[list[int]]) -> int:
+    return maximaSumaPorFilas(p)
+
 # Comparación de eficiencia
 # =========================
 
@@ -140,6 +183,22 @@ def tiempo(e: str) -> None:
 #    0.85 segundos
 #    >>> tiempo('maximaSuma4([list(range(12*n+1, 12*(n+1)+1)) for n in range(12)])')
 #    0.00 segundos
+#
+# Con el esquema de programación dinámica (la memoria es el pico de la
+# reservada durante la evaluación, medido con tracemalloc en un proceso
+# nuevo para cada expresión):
+#    >>> m = [list(range(800*n+1, 800*(n+1)+1)) for n in range(800)]
+#    >>> tiempo('maximaSuma4(m)')   # 87 MiB
+#    0.99 segundos
+#    >>> tiempo('maximaSuma5(m)')   # 79 KiB
+#    0.38 segundos
+#    >>> tiempo('maximaSuma6(m)')   # 29 KiB
+#    0.77 segundos
+#    >>> tiempo('maximaSuma7(m)')   # 5 MiB (la matriz en NumPy)
+#    0.04 segundos
+# Las filas de NumPy ocupan menos que las listas, pero acceder a sus
+# elementos uno a uno es más lento. En cambio, en maximaSuma7 cada fila
+# se calcula con pocas operaciones sobre vectores.
 
 # Verificación
 # ============
@@ -149,6 +208,10 @@ def test_maximaSuma() -> None:
     assert maximaSuma2([[1,6,11,2],[7,12,3,8],[3,8,4,9]]) == 41
     assert maximaSuma3([[1,6,11,2],[7,12,3,8],[3,8,4,9]]) == 41
     assert maximaSuma4([[1,6,11,2],[7,12,3,8],[3,8,4,9]]) == 41
+    assert maximaSuma5([[1,6,11,2],[7,12,3,8],[3,8,4,9]]) == 41
+    assert maximaSuma6([[1,6,11,2],[7,12,3,8],[3,8,4,9]]) == 41
+    assert maximaSuma7([[1,6,11,2],[7,12,3,8],[3,8,4,9]]) == 41
+    assert maximaSuma7([[2**62] * 2] * 2) == 3 * 2**62
     print("Verificado")
 
 # La verificación es
@@ -43,11 +43,14 @@
 #    mayoresGeneradores(10^6)  ==  [837799]
 # ---------------------------------------------------------------------
 
+from concurrent.futures import ProcessPoolExecutor
 from functools import lru_cache
 from itertools import count, islice
 from timeit import Timer, default_timer
 from typing import Iterator
 
+import numpy as np
+import numpy.typing as npt
 from hypothesis import given
 from hypothesis import strategies as st
 
@@ -147,6 +150,181 @@ def mayoresGeneradores5(n: int) -> list[int]:
     m = max((y for (_, y) in ps))
     return [x for (x,y) in ps if y == m]
 
+# 6ª solución
+# ===========
+
+# En esta solución las longitudes de las órbitas se guardan en dos
+# cachés:
+# + una tabla densa (un vector de NumPy) con las longitudes de los
+#   números menores que un umbral y
+# + un diccionario acotado con las longitudes de algunos números
+#   mayores que el umbral (cuando se llena, se elimina la entrada más
+#   antigua).
+# Las longitudes de un bloque de números consecutivos se calculan a la
+# vez con NumPy: se aplica un paso de la sucesión a todos los números
+# del bloque cuyas órbitas aún no han alcanzado un número conocido
+# (menor que el inicio del bloque, si éste está dentro de la tabla, o
+# menor que el umbral en caso contrario) y se terminan las que lo han
+# alcanzado sumando la longitud guardada en la tabla.
+
+# UMBRAL es el tamaño de la tabla densa, BLOQUE el número de órbitas que
+# se calculan a la vez con NumPy y MAXIMO el número máximo de entradas
+# del diccionario.
+UMBRAL = 2**22
+BLOQUE = 2**18
+MAXIMO = 10**6
+
+# LIMITE es el mayor número al que se le puede aplicar un paso de la
+# sucesión con enteros de 64 bits sin desbordamiento.
+LIMITE = (2**63 - 2) // 3
+
+class OrbitasDeCollatz:
+    def __init__(self, umbral: int = UMBRAL, maximo: int = MAXIMO) -> None:
+        self._umbral = max(2, umbral)
+        self._maximo = maximo
+        # _tabla[x] es la longitud de la órbita de x, para 1 <= x <
+        # len(_tabla) (que crece hasta el umbral).
+        self._tabla: npt.NDArray[np.int32] = np.array([0, 1], dtype=np.int32)
+        self._diccionario: dict[int, int] = {}
+
+    def extiende(self, m: int) -> None:
+        """
+        Amplía la tabla hasta que contenga las longitudes de los
+        números menores que m (sin pasar del umbral). Se usa para
+        calcular la tabla antes de repartir el cálculo entre procesos.
+        """
+        m = min(m, self._umbral)
+        while len(self._tabla) < m:
+            a = len(self._tabla)
+            b = min(m, a + BLOQUE)
+            self._tabla = np.concatenate((self._tabla, self._bloque(a, b, a)))
+
+    def _bloque(self, a: int, b: int, conocido: int) -> npt.NDArray[np.int32]:
+        """
+        Devuelve el vector de las longitudes de las órbitas de los
+        números de a hasta b (excluido), suponiendo que la tabla
+        contiene las longitudes de los menores que conocido.
+        """
+        r = np.zeros(b - a, dtype=np.int32)
+        posiciones = np.arange(b - a)
+        vs = np.arange(a, b, dtype=np.int64)
+        # cs[i] es el número de pasos aplicados a vs[i].
+        cs = np.zeros(b - a, dtype=np.int32)
+        while vs.size:
+            hechos = vs < conocido
+            terminados = hechos
+            if hechos.any():
+                r[posiciones[hechos]] = cs[hechos] + self._tabla[vs[hechos]]
+            # Los números demasiado grandes se terminan sin NumPy.
+            grandes = vs > LIMITE
+            if grandes.any():
+                for (i, x, c) in zip(posiciones[grandes].tolist(),
+                                     vs[grandes].tolist(),
+                                     cs[grandes].tolist()):
+                    r[i] = c + self.longitud(x)
+                terminados = hechos | grandes
+            if terminados.any():
+                pendientes = ~terminados
+                posiciones = posiciones[pendientes]
+                vs = vs[pendientes]
+                cs = cs[pendientes]
+            # Si v es impar, se aplican dos pasos: 3v+1 (que es par) y su
+            # mitad.
+            impares = vs & 1
+            vs += impares * (2 * vs + 1)
+            vs >>= 1
+            cs += 1 + impares.astype(np.int32)
+        return r
+
+    def longitud(self, x: int) -> int:
+        """
+        Devuelve la longitud de la órbita de x, usando la tabla y
+        guardando en el diccionario las longitudes de los números de la
+        órbita mayores que el umbral.
+        """
+        tabla = self._tabla
+        diccionario = self._diccionario
+        camino = []
+        while x >= len(tabla) and x not in diccionario:
+            camino.append(x)
+            x = siguiente(x)
+        n = tabla.item(x) if x < len(tabla) else diccionario[x]
+        for y in reversed(camino):
+            n += 1
+            if y >= self._umbral:
+                if len(diccionario) >= self._maximo:
+                    del diccionario[next(iter(diccionario))]
+                diccionario[y] = n
+        return n
+
+    def entradasDiccionario(self) -> int:
+        """
+        Devuelve el número de entradas del diccionario.
+        """
+        return len(self._diccionario)
+
+    def longitudes(self, a: int, b: int) -> npt.NDArray[np.int32]:
+        """
+        Devuelve el vector de las longitudes de las órbitas de los
+        números de a hasta b (excluido), con a >= 1.
+        """
+        self.extiende(b)
+        c = len(self._tabla)
+        trozos = [self._tabla[a:min(b, c)]]
+        for x in range(max(a, c), b, BLOQUE):
+            trozos.append(self._bloque(x, min(b, x + BLOQUE), c))
+        return np.concatenate(trozos)
+
+    def maximos(self, a: int, b: int) -> tuple[int, list[int]]:
+        """
+        Devuelve el par (m, xs) tal que m es la mayor longitud de las
+        órbitas de los números de a hasta b (excluido) y xs es la lista
+        de los que la alcanzan.
+        """
+        m = 0
+        xs: list[int] = []
+        self.extiende(b)
+        for x in range(a, b, BLOQUE):
+            ls = self.longitudes(x, min(b, x + BLOQUE))
+            k = ls.max().item()
+            if k > m:
+                (m, xs) = (k, [])
+            if k == m:
+                xs.extend((x + np.flatnonzero(ls == k)).tolist())
+        return (m, xs)
+
+# orbitas es el calculador de órbitas de Collatz que usa la 6ª solución.
+orbitas = OrbitasDeCollatz()
+
+# longitudOrbita4(x) es la longitud de la órbita de x. Por ejemplo,
+#    longitudOrbita4(13)      ==  10
+#    longitudOrbita4(10**20)  ==  471
+def longitudOrbita4(x: int) -> int:
+    return orbitas.longitud(x)
+
+# maximosTrozo(a, b) es la mayor longitud de las órbitas de los números
+# de a hasta b (excluido) junto con los que la alcanzan. Por ejemplo,
+#    maximosTrozo(1, 21)  ==  (21, [18, 19])
+def maximosTrozo(a: int, b: int) -> tuple[int, list[int]]:
+    return orbitas.maximos(a, b)
+
+# mayoresGeneradores6(n, procesos) es la lista de los números menores
+# o iguales que n cuyas órbitas de Collatz son las de mayor longitud,
+# calculada dividiendo el intervalo [1, n] en trozos que se reparten
+# entre procesos procesos. La tabla densa se calcula antes de crear los
+# procesos, por lo que (en los sistemas que crean los procesos con
+# fork) todos la comparten sin copiarla.
+def mayoresGeneradores6(n: int, procesos: int = 1) -> list[int]:
+    if procesos <= 1:
+        return maximosTrozo(1, n + 1)[1]
+    orbitas.extiende(n + 1)
+    k = -(-n // (4 * procesos))
+    trozos = [(a, min(n + 1, a + k)) for a in range(1, n + 1, k)]
+    with ProcessPoolExecutor(procesos) as ejecutor:
+        rs = list(ejecutor.map(maximosTrozo, *zip(*trozos)))
+    m = max(k for (k, _) in rs)
+    return [x for (k, xs) in rs if k == m for x in xs]
+
 # Verificación
 # ============
 
@@ -155,8 +333,17 @@ def test_mayoresGeneradores() -> None:
                                mayoresGeneradores2,
                                mayoresGeneradores3,
                                mayoresGeneradores4,
-                               mayoresGeneradores5]:
+                               mayoresGeneradores5,
+                               mayoresGeneradores6]:
         assert mayoresGeneradores(20) == [18,19]
+    assert mayoresGeneradores6(10**6) == [837799]
+    assert mayoresGeneradores6(10**5, procesos=2) == [77031]
+    # Con una tabla y un diccionario pequeños se obtiene lo mismo.
+    o = OrbitasDeCollatz(umbral=100, maximo=10)
+    assert o.maximos(1, 10**5 + 1) == (351, [77031])
+    assert o.longitud(27) == 112
+    assert o.longitud(10**20) == 471
+    assert o.entradasDiccionario() == 10
     print("Verificado")
 
 # La verificación es
@@ -172,6 +359,8 @@ def test_mayoresGeneradores_equiv(n: int) -> None:
     r = mayoresGeneradores1(n)
     assert mayoresGeneradores2(n) == r
     assert mayoresGeneradores3(n) == r
+    assert mayoresGeneradores6(n) == r
+    assert OrbitasDeCollatz(umbral=n // 2, maximo=8).maximos(1, n + 1)[1] == r
 
 # La comprobación es
 #    >>> test_mayoresGeneradores_equiv()
@@ -196,3 +385,24 @@ def tiempo(e: str) -> None:
 #    1.59 segundos
 #    >>> tiempo('mayoresGeneradores5(10**5)')
 #    0.12 segundos
+#    >>> tiempo('mayoresGeneradores6(10**5)')
+#    0.09 segundos
+#
+#    >>> tiempo('mayoresGeneradores5(10**6)')
+#    2.67 segundos
+#    >>> tiempo('mayoresGeneradores6(10**6)')
+#    0.15 segundos
+#
+#    >>> tiempo('mayoresGeneradores6(10**7)')
+#    1.43 segundos
+#    >>> tiempo('mayoresGeneradores6(10**8)')
+#    32.40 segundos
+#    >>> tiempo('mayoresGeneradores6(10**8, procesos=2)')
+#    29.47 segundos
+#
+# Los tiempos anteriores se han medido en una máquina con un único
+# núcleo. En una máquina con k núcleos, mayoresGeneradores6(n, k)
+# reparte los trozos entre los k núcleos.
+
+# En lo sucesivo usaremos la sexta definición
+mayoresGeneradores = mayoresGeneradores6
@@ -23,6 +23,8 @@ from hypothesis import given
 from hypothesis import strategies as st
 from sympy import divisor_count, divisors, factorint
 
+from src.PotenciasPerfectas import esCuadrado, raizEntera
+
 # 1ª solución
 # ===========
 
@@ -39,24 +41,10 @@ def numeroDivisores1(x: int) -> int:
 #    raizEntera(5)  ==  2
 #    raizEntera(8)  ==  2
 #    raizEntera(9)  ==  3
-def raizEntera(x: int) -> int:
-    def aux(a: int, b: int) -> int:
-        c = (a+b) // 2
-        d = c**2
-        if d == x:
-            return c
-        if c == a:
-            return c
-        if x <= d:
-            return aux(a,c)
-        return aux(c,b)
-    return aux(1,x)
-
-# esCuadrado(x) se verifica si x es un cuadrado perfecto. Por ejemplo,
+# y esCuadrado(x) se verifica si x es un cuadrado perfecto. Por ejemplo,
 #    esCuadrado(9)  ==  True
 #    esCuadrado(7)  ==  False
-def esCuadrado (x: int) -> bool:
-    return x == raizEntera(x) ** 2
+# Se definen en PotenciasPerfectas.
 
 def numeroDivisores2(x: int) -> int:
     if x == 1:
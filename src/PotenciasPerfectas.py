@@ -0,0 +1,333 @@
+# PotenciasPerfectas.py
+# Raíces enteras y reconocimiento de potencias perfectas.
+# José A. Alonso Jiménez <https://jaalonso.github.io>
+# Sevilla, 18-octubre-2026
+# ---------------------------------------------------------------------
+
+# ---------------------------------------------------------------------
+# Varios ejercicios calculan raíces cuadradas enteras por bisección
+# sobre el intervalo [1, x], lo que necesita unas log2(x) iteraciones
+# (con un producto de números grandes en cada una). En este módulo se
+# calculan con math.isqrt (para raíces cuadradas) y con el método de
+# Newton entero (para las demás), y se reconocen los cuadrados y las
+# potencias k-ésimas descartando primero con máscaras de residuos los
+# números que no lo pueden ser (la mayoría):
+# + un número que es un cuadrado es un residuo cuadrático módulo 64, 63,
+#   65 y 11 (y sólo lo son, respectivamente, 12, 16, 21 y 6 de los
+#   restos) y
+# + si k es primo y q es un primo congruente con 1 módulo k, una
+#   potencia k-ésima es una potencia k-ésima módulo q (y sólo lo son
+#   1+(q-1)/k de los restos).
+# Además, x sólo puede ser una potencia k-ésima si k divide a los
+# exponentes de sus factores primos pequeños.
+#
+# Definir las funciones
+#    raizEntera         : (int, int) -> int
+#    esCuadrado         : (int) -> bool
+#    potenciaPerfecta   : (int) -> Optional[tuple[int, int]]
+#    esPotenciaPerfecta : (int) -> bool
+# tales que
+# + raizEntera(x, k) es la raíz entera k-ésima de x (por defecto, k es
+#   2); es decir, el mayor número entero y tal que y^k <= x. Por
+#   ejemplo,
+#      raizEntera(26, 3)       ==  2
+#      raizEntera(27, 3)       ==  3
+#      raizEntera(10**50)      ==  10**25
+#      raizEntera(10**50 - 1)  ==  10**25 - 1
+# + esCuadrado(x) se verifica si x es un cuadrado perfecto. Por ejemplo,
+#      esCuadrado(10**46)      ==  True
+#      esCuadrado(10**46 + 1)  ==  False
+# + potenciaPerfecta(x) es el par (y,k) tal que x = y^k con k >= 2 lo
+#   mayor posible o None si x no es una potencia perfecta (como
+#   perfect_power de SymPy, 0 y 1 no se consideran potencias
+#   perfectas). Por ejemplo,
+#      potenciaPerfecta(64)        ==  (2, 6)
+#      potenciaPerfecta(3**100)    ==  (3, 100)
+#      potenciaPerfecta(6**15 + 1) ==  None
+# + esPotenciaPerfecta(x) se verifica si x es una potencia perfecta. Por
+#   ejemplo,
+#      esPotenciaPerfecta(10**18)  ==  True
+#      esPotenciaPerfecta(72)      ==  False
+# ---------------------------------------------------------------------
+
+from functools import lru_cache
+from math import gcd, isqrt, log2, prod
+from random import getrandbits, seed
+from timeit import Timer, default_timer
+from typing import Optional
+
+from hypothesis import given
+from hypothesis import strategies as st
+from sympy import isprime, perfect_power, primitive_root
+
+from src.CribaSegmentada import primosHasta
+
+def raizEntera(x: int, k: int = 2) -> int:
+    if x < 0 or k < 1:
+        raise ValueError(f'no se puede calcular la raíz {k}-ésima de {x}')
+    if k == 1:
+        return x
+    if k == 2:
+        return isqrt(x)
+    if k % 2 == 0:
+        return raizEntera(isqrt(x), k // 2)
+    n = x.bit_length()
+    if n <= k:
+        return min(x, 1)
+    # Método de Newton entero empezando por una cota superior de la
+    # raíz: los valores decrecen hasta llegar a la raíz entera.
+    y = 1 << -(-n // k)
+    while True:
+        z = ((k - 1) * y + x // y**(k - 1)) // k
+        if z >= y:
+            return y
+        y = z
+
+# mascara(q, k) es el número cuyo bit r-ésimo es 1 si r es una potencia
+# k-ésima módulo q. Por ejemplo,
+#    bin(mascara(5, 2))  ==  '0b10011'
+def mascara(q: int, k: int) -> int:
+    return sum(1 << r for r in {pow(y, k, q) for y in range(q)})
+
+# M64, M63, M65 y M11 son las máscaras de los residuos cuadráticos
+# módulo 64, 63, 65 y 11.
+(M64, M63, M65, M11) = (mascara(q, 2) for q in (64, 63, 65, 11))
+
+def esCuadrado(x: int) -> bool:
+    if x < 0 or not (M64 >> (x & 63)) & 1:
+        return False
+    r = x % (63 * 65 * 11)
+    if not (M63 >> (r % 63)) & (M65 >> (r % 65)) & (M11 >> (r % 11)) & 1:
+        return False
+    y = isqrt(x)
+    return y * y == x
+
+# mascaraDePotencias(q, k) es mascara(q, k), donde q es un primo
+# congruente con 1 módulo k. Se calcula sin recorrer todos los restos:
+# las potencias k-ésimas no nulas módulo q son las potencias de g^k,
+# donde g es una raíz primitiva módulo q. Por ejemplo,
+#    mascaraDePotencias(13, 3) == mascara(13, 3)  ==  0b1000100100011
+def mascaraDePotencias(q: int, k: int) -> int:
+    h = pow(primitive_root(q), k, q)
+    m = 1
+    r = 1
+    for _ in range((q - 1) // k):
+        m |= 1 << r
+        r = r * h % q
+    return m
+
+# filtros(k) es el par (Q, ms) con el que se descartan los números que
+# no son potencias k-ésimas, donde k es un primo impar: ms es la lista
+# de los pares (q, mascaraDePotencias(q, k)) para los tres menores
+# primos q congruentes con 1 módulo k y Q es el producto de dichos
+# primos (para calcular los restos módulo ellos a partir del resto
+# módulo Q). Por ejemplo,
+#    >>> filtros(3)[0]
+#    1729
+#    >>> [q for (q, _) in filtros(3)[1]]
+#    [7, 13, 19]
+@lru_cache(maxsize=None)
+def filtros(k: int) -> tuple[int, list[tuple[int, int]]]:
+    qs: list[int] = []
+    q = 2 * k + 1
+    while len(qs) < 3:
+        if isprime(q):
+            qs.append(q)
+        q += 2 * k
+    return (prod(qs), [(q, mascaraDePotencias(q, k)) for q in qs])
+
+# esPotencia(x, k) se verifica si x es una potencia k-ésima, donde k es
+# un primo. Si la raíz es menor que 2^30, se calcula con números
+# flotantes. Por ejemplo,
+#    esPotencia(3**21, 3)  ==  True
+#    esPotencia(3**21, 7)  ==  True
+#    esPotencia(3**21, 5)  ==  False
+def esPotencia(x: int, k: int) -> bool:
+    if k == 2:
+        return esCuadrado(x)
+    (q, ms) = filtros(k)
+    r = x % q
+    if any(not (m >> (r % q)) & 1 for (q, m) in ms):
+        return False
+    if x.bit_length() <= 30 * k:
+        return round(2 ** (log2(x) / k))**k == x
+    return raizEntera(x, k)**k == x
+
+# _exponentes es la lista cuyo único elemento es la última lista
+# calculada por exponentes.
+_exponentes: list[list[int]] = []
+
+# exponentes(n) es la lista de los primos menores o iguales que m, para
+# algún m >= n (las listas se guardan y cada nueva llega, al menos, al
+# doble que la anterior). Por ejemplo,
+#    exponentes(20)[:8]  ==  [2, 3, 5, 7, 11, 13, 17, 19]
+def exponentes(n: int) -> list[int]:
+    if not _exponentes or _exponentes[0][-1] < n:
+        _exponentes[:] = [primosHasta(max(n, 2 * _exponentes[0][-1]
+                                         if _exponentes else 1024))]
+    return _exponentes[0]
+
+# PEQUENOS es la lista de los primos menores que 2^8 y PRODUCTO es su
+# producto.
+PEQUENOS = primosHasta(2**8)
+PRODUCTO = prod(PEQUENOS)
+
+# multiplicidad(p, x) es el exponente del primo p en x (que es positivo).
+# Por ejemplo,
+#    multiplicidad(2, 48)  ==  4
+#    multiplicidad(5, 48)  ==  0
+def multiplicidad(p: int, x: int) -> int:
+    if p == 2:
+        return (x & -x).bit_length() - 1
+    e = 0
+    while x % p == 0:
+        x //= p
+        e += 1
+    return e
+
+# Si x = y^k, entonces k divide a los exponentes de los factores primos
+# de x. Por tanto, si g es el máximo común divisor de los exponentes de
+# los factores primos de x menores que 2^8, sólo hay que probar con los
+# divisores primos de g (y si g = 1, x no es una potencia perfecta). Si
+# x no tiene factores primos menores que 2^8, y tampoco los tiene, por
+# lo que y > 2^8 y sólo hay que probar con los k tales que 2^(8k) < x.
+def potenciaPerfecta(x: int) -> Optional[tuple[int, int]]:
+    if x < 2:
+        return None
+    r = x % PRODUCTO
+    g = 0
+    for p in PEQUENOS:
+        if r % p == 0:
+            g = gcd(g, multiplicidad(p, x))
+            if g == 1:
+                return None
+    n = x.bit_length()
+    for k in exponentes(n):
+        if k > (g or n // 8):
+            break
+        if g and g % k != 0:
+            continue
+        if esPotencia(x, k):
+            y = raizEntera(x, k)
+            z = potenciaPerfecta(y)
+            if z is None:
+                return (y, k)
+            return (z[0], z[1] * k)
+    return None
+
+def esPotenciaPerfecta(x: int) -> bool:
+    return potenciaPerfecta(x) is not None
+
+# Verificación
+# ============
+
+def test_PotenciasPerfectas() -> None:
+    assert raizEntera(26, 3) == 2
+    assert raizEntera(27, 3) == 3
+    assert raizEntera(10**50) == 10**25
+    assert raizEntera(10**50 - 1) == 10**25 - 1
+    assert raizEntera(10**60, 12) == 10**5
+    assert raizEntera(10**60 - 1, 12) == 10**5 - 1
+    assert [raizEntera(x, 5) for x in range(4)] == [0, 1, 1, 1]
+    assert esCuadrado(10**46)
+    assert not esCuadrado(10**46 + 1)
+    assert [x for x in range(50) if esCuadrado(x)] == [0, 1, 4, 9, 16, 25, 36, 49]
+    assert bin(mascara(5, 2)) == '0b10011'
+    assert mascaraDePotencias(13, 3) == mascara(13, 3) == 0b1000100100011
+    assert filtros(3)[0] == 1729
+    assert [q for (q, _) in filtros(3)[1]] == [7, 13, 19]
+    assert exponentes(20)[:8] == [2, 3, 5, 7, 11, 13, 17, 19]
+    assert multiplicidad(2, 48) == 4
+    assert multiplicidad(5, 48) == 0
+    assert esPotencia(3**21, 3)
+    assert esPotencia(3**21, 7)
+    assert not esPotencia(3**21, 5)
+    assert potenciaPerfecta(64) == (2, 6)
+    assert potenciaPerfecta(3**100) == (3, 100)
+    assert potenciaPerfecta(6**15 + 1) is None
+    assert esPotenciaPerfecta(10**18)
+    assert not esPotenciaPerfecta(72)
+    assert not esPotenciaPerfecta(1)
+    print("Verificado")
+
+# La verificación es
+#    >>> test_PotenciasPerfectas()
+#    Verificado
+
+# Comprobación de propiedades
+# ===========================
+
+# La propiedad de las raíces es
+@given(st.integers(min_value=0, max_value=2**3000),
+       st.integers(min_value=1, max_value=100))
+def test_raizEntera(x: int, k: int) -> None:
+    y = raizEntera(x, k)
+    assert y**k <= x < (y + 1)**k
+    assert esCuadrado(x) == (isqrt(x)**2 == x)
+
+# La propiedad de las potencias es
+@given(st.integers(min_value=0, max_value=10**6),
+       st.integers(min_value=1, max_value=40),
+       st.integers(min_value=-1, max_value=1))
+def test_potenciaPerfecta(y: int, k: int, d: int) -> None:
+    x = max(0, y**k + d)
+    r = perfect_power(x)
+    assert potenciaPerfecta(x) == (r if r else None)
+
+# La comprobación es
+#    > poetry run pytest -q PotenciasPerfectas.py
+#    3 passed in 9.88s
+
+# Comparación de eficiencia
+# =========================
+
+def tiempo(e: str) -> None:
+    """Tiempo (en segundos) de evaluar la expresión e."""
+    t = Timer(e, "", default_timer, globals()).timeit(1)
+    print(f"{t:0.2f} segundos")
+
+# aleatorios(n, b) es una lista de n números aleatorios de b bits
+# (siempre la misma).
+def aleatorios(n: int, b: int) -> list[int]:
+    seed(2026)
+    return [getrandbits(b) for _ in range(n)]
+
+# La comparación es
+#    >>> from src.Cuadrado_mas_cercano import raizEntera2
+#    >>> xs = aleatorios(10**6, 64)
+#    >>> ys = aleatorios(10**6, 1024)
+#
+#    >>> tiempo('[raizEntera2(x) for x in xs[:10**4]]')
+#    0.20 segundos
+#    >>> tiempo('[raizEntera(x) for x in xs]')
+#    0.18 segundos
+#    >>> tiempo('[raizEntera(x, 3) for x in xs]')
+#    2.20 segundos
+#    >>> tiempo('[isqrt(x)**2 == x for x in xs]')
+#    0.19 segundos
+#    >>> tiempo('[esCuadrado(x) for x in xs]')
+#    0.21 segundos
+#    >>> tiempo('[perfect_power(x) for x in xs]')
+#    6.94 segundos
+#    >>> tiempo('[esPotenciaPerfecta(x) for x in xs]')
+#    2.24 segundos
+#
+#    >>> tiempo('[raizEntera2(y) for y in ys[:10**4]]')
+#    12.12 segundos
+#    >>> tiempo('[raizEntera(y) for y in ys]')
+#    3.26 segundos
+#    >>> tiempo('[raizEntera(y, 3) for y in ys]')
+#    15.67 segundos
+#    >>> tiempo('[isqrt(y)**2 == y for y in ys]')
+#    3.65 segundos
+#    >>> tiempo('[esCuadrado(y) for y in ys]')
+#    0.46 segundos
+#    >>> tiempo('[perfect_power(y) for y in ys]')
+#    32.15 segundos
+#    >>> tiempo('[esPotenciaPerfecta(y) for y in ys]')
+#    10.17 segundos
+#
+# Es decir, con números de 64 bits la raíz por bisección es unas 100
+# veces más lenta que isqrt y con números de 1024 bits, unas 370. Las
+# máscaras de residuos apenas influyen con 64 bits, pero con 1024 bits
+# evitan calcular la raíz en casi todos los casos.
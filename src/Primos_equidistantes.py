@@ -19,12 +19,14 @@
 #    [(89, 97), (359, 367), (389, 397)]
 # ---------------------------------------------------------------------
 
-from itertools import chain, count, islice, tee
+from itertools import chain, count, islice, pairwise, tee
 from timeit import Timer, default_timer
 from typing import Iterator
 
 from sympy import isprime
 
+from src.CribaSegmentada import primos as primos3
+
 # 1ª solución
 # ===========
 
@@ -56,12 +58,20 @@ def primosEquidistantes2(k: int) -> Iterator[tuple[int,int]]:
     next(b, None)
     return ((x,y) for (x,y) in zip(a, b) if y - x == k)
 
+# 3ª solución
+# ===========
+
+# Se usa el generador de primos de CribaSegmentada.
+def primosEquidistantes3(k: int) -> Iterator[tuple[int,int]]:
+    return ((x,y) for (x,y) in pairwise(primos3()) if y - x == k)
+
 # Verificación
 # ============
 
 def test_primosEquidestantes() -> None:
     for primosEquidistantes in [primosEquidistantes1,
-                                primosEquidistantes2]:
+                                primosEquidistantes2,
+                                primosEquidistantes3]:
         assert list(islice(primosEquidistantes(2), 3)) == \
             [(3, 5), (5, 7), (11, 13)]
         assert list(islice(primosEquidistantes(4), 3)) == \
@@ -82,7 +92,8 @@ def test_primosEquidestantes() -> None:
 # La propiedad es
 def primosEquidistantes_equiv(n: int, k: int) -> bool:
     return list(islice(primosEquidistantes1(k), n)) == \
-           list(islice(primosEquidistantes2(k), n))
+           list(islice(primosEquidistantes2(k), n)) == \
+           list(islice(primosEquidistantes3(k), n))
 
 # La comprobación es
 #    >>> primosEquidistantes_equiv(100, 4)
@@ -98,6 +109,13 @@ def tiempo(e: str) -> None:
 
 # La comparación es
 #    >>> tiempo('list(islice(primosEquidistantes1(4), 300))')
-#    3.19 segundos
+#    4.19 segundos
 #    >>> tiempo('list(islice(primosEquidistantes2(4), 300))')
 #    0.01 segundos
+#    >>> tiempo('list(islice(primosEquidistantes3(4), 300))')
+#    0.00 segundos
+#
+#    >>> tiempo('list(islice(primosEquidistantes2(4), 10**5))')
+#    35.93 segundos
+#    >>> tiempo('list(islice(primosEquidistantes3(4), 10**5))')
+#    0.45 segundos
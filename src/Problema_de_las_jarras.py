@@ -41,7 +41,9 @@
 #    []
 # ---------------------------------------------------------------------
 
-from src.BusquedaEnAnchura import buscaAnchura
+from timeit import Timer, default_timer
+
+from src.BusquedaEnAnchura import buscaAnchura, buscaAnchuraPerezosa
 
 # Un problema es una lista de 3 números enteros (a,b,c) tales que a es
 # la capacidad de la primera jarra, b es la capacidad de la segunda
@@ -115,25 +117,57 @@ def sucesores(p: Problema, e: Estado) -> list[Estado]:
             for c in sucesorasConfiguracion(p, e[0])
             if c not in e]
 
-def jarras(p: Problema) -> list[Estado]:
+# 1ª solución
+# ===========
+
+def jarras1(p: Problema) -> list[Estado]:
     soluciones = buscaAnchura(lambda e: sucesores(p, e),
                               lambda e: esFinal(p, e),
                               inicial)
     return [list(reversed(e)) for e in soluciones]
 
+# 2ª solución
+# ===========
+
+# Se usa el generador buscaAnchuraPerezosa, que no copia la frontera en
+# cada paso.
+def jarras2(p: Problema) -> list[Estado]:
+    soluciones = buscaAnchuraPerezosa(lambda e: sucesores(p, e),
+                                      lambda e: esFinal(p, e),
+                                      inicial)
+    return [list(reversed(e)) for e in soluciones]
+
+def jarras(p: Problema) -> list[Estado]:
+    return jarras2(p)
+
 # Verificación
 # ============
 
 def test_jarras() -> None:
-    assert jarras((4,3,2))[:3] == \
-        [[(0, 0), (4, 0), (1, 3), (1, 0), (0, 1), (4, 1), (2, 3)],
-         [(0, 0), (0, 3), (3, 0), (3, 3), (4, 2), (0, 2), (2, 0)],
-         [(0, 0), (4, 0), (4, 3), (0, 3), (3, 0), (3, 3), (4, 2), (0, 2), (2, 0)]]
-    assert len(jarras((15,10,5))) == 8
-    assert [len(e) for e in jarras((15,10,5))] == [3, 5, 5, 7, 7, 7, 8, 9]
-    assert jarras((15,10,4)) == []
+    for jarras_ in [jarras1, jarras2]:
+        assert jarras_((4,3,2))[:3] == \
+            [[(0, 0), (4, 0), (1, 3), (1, 0), (0, 1), (4, 1), (2, 3)],
+             [(0, 0), (0, 3), (3, 0), (3, 3), (4, 2), (0, 2), (2, 0)],
+             [(0, 0), (4, 0), (4, 3), (0, 3), (3, 0), (3, 3), (4, 2), (0, 2), (2, 0)]]
+        assert len(jarras_((15,10,5))) == 8
+        assert [len(e) for e in jarras_((15,10,5))] == [3, 5, 5, 7, 7, 7, 8, 9]
+        assert jarras_((15,10,4)) == []
     print("Verificado")
 
 # La verificación es
 #    >>> test_jarras()
 #    Verificado
+
+# Comparación de eficiencia
+# =========================
+
+def tiempo(e: str) -> None:
+    """Tiempo (en segundos) de evaluar la expresión e."""
+    t = Timer(e, "", default_timer, globals()).timeit(1)
+    print(f"{t:0.2f} segundos")
+
+# La comparación es
+#    >>> tiempo('jarras1((13,7,2))')
+#    2.70 segundos
+#    >>> tiempo('jarras2((13,7,2))')
+#    0.00 segundos
@@ -0,0 +1,192 @@
+# ProgramacionDinamica.py
+# Esquema de programación dinámica.
+# José A. Alonso Jiménez <https://jaalonso.github.io>
+# Sevilla, 18-octubre-2026
+# ---------------------------------------------------------------------
+
+# ---------------------------------------------------------------------
+# La técnica de programación dinámica resuelve un problema a partir de
+# las soluciones de sus subproblemas, guardándolas en una tabla para no
+# calcularlas más de una vez. Se consideran problemas cuyos
+# subproblemas se indexan por pares (i,j) de números naturales (los
+# de una dimensión usan sólo j = 0) y cuya solución viene dada por una
+# recurrencia
+#    f : (Callable[[int, int], S], int, int) -> S
+# tal que f(v, i, j) es el valor de la posición (i,j) calculado a partir
+# de los valores v(i',j') de otras posiciones.
+#
+# Hay dos formas de evaluar la recurrencia:
+# + descendente(f, i, j, memoria) calcula el valor de (i,j) por
+#   recursión, guardando los valores calculados en un diccionario. Si
+#   memoria no es None, se guardan a lo sumo memoria valores
+#   (descartando los menos usados recientemente), por lo que algunos
+#   se pueden volver a calcular.
+# + ascendente(f, n, m, ventana, tabla, defecto) calcula por filas
+#   (de la 0 a la n-1 y, en cada fila, de la columna 0 a la m-1) los
+#   valores de las posiciones, suponiendo que cada valor sólo depende
+#   de los ya calculados en su fila o en las ventana-1 filas
+#   anteriores (si se consulta una fila anterior a ellas o posterior a
+#   la actual, se produce un IndexError). Sólo se guardan las últimas
+#   ventana filas (o todas, si ventana es None), que es lo que
+#   devuelve. Las filas pueden ser listas, diccionarios o vectores de
+#   NumPy (según que tabla sea 'lista', 'diccionario' o 'numpy') y las
+#   posiciones no calculadas tienen el valor defecto. En lugar del
+#   número de columnas, m puede ser la función que a cada fila le
+#   asigna las columnas que se calculan en ella.
+#
+# Por ejemplo, con la recurrencia de los números de Fibonacci
+#    >>> def fib(v, i, _): return i if i < 2 else v(i-1, 0) + v(i-2, 0)
+#    >>> descendente(fib, 30, 0)
+#    832040
+#    >>> ascendente(fib, 31, 1, ventana=3)[-1][0]
+#    832040
+# y con la de los coeficientes binomiales,
+#    >>> def binomial(v, i, j):
+#    ...     return 1 if j in (0, i) else v(i-1, j-1) + v(i-1, j)
+#    >>> ascendente(binomial, 5, lambda i: range(i + 1), ventana=None)
+#    [[1, 0, 0, 0, 0], [1, 1, 0, 0, 0], [1, 2, 1, 0, 0],
+#     [1, 3, 3, 1, 0], [1, 4, 6, 4, 1]]
+#    >>> ascendente(binomial, 5, lambda i: range(i + 1), tabla='diccionario')
+#    [{0: 1, 1: 3, 2: 3, 3: 1}, {0: 1, 1: 4, 2: 6, 3: 4, 4: 1}]
+#    >>> ascendente(binomial, 5, lambda i: range(i + 1), tabla='numpy',
+#    ...            tipo=int)[-1]
+#    array([1, 4, 6, 4, 1])
+# ---------------------------------------------------------------------
+
+from collections import OrderedDict
+from sys import setrecursionlimit
+from typing import Any, Callable, Optional, TypeVar, Union
+
+import numpy as np
+
+setrecursionlimit(10**6)
+
+S = TypeVar('S')
+
+Consulta = Callable[[int, int], S]
+Recurrencia = Callable[[Consulta[S], int, int], S]
+Columnas = Union[int, Callable[[int], range]]
+
+# 1ª forma: descendente (por recursión con memoria)
+# =================================================
+
+def descendente(f: Recurrencia[S],
+                i: int,
+                j: int,
+                memoria: Optional[int] = None) -> S:
+    q: OrderedDict[tuple[int, int], S] = OrderedDict()
+
+    def v(i: int, j: int) -> S:
+        p = (i, j)
+        if p in q:
+            if memoria is not None:
+                q.move_to_end(p)
+            return q[p]
+        x = f(v, i, j)
+        q[p] = x
+        if memoria is not None and len(q) > memoria:
+            q.popitem(last=False)
+        return x
+
+    return v(i, j)
+
+# 2ª forma: ascendente (por filas)
+# ================================
+
+# FilaDiccionario es la clase de los diccionarios que devuelven defecto
+# para las claves que no tienen (sin añadirlas).
+class FilaDiccionario(dict[int, Any]):
+    def __init__(self, defecto: Any) -> None:
+        super().__init__()
+        self.defecto = defecto
+
+    def __missing__(self, _: int) -> Any:
+        return self.defecto
+
+# nuevaFila(tabla, m, defecto, tipo) es una fila con m posiciones con
+# valor defecto, representada según tabla. Por ejemplo,
+#    >>> nuevaFila('lista', 3, 0)
+#    [0, 0, 0]
+#    >>> nuevaFila('diccionario', 3, 0)
+#    {}
+#    >>> nuevaFila('numpy', 3, 0, np.int64)
+#    array([0, 0, 0])
+def nuevaFila(tabla: str, m: int, defecto: Any, tipo: Any = object) -> Any:
+    if tabla == 'lista':
+        return [defecto] * m
+    if tabla == 'diccionario':
+        return FilaDiccionario(defecto)
+    if tabla == 'numpy':
+        return np.full(m, defecto, dtype=tipo)
+    raise ValueError(f'tabla desconocida: {tabla}')
+
+def ascendente(f: Recurrencia[S],
+               n: int,
+               m: Columnas,
+               ventana: Optional[int] = 2,
+               tabla: str = 'lista',
+               defecto: Any = 0,
+               tipo: Any = object) -> list[Any]:
+    w = n if ventana is None else ventana
+    if n == 0:
+        return []
+    if w < 1:
+        raise ValueError(f'ventana no válida: {ventana}')
+    columnas = (lambda _: range(m)) if isinstance(m, int) else m
+    ancho = m if isinstance(m, int) else \
+        max((c.stop for c in map(columnas, range(n))), default=0)
+    filas: list[Any] = [None] * w
+    # actual es el índice de la fila que se está calculando.
+    actual = 0
+
+    def v(i: int, j: int) -> S:
+        if not actual - w < i <= actual:
+            raise IndexError(f'fila {i} fuera de la ventana de la {actual}')
+        return filas[i % w][j]
+
+    for actual in range(n):
+        filas[actual % w] = nuevaFila(tabla, ancho, defecto, tipo)
+        for j in columnas(actual):
+            filas[actual % w][j] = f(v, actual, j)
+    return [filas[i % w] for i in range(max(0, n - w), n)]
+
+# Verificación
+# ============
+
+def test_ProgramacionDinamica() -> None:
+    def fib(v: Consulta[int], i: int, _: int) -> int:
+        return i if i < 2 else v(i-1, 0) + v(i-2, 0)
+
+    def binomial(v: Consulta[int], i: int, j: int) -> int:
+        return 1 if j in (0, i) else v(i-1, j-1) + v(i-1, j)
+
+    assert descendente(fib, 30, 0) == 832040
+    assert descendente(fib, 30, 0, memoria=3) == 832040
+    assert ascendente(fib, 31, 1, ventana=3)[-1][0] == 832040
+    assert ascendente(fib, 31, 1, ventana=3, tabla='numpy',
+                      tipo=np.int64)[-1][0] == 832040
+    assert ascendente(binomial, 5, lambda i: range(i + 1), ventana=None) == \
+        [[1, 0, 0, 0, 0], [1, 1, 0, 0, 0], [1, 2, 1, 0, 0],
+         [1, 3, 3, 1, 0], [1, 4, 6, 4, 1]]
+    assert ascendente(binomial, 5, lambda i: range(i + 1),
+                      tabla='diccionario') == \
+        [{0: 1, 1: 3, 2: 3, 3: 1}, {0: 1, 1: 4, 2: 6, 3: 4, 4: 1}]
+    assert ascendente(binomial, 5, lambda i: range(i + 1), tabla='numpy',
+                      tipo=int)[-1].tolist() == [1, 4, 6, 4, 1]
+    assert descendente(binomial, 40, 20, memoria=100) == 137846528820
+    assert nuevaFila('lista', 3, 0) == [0, 0, 0]
+    assert nuevaFila('diccionario', 3, 0) == {}
+    assert ascendente(fib, 0, 1) == []
+    # Con la ventana por defecto (2), fib consulta una fila que ya no
+    # se guarda.
+    try:
+        ascendente(fib, 31, 1)
+    except IndexError:
+        pass
+    else:
+        raise AssertionError('no se detecta la consulta fuera de la ventana')
+    print("Verificado")
+
+# La verificación es
+#    >>> test_ProgramacionDinamica()
+#    Verificado
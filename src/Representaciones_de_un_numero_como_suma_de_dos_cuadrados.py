@@ -27,6 +27,9 @@ from hypothesis import given
 from hypothesis import strategies as st
 from sympy import factorint
 
+from src.PotenciasPerfectas import esCuadrado, raizEntera
+from src.SumasDeDosCuadrados import sumasDeDosCuadrados
+
 # 1ª solución
 # ===========
 
@@ -36,27 +39,14 @@ def representaciones1(n: int) -> list[tuple[int, int]]:
 # 2ª solución
 # ===========
 
-# raiz(x) es la raíz cuadrada entera de x. Por ejemplo,
+# raiz(x) es la raíz cuadrada entera de x (calculada con raizEntera de
+# PotenciasPerfectas). Por ejemplo,
 #    raiz(25)     ==  5
 #    raiz(24)     ==  4
 #    raiz(26)     ==  5
 #    raiz(10**46) == 100000000000000000000000
 def raiz(x: int) -> int:
-    def aux(a: int, b: int) -> int:
-        c = (a+b) // 2
-        d = c**2
-        if d == x:
-            return c
-        if c == a:
-            return a
-        if d < x:
-            return aux (c,b)
-        return aux (a,c)
-    if x == 0:
-        return 0
-    if x == 1:
-        return 1
-    return aux(0, x)
+    return raizEntera(x)
 
 # Nota. La siguiente definición de raíz cuadrada entera falla para
 # números grandes. Por ejemplo,
@@ -71,9 +61,7 @@ def raiz2(x: int) -> int:
 #    esCuadrado(26)     == False
 #    esCuadrado(10**46) == True
 #    esCuadrado(10**47) == False
-def esCuadrado(x: int) -> bool:
-    y = raiz(x)
-    return x == y * y
+# Se define en PotenciasPerfectas.
 
 def representaciones2(n: int) -> list[tuple[int, int]]:
     r: list[tuple[int, int]] = []
@@ -95,6 +83,15 @@ def representaciones3(n: int) -> list[tuple[int, int]]:
             r.append((x, z))
     return r
 
+# 4ª solución
+# ===========
+
+# Usando la factorización de n en los enteros de Gauss (ver
+# SumasDeDosCuadrados).
+
+def representaciones4(n: int) -> list[tuple[int, int]]:
+    return sumasDeDosCuadrados(n)
+
 # Verificación
 # ============
 
@@ -108,6 +105,9 @@ def test_representaciones() -> None:
     assert representaciones3(20) == [(2,4)]
     assert representaciones3(25) == [(0,5),(3,4)]
     assert representaciones3(325) == [(1,18),(6,17),(10,15)]
+    assert representaciones4(20) == [(2,4)]
+    assert representaciones4(25) == [(0,5),(3,4)]
+    assert representaciones4(325) == [(1,18),(6,17),(10,15)]
     print("Verificado")
 
 # La comprobación es
@@ -123,6 +123,7 @@ def test_representaciones_equiv(x: int) -> None:
     xs = representaciones1(x)
     assert representaciones2(x) == xs
     assert representaciones3(x) == xs
+    assert representaciones4(x) == xs
 
 # La comprobación es
 #    >>> test_representaciones_equiv()
@@ -143,11 +144,18 @@ def tiempo(e: str) -> None:
 #    0.00 segundos
 #    >>> tiempo('representaciones3(5000)')
 #    0.00 segundos
+#    >>> tiempo('representaciones4(5000)')
+#    0.00 segundos
 #
 #    >>> tiempo('len(representaciones2(10**12))')
-#    11.54 segundos
+#    0.26 segundos
 #    >>> tiempo('len(representaciones3(10**12))')
-#    12.08 segundos
+#    0.31 segundos
+#    >>> tiempo('len(representaciones4(10**12))')
+#    0.00 segundos
+#
+#    >>> tiempo('len(representaciones4(10**36))')
+#    0.00 segundos
 
 # Comprobación de la propiedad
 # ============================
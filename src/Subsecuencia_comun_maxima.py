@@ -35,6 +35,9 @@
 from sys import setrecursionlimit
 from timeit import Timer, default_timer
 
+from src.AlineamientoSCM import (alineamientoHirschberg,
+                                 alineamientoHuntSzymanski, comunes)
+
 setrecursionlimit(10**6)
 
 # 1ª definición (por recursión)
@@ -100,6 +103,18 @@ def matrizSCM2(xs: str, ys: str) -> list[list[str]]:
                 q[i][j] = mayor(q[i - 1][j], q[i][j - 1])
     return q
 
+# 3ª definición (con el algoritmo de Hirschberg)
+# ==============================================
+
+def scm3(xs: str, ys: str) -> str:
+    return "".join(comunes(alineamientoHirschberg(xs, ys)))
+
+# 4ª definición (con el algoritmo de Hunt y Szymanski)
+# ====================================================
+
+def scm4(xs: str, ys: str) -> str:
+    return "".join(comunes(alineamientoHuntSzymanski(xs, ys)))
+
 # # Comparación de eficiencia
 # # =========================
 
@@ -113,6 +128,17 @@ def tiempo(e: str) -> None:
 #    8.44 segundos
 #    >>> tiempo('scm2(["1","3"]*9, ["2","3"]*9)')
 #    0.00 segundos
+#    >>> tiempo('scm3(["1","3"]*9, ["2","3"]*9)')
+#    0.00 segundos
+#    >>> tiempo('scm4(["1","3"]*9, ["2","3"]*9)')
+#    0.00 segundos
+#
+#    >>> tiempo('scm2(["1","3"]*1000, ["2","3"]*1000)')
+#    1.89 segundos
+#    >>> tiempo('scm3(["1","3"]*1000, ["2","3"]*1000)')
+#    0.95 segundos
+#    >>> tiempo('scm4(["1","3"]*1000, ["2","3"]*1000)')
+#    0.44 segundos
 
 # Verificación
 # ============
@@ -124,6 +150,12 @@ def test_scm() -> None:
     assert scm2("amapola", "matamoscas") == "amoa"
     assert scm2("atamos", "matamoscas")  == "atamos"
     assert scm2("aaa", "bbbb")           == ""
+    assert scm3("amapola", "matamoscas") == "maoa"
+    assert scm3("atamos", "matamoscas")  == "atamos"
+    assert scm3("aaa", "bbbb")           == ""
+    assert scm4("amapola", "matamoscas") == "maoa"
+    assert scm4("atamos", "matamoscas")  == "atamos"
+    assert scm4("aaa", "bbbb")           == ""
     print("Verificado")
 
 # La verificación es
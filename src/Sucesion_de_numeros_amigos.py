@@ -30,6 +30,8 @@ from typing import Iterator
 
 from sympy import divisor_sigma, factorint, proper_divisors
 
+from src.TablasAritmeticas import tabla
+
 # 1ª solución
 # ===========
 
@@ -106,12 +108,28 @@ def sucesionAmigos4() -> Iterator[tuple[int, int]]:
     return ((x,y) for x in count(2)
             if (y := sumaDivisoresPropios4(x)) > x and sumaDivisoresPropios4(y) == x)
 
+# 5ª solución
+# ===========
+
+# sumaDivisoresPropios5(x) es la suma de los divisores propios de x,
+# calculada con la tabla de la suma de divisores de
+# TablasAritmeticas. Por ejemplo,
+#    sumaDivisoresPropios5(220)  ==  284
+#    sumaDivisoresPropios5(284)  ==  220
+def sumaDivisoresPropios5(x: int) -> int:
+    return tabla(x).sumaDivisores.item(x) - x
+
+def sucesionAmigos5() -> Iterator[tuple[int, int]]:
+    return ((x,y) for x in count(2)
+            if (y := sumaDivisoresPropios5(x)) > x and sumaDivisoresPropios5(y) == x)
+
 # Verificación
 # ============
 
 def test_sucesionAmigos() -> None:
     for sucesionAmigos in [sucesionAmigos1, sucesionAmigos2,
-                           sucesionAmigos3, sucesionAmigos4]:
+                           sucesionAmigos3, sucesionAmigos4,
+                           sucesionAmigos5]:
         assert list(islice(sucesionAmigos(), 4)) ==\
             [(220, 284), (1184, 1210), (2620, 2924), (5020, 5564)]
     print("Verificado")
@@ -137,8 +155,12 @@ def tiempo(e: str) -> None:
 #    0.08 segundos
 #    >>> tiempo('list(islice(sucesionAmigos4(), 6))')
 #    0.79 segundos
+#    >>> tiempo('list(islice(sucesionAmigos5(), 6))')
+#    0.03 segundos
 #
 #    >>> tiempo('list(islice(sucesionAmigos2(), 14))')
 #    1.59 segundos
 #    >>> tiempo('list(islice(sucesionAmigos3(), 14))')
 #    0.96 segundos
+#    >>> tiempo('list(islice(sucesionAmigos5(), 14))')
+#    0.33 segundos
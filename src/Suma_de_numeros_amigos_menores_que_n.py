@@ -28,10 +28,13 @@ from operator import mul
 from timeit import Timer, default_timer
 from typing import Iterator
 
+import numpy as np
 from hypothesis import given
 from hypothesis import strategies as st
 from sympy import divisor_sigma, factorint, proper_divisors
 
+from src.TablasAritmeticas import tabla
+
 # 1ª solución
 # ===========
 
@@ -140,12 +143,33 @@ def amigosMenores4(n: int) -> list[tuple[int, int]]:
 def sumaAmigosMenores4(n: int) -> int:
     return sum(x + y for x, y in amigosMenores4(n))
 
+# 5ª solución
+# ===========
+
+# En esta solución se calculan a la vez, con la tabla de la suma de
+# divisores de TablasAritmeticas, las sumas de los divisores propios
+# de todos los números menores que n (y, para comprobar si son
+# amigos, las de dichas sumas).
+def amigosMenores5(n: int) -> list[tuple[int, int]]:
+    xs = np.arange(2, max(2, n))
+    ys = tabla(n).sumaDivisores[xs] - xs
+    mayores = ys > xs
+    (xs, ys) = (xs[mayores], ys[mayores])
+    sumas = tabla(int(ys.max(initial=0))).sumaDivisores
+    amigos = sumas[ys] - ys == xs
+    pares = zip(xs[amigos].tolist(), ys[amigos].tolist())
+    return list(takewhile(lambda par: par[1] < n, pares))
+
+def sumaAmigosMenores5(n: int) -> int:
+    return sum(x + y for x, y in amigosMenores5(n))
+
 # Verificación
 # ============
 
 def test_sumaAmigosMenores() -> None:
     for sumaAmigosMenores in [sumaAmigosMenores1, sumaAmigosMenores2,
-                           sumaAmigosMenores3, sumaAmigosMenores4]:
+                           sumaAmigosMenores3, sumaAmigosMenores4,
+                           sumaAmigosMenores5]:
         assert sumaAmigosMenores(2000)  == 2898
     print("Verificado")
 
@@ -163,6 +187,7 @@ def test_sumaAmigosMenores_equiv(n: int) -> None:
     assert sumaAmigosMenores2(n) == r
     assert sumaAmigosMenores3(n) == r
     assert sumaAmigosMenores4(n) == r
+    assert sumaAmigosMenores5(n) == r
 
 # La comprobación es
 #    >>> test_sumaAmigosMenores_equiv()
@@ -192,3 +217,10 @@ def tiempo(e: str) -> None:
 #    1.61 segundos
 #    >>> tiempo('sumaAmigosMenores3(90000)')
 #    0.93 segundos
+#    >>> tiempo('sumaAmigosMenores5(90000)')
+#    0.00 segundos
+#
+#    >>> tiempo('sumaAmigosMenores3(10**6)')
+#    17.97 segundos
+#    >>> tiempo('sumaAmigosMenores5(10**6)')
+#    1.44 segundos
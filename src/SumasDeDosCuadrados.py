@@ -0,0 +1,297 @@
+# SumasDeDosCuadrados.py
+# Representaciones como suma de dos cuadrados mediante enteros de Gauss.
+# José A. Alonso Jiménez <https://jaalonso.github.io>
+# Sevilla, 18-octubre-2026
+# ---------------------------------------------------------------------
+
+# ---------------------------------------------------------------------
+# Las representaciones de n como suma de dos cuadrados, n = x² + y²,
+# se corresponden con los enteros de Gauss x+yi de norma n. Por tanto,
+# se pueden obtener a partir de la factorización de n:
+# + si algún primo p congruente con 3 módulo 4 tiene exponente impar,
+#   n no tiene representaciones;
+# + cada primo p congruente con 1 módulo 4 es suma de dos cuadrados,
+#   p = a² + b², y se descompone en los enteros de Gauss como
+#   p = (a+bi)(a-bi); y
+# + los enteros de Gauss de norma n son (salvo unidades) los productos
+#   de (1+i)^e (si 2^e es la potencia de 2 en n), de q^(e/2) (por cada
+#   primo q ≡ 3 (mod 4) con exponente e) y, por cada primo p ≡ 1
+#   (mod 4) con exponente e, de (a+bi)^k·(a-bi)^(e-k) con 0 <= k <= e.
+# La descomposición de cada primo p ≡ 1 (mod 4) se calcula con el
+# algoritmo de Hermite-Serret: si t² ≡ -1 (mod p), el primer resto
+# menor que la raíz cuadrada de p del algoritmo de Euclides aplicado a
+# p y t es a. La factorización de n se calcula con la tabla de menores
+# factores primos de CribaDeFactores (y el método rho de Pollard para
+# los factores grandes).
+#
+# Definir las funciones
+#    descomposicion      : (int) -> tuple[int, int]
+#    sumasDeDosCuadrados : (int) -> list[tuple[int, int]]
+#    r2                  : (int) -> int
+#    r2Intervalo         : (int, int) -> npt.NDArray[np.int64]
+# tales que
+# + descomposicion(p) es el par (a,b) de naturales tales que a <= b y
+#   p = a² + b², donde p es 2 o un primo congruente con 1 módulo 4 (si
+#   no lo es, se produce un ValueError). Por ejemplo,
+#      descomposicion(13)                ==  (2, 3)
+#      descomposicion(1000000000100077)  ==  (21441714, 23243341)
+# + sumasDeDosCuadrados(n) es la lista de los pares (x,y) de números
+#   naturales tales que x <= y y n = x² + y². Por ejemplo,
+#      sumasDeDosCuadrados(25)          ==  [(0, 5), (3, 4)]
+#      sumasDeDosCuadrados(325)         ==  [(1, 18), (6, 17), (10, 15)]
+#      len(sumasDeDosCuadrados(10**18)) ==  10
+# + r2(n) es el número de pares (x,y) de números enteros tales que
+#   n = x² + y². Por ejemplo,
+#      r2(25)     ==  12
+#      r2(10**18) ==  76
+# + r2Intervalo(a, b) es el vector de los valores de r2 en los números
+#   de a hasta b (excluido). Por ejemplo,
+#      >>> r2Intervalo(0, 11).tolist()
+#      [1, 4, 4, 0, 4, 8, 0, 0, 4, 4, 8]
+# ---------------------------------------------------------------------
+
+from math import isqrt, prod
+from timeit import Timer, default_timer
+
+import numpy as np
+import numpy.typing as npt
+from hypothesis import given, settings
+from hypothesis import strategies as st
+from sympy import isprime
+
+from src.CribaDeFactores import factoriza
+from src.CribaSegmentada import primosHasta
+
+# Los enteros de Gauss x+yi se representan por los pares (x, y).
+Gauss = tuple[int, int]
+
+# producto(z, w) es el producto de los enteros de Gauss z y w. Por
+# ejemplo,
+#    producto((2, 3), (2, -3))  ==  (13, 0)
+def producto(z: Gauss, w: Gauss) -> Gauss:
+    (a, b) = z
+    (c, d) = w
+    return (a * c - b * d, a * d + b * c)
+
+# potencias(z, e) es la lista [z^0, z^1, ..., z^e]. Por ejemplo,
+#    potencias((1, 1), 3)  ==  [(1, 0), (1, 1), (0, 2), (-2, 2)]
+def potencias(z: Gauss, e: int) -> list[Gauss]:
+    r = [(1, 0)]
+    for _ in range(e):
+        r.append(producto(r[-1], z))
+    return r
+
+# raizDeMenosUno(p) es un t tal que t² ≡ -1 (mod p), donde p es un
+# primo congruente con 1 módulo 4. Se calcula como c^((p-1)/4) para el
+# menor c que no es residuo cuadrático módulo p. Por ejemplo,
+#    raizDeMenosUno(13)  ==  8
+def raizDeMenosUno(p: int) -> int:
+    c = 2
+    while pow(c, (p - 1) // 2, p) != p - 1:
+        c += 1
+    return pow(c, (p - 1) // 4, p)
+
+def descomposicion(p: int) -> tuple[int, int]:
+    if p == 2:
+        return (1, 1)
+    if p % 4 != 1:
+        raise ValueError(f'{p} no es suma de dos cuadrados')
+    if not isprime(p):
+        raise ValueError(f'{p} no es primo')
+    (a, b) = (p, raizDeMenosUno(p))
+    while b * b > p:
+        (a, b) = (b, a % b)
+    c = isqrt(p - b * b)
+    return (min(b, c), max(b, c))
+
+def sumasDeDosCuadrados(n: int) -> list[tuple[int, int]]:
+    if n == 0:
+        return [(0, 0)]
+    factores = factoriza(n)
+    if any(p % 4 == 3 and e % 2 == 1 for (p, e) in factores.items()):
+        return []
+    # zs es la lista de los enteros de Gauss de norma n, salvo unidades.
+    comun = producto(potencias((1, 1), factores.get(2, 0))[-1],
+                     (prod(q**(e // 2) for (q, e) in factores.items()
+                           if q % 4 == 3), 0))
+    zs = [comun]
+    for (p, e) in factores.items():
+        if p % 4 == 1:
+            (a, b) = descomposicion(p)
+            us = potencias((a, b), e)
+            vs = potencias((a, -b), e)
+            ws = [producto(us[k], vs[e - k]) for k in range(e + 1)]
+            zs = [producto(z, w) for z in zs for w in ws]
+    return sorted({(min(abs(x), abs(y)), max(abs(x), abs(y)))
+                   for (x, y) in zs})
+
+def r2(n: int) -> int:
+    if n == 0:
+        return 1
+    r = 4
+    for (p, e) in factoriza(n).items():
+        if p % 4 == 1:
+            r *= e + 1
+        elif p % 4 == 3 and e % 2 == 1:
+            return 0
+    return r
+
+# r2PorPuntos(a, b) es r2Intervalo(a, b) calculado recorriendo los
+# puntos (x,y) con x, y >= 0 y a <= x²+y² < b: para cada x se suman a la
+# vez (con NumPy) los puntos de la columna x, contando cada uno tantas
+# veces como puntos de coordenadas enteras se obtienen cambiando los
+# signos de x e y. Por ejemplo,
+#    >>> r2PorPuntos(20, 26).tolist()
+#    [8, 0, 0, 0, 0, 12]
+def r2PorPuntos(a: int, b: int) -> npt.NDArray[np.int64]:
+    r = np.zeros(max(b - a, 0), dtype=np.int64)
+    if b <= a:
+        return r
+    for x in range(isqrt(b - 1) + 1):
+        m = a - x * x
+        y0 = isqrt(m - 1) + 1 if m > 0 else 0
+        ys = np.arange(y0, isqrt(b - 1 - x * x) + 1, dtype=np.int64)
+        pesos = np.where(ys == 0, 1, 2) * (1 if x == 0 else 2)
+        r[x * x + ys * ys - a] += pesos
+    return r
+
+# r2PorCriba(a, b) es r2Intervalo(a, b) calculado con una criba sobre
+# los números de a hasta b: para cada primo p menor o igual que la raíz
+# cuadrada de b-1 se calcula el exponente e de p en cada uno de sus
+# múltiplos y se multiplica su valor por e+1 (si p ≡ 1 (mod 4)) o por
+# 0 (si p ≡ 3 (mod 4) y e es impar); lo que queda de cada número es 1
+# o un primo (con exponente 1). Por ejemplo,
+#    >>> r2PorCriba(20, 26).tolist()
+#    [8, 0, 0, 0, 0, 12]
+def r2PorCriba(a: int, b: int) -> npt.NDArray[np.int64]:
+    if b <= a:
+        return np.zeros(0, dtype=np.int64)
+    if a == 0:
+        return np.concatenate(([1], r2PorCriba(1, b)))
+    r = np.full(b - a, 4, dtype=np.int64)
+    resto = np.arange(a, b, dtype=np.int64)
+    for p in primosHasta(isqrt(b - 1)):
+        multiplos = slice(-a % p, b - a, p)
+        cocientes = resto[multiplos] // p
+        es = np.ones(len(cocientes), dtype=np.int64)
+        divisibles = np.flatnonzero(cocientes % p == 0)
+        while divisibles.size:
+            es[divisibles] += 1
+            cocientes[divisibles] //= p
+            divisibles = divisibles[cocientes[divisibles] % p == 0]
+        resto[multiplos] = cocientes
+        if p % 4 == 1:
+            r[multiplos] *= es + 1
+        elif p % 4 == 3:
+            r[multiplos] *= es % 2 == 0
+    r[(resto > 1) & (resto % 4 == 1)] *= 2
+    r[resto % 4 == 3] = 0
+    return r
+
+# r2Intervalo(a, b) usa r2PorPuntos si el número de columnas que se
+# recorren (la raíz cuadrada de b) es menor que la longitud del
+# intervalo y r2PorCriba en caso contrario.
+def r2Intervalo(a: int, b: int) -> npt.NDArray[np.int64]:
+    if isqrt(max(b, 0)) < b - a:
+        return r2PorPuntos(a, b)
+    return r2PorCriba(a, b)
+
+# Verificación
+# ============
+
+def test_SumasDeDosCuadrados() -> None:
+    assert producto((2, 3), (2, -3)) == (13, 0)
+    assert potencias((1, 1), 3) == [(1, 0), (1, 1), (0, 2), (-2, 2)]
+    assert raizDeMenosUno(13) == 8
+    assert descomposicion(13) == (2, 3)
+    assert descomposicion(1000000000100077) == (21441714, 23243341)
+    # Los compuestos congruentes con 1 módulo 4 no se descomponen.
+    for n in [9, 25]:
+        try:
+            descomposicion(n)
+        except ValueError:
+            pass
+        else:
+            raise AssertionError(f'se descompone {n}')
+    assert sumasDeDosCuadrados(25) == [(0, 5), (3, 4)]
+    assert sumasDeDosCuadrados(325) == [(1, 18), (6, 17), (10, 15)]
+    assert sumasDeDosCuadrados(21) == []
+    assert sumasDeDosCuadrados(100000147984) == [(0, 316228)]
+    assert len(sumasDeDosCuadrados(10**18)) == 10
+    assert r2(25) == 12
+    assert r2(10**18) == 76
+    assert r2Intervalo(0, 11).tolist() == [1, 4, 4, 0, 4, 8, 0, 0, 4, 4, 8]
+    assert r2PorPuntos(20, 26).tolist() == [8, 0, 0, 0, 0, 12]
+    assert r2PorCriba(20, 26).tolist() == [8, 0, 0, 0, 0, 12]
+    assert r2PorCriba(0, 11).tolist() == [1, 4, 4, 0, 4, 8, 0, 0, 4, 4, 8]
+    print("Verificado")
+
+# La verificación es
+#    >>> test_SumasDeDosCuadrados()
+#    Verificado
+
+# Comprobación de propiedades
+# ===========================
+
+# sumasDeDosCuadradosDirecta(n) es la lista de las representaciones de
+# n como suma de dos cuadrados, calculada probando con cada x <= y.
+def sumasDeDosCuadradosDirecta(n: int) -> list[tuple[int, int]]:
+    return [(x, isqrt(n - x * x)) for x in range(isqrt(n // 2) + 1)
+            if isqrt(n - x * x)**2 == n - x * x]
+
+# La propiedad es
+@given(st.integers(min_value=0, max_value=10**6))
+def test_sumasDeDosCuadrados(n: int) -> None:
+    r = sumasDeDosCuadrados(n)
+    assert r == sumasDeDosCuadradosDirecta(n)
+    assert r2(n) == sum(8 if 0 < x < y else 4 if n > 0 else 1
+                        for (x, y) in r)
+
+# La propiedad del cálculo por intervalos es
+@settings(deadline=None)
+@given(st.integers(min_value=0, max_value=10**6),
+       st.integers(min_value=0, max_value=300))
+def test_r2Intervalo(a: int, k: int) -> None:
+    r = [r2(n) for n in range(a, a + k)]
+    assert r2PorPuntos(a, a + k).tolist() == r
+    assert r2PorCriba(a, a + k).tolist() == r
+
+# La comprobación es
+#    > poetry run pytest -q SumasDeDosCuadrados.py
+#    3 passed in 11.21s
+
+# Comparación de eficiencia
+# =========================
+
+def tiempo(e: str) -> None:
+    """Tiempo (en segundos) de evaluar la expresión e."""
+    t = Timer(e, "", default_timer, globals()).timeit(1)
+    print(f"{t:0.2f} segundos")
+
+# La comparación es
+#    >>> tiempo('len(sumasDeDosCuadradosDirecta(10**12))')
+#    0.25 segundos
+#    >>> tiempo('len(sumasDeDosCuadrados(10**12))')
+#    0.00 segundos
+#    >>> tiempo('len(sumasDeDosCuadrados(10**36))')
+#    0.00 segundos
+#    >>> tiempo('len(sumasDeDosCuadrados(5**6*13**4*17**3*29*37**2*41*53))')
+#    0.01 segundos
+#    >>> tiempo('len(sumasDeDosCuadrados((10**9+9)*(10**9+7)**2))')
+#    0.09 segundos
+#
+# Cálculo de r2 en intervalos:
+#    >>> tiempo('[r2(n) for n in range(10**5)]')
+#    0.64 segundos
+#    >>> tiempo('r2PorPuntos(0, 10**7)')
+#    0.34 segundos
+#    >>> tiempo('r2PorCriba(0, 10**7)')
+#    2.14 segundos
+#    >>> tiempo('r2PorPuntos(10**12, 10**12 + 10**5)')
+#    9.76 segundos
+#    >>> tiempo('r2PorCriba(10**12, 10**12 + 10**5)')
+#    1.00 segundos
+#
+# Al empezar en 0 el recorrido de los puntos es más rápido que la criba,
+# pero en intervalos cortos de números grandes hay que recorrer muchas
+# columnas sin puntos en el intervalo.
@@ -25,8 +25,12 @@ from operator import mul
 from timeit import Timer, default_timer
 from typing import Iterator
 
+import numpy as np
+import numpy.typing as npt
 from sympy import divisor_sigma, factorint
 
+from src.TablasAritmeticas import tabla
+
 # 1ª solución
 # ===========
 
@@ -108,15 +112,107 @@ def esSumaDeDosAbundantes3(n: int) -> bool:
 def sumasDeDosAbundantes3() -> Iterator[int]:
     return (n for n in count(1) if esSumaDeDosAbundantes3(n))
 
+# 4ª solución
+# ===========
+
+# abundantesHasta(n) es el vector de los números abundantes menores o
+# iguales que n, calculado con la tabla de la suma de divisores de
+# TablasAritmeticas. Por ejemplo,
+#    abundantesHasta(40).tolist()  ==  [12, 18, 20, 24, 30, 36, 40]
+def abundantesHasta(n: int) -> npt.NDArray[np.int64]:
+    xs = np.arange(n + 1)
+    return np.flatnonzero(tabla(n).sumaDivisores[:n + 1] > 2 * xs)
+
+def esSumaDeDosAbundantes4(n: int) -> bool:
+    xs = abundantesHasta(n)
+    esAbundante = np.zeros(n + 1, dtype=bool)
+    esAbundante[xs] = True
+    return bool(esAbundante[n - xs].any())
+
+def sumasDeDosAbundantes4() -> Iterator[int]:
+    return (n for n in count(1) if esSumaDeDosAbundantes4(n))
+
+# 5ª solución
+# ===========
+
+# En esta solución se calcula de una vez el mapa de bits de las sumas de
+# dos abundantes menores o iguales que n: a partir del vector booleano
+# A tal que A[x] indica si x es abundante (calculado con la tabla de la
+# suma de divisores), las sumas son los índices no nulos de la
+# convolución de A consigo mismo. La convolución se calcula
+# + desplazando A cada abundante a <= n/2 posiciones y haciendo la
+#   disyunción de los resultados, si n es pequeño, y
+# + con la transformada rápida de Fourier, en caso contrario.
+
+# mapaConDesplazamientos(n) es el vector booleano m tal que, para 0 <=
+# x <= n, m[x] indica si x es suma de dos abundantes. Por ejemplo,
+#    >>> np.flatnonzero(mapaConDesplazamientos(40)).tolist()
+#    [24, 30, 32, 36, 38, 40]
+def mapaConDesplazamientos(n: int) -> npt.NDArray[np.bool_]:
+    esAbundante = np.zeros(n + 1, dtype=bool)
+    esAbundante[abundantesHasta(n)] = True
+    m = np.zeros(n + 1, dtype=bool)
+    for a in abundantesHasta(n // 2).tolist():
+        m[a:] |= esAbundante[:n + 1 - a]
+    return m
+
+# mapaConFFT(n) es el mismo vector que mapaConDesplazamientos(n),
+# calculado mediante la transformada rápida de Fourier. Por ejemplo,
+#    >>> np.flatnonzero(mapaConFFT(40)).tolist()
+#    [24, 30, 32, 36, 38, 40]
+def mapaConFFT(n: int) -> npt.NDArray[np.bool_]:
+    esAbundante = np.zeros(n + 1)
+    esAbundante[abundantesHasta(n)] = 1
+    k = 1 << (2 * n + 1).bit_length()
+    f = np.fft.rfft(esAbundante, k)
+    return np.fft.irfft(f * f, k)[:n + 1] > 0.5
+
+# mapaSumasDeDosAbundantes(n) es el mapa de las sumas de dos abundantes
+# menores o iguales que n, calculado por desplazamientos si n es menor
+# que 2^14 y por FFT en caso contrario.
+def mapaSumasDeDosAbundantes(n: int) -> npt.NDArray[np.bool_]:
+    if n < 2**14:
+        return mapaConDesplazamientos(n)
+    return mapaConFFT(n)
+
+# _mapas es la lista cuyo único elemento es el último mapa calculado por
+# mapa (o la lista vacía si aún no se ha calculado ninguno).
+_mapas: list[npt.NDArray[np.bool_]] = []
+
+# mapa(n) es un mapa de las sumas de dos abundantes con, al menos, n+1
+# elementos. Cuando hay que calcular uno nuevo, su tamaño es al menos
+# el doble que el del anterior.
+def mapa(n: int) -> npt.NDArray[np.bool_]:
+    if not _mapas or len(_mapas[0]) <= n:
+        m = max(n, 2**10, 2 * (len(_mapas[0]) - 1) if _mapas else 0)
+        _mapas[:] = [mapaSumasDeDosAbundantes(m)]
+    return _mapas[0]
+
+def esSumaDeDosAbundantes5(n: int) -> bool:
+    return bool(mapa(n)[n])
+
+def sumasDeDosAbundantes5() -> Iterator[int]:
+    n = 0
+    while True:
+        m = mapa(n)
+        yield from (n + np.flatnonzero(m[n:])).tolist()
+        n = len(m)
+
 # Verificación
 # ============
 
 def test_sumasDeDosAbundantes() -> None:
     for sumasDeDosAbundantes in [sumasDeDosAbundantes1,
                                  sumasDeDosAbundantes2,
-                                 sumasDeDosAbundantes3]:
+                                 sumasDeDosAbundantes3,
+                                 sumasDeDosAbundantes4,
+                                 sumasDeDosAbundantes5]:
         assert list(islice(sumasDeDosAbundantes(), 10)) ==\
             [24, 30, 32, 36, 38, 40, 42, 44, 48, 50]
+    assert (mapaConFFT(30000) == mapaConDesplazamientos(30000)).all()
+    # El mayor número que no es suma de dos abundantes es 20161.
+    assert not esSumaDeDosAbundantes5(20161)
+    assert np.flatnonzero(~mapa(10**5)).max() == 20161
     print("Verificado")
 
 # La verificación es
@@ -135,7 +231,9 @@ def nth(i: Iterator[int], n: int) -> int:
 def test_sumasDeDosAbundantes_equiv(n: int) -> bool:
     return list(islice(sumasDeDosAbundantes1(), n)) ==\
            list(islice(sumasDeDosAbundantes2(), n)) ==\
-           list(islice(sumasDeDosAbundantes3(), n))
+           list(islice(sumasDeDosAbundantes3(), n)) ==\
+           list(islice(sumasDeDosAbundantes4(), n)) ==\
+           list(islice(sumasDeDosAbundantes5(), n))
 
 # La comprobación es
 #    >>> test_sumasDeDosAbundantes_equiv(400)
@@ -156,6 +254,34 @@ def tiempo(e: str) -> None:
 #    2.30 segundos
 #    >>> tiempo('nth(sumasDeDosAbundantes3(), 500)')
 #    1.92 segundos
+#    >>> tiempo('nth(sumasDeDosAbundantes4(), 500)')
+#    0.02 segundos
+#    >>> tiempo('nth(sumasDeDosAbundantes5(), 500)')
+#    0.00 segundos
+#
+#    >>> tiempo('nth(sumasDeDosAbundantes3(), 2000)')
+#    400.45 segundos
+#    >>> tiempo('nth(sumasDeDosAbundantes4(), 2000)')
+#    0.04 segundos
+#    >>> tiempo('nth(sumasDeDosAbundantes5(), 2000)')
+#    0.01 segundos
+#
+#    >>> tiempo('nth(sumasDeDosAbundantes4(), 10**4)')
+#    0.44 segundos
+#    >>> tiempo('nth(sumasDeDosAbundantes5(), 10**4)')
+#    0.01 segundos
+#    >>> tiempo('nth(sumasDeDosAbundantes5(), 10**6)')
+#    1.19 segundos
+#
+#    >>> tiempo('mapaConDesplazamientos(10**5)')
+#    0.05 segundos
+#    >>> tiempo('mapaConFFT(10**5)')
+#    0.01 segundos
+#    >>> tiempo('mapaConFFT(10**7)')
+#    7.18 segundos
+
+# En lo sucesivo usaremos la quinta definición
+sumasDeDosAbundantes = sumasDeDosAbundantes5
 
 # ---------------------------------------------------------------------
 # § Referencias                                                      --
@@ -15,22 +15,26 @@
 #    862878
 # ---------------------------------------------------------------------
 
+from dataclasses import dataclass
 from itertools import count, islice, takewhile
 from timeit import Timer, default_timer
 from typing import Iterator
 
+import numpy as np
+import numpy.typing as npt
 from hypothesis import given
 from hypothesis import strategies as st
 from sympy import isprime
 
+from src.CribaSegmentada import primos, primosHasta
+
 # 1ª solución
 # ===========
 
-# primos() genera la lista de los primos. Por ejemplo,
+# primos() genera la lista de los primos, mediante la criba segmentada
+# de CribaSegmentada. Por ejemplo,
 #    >>> list(islice(primos(), 10))
 #    [2, 3, 5, 7, 11, 13, 17, 19, 23, 29]
-def primos() -> Iterator[int]:
-    return (n for n in count() if isprime(n))
 
 # sumaDeDosPrimos1(n) es la lista de pares de primos cuya suma es
 # n. Por ejemplo,
@@ -93,6 +97,89 @@ def esSumaDeDosPrimos4(n: int) -> bool:
 def sumasDeDosPrimos4() -> Iterator[int]:
     return filter(esSumaDeDosPrimos4, count(4))
 
+# 5ª solución
+# ===========
+
+# En esta solución se calcula de una vez, para todos los x <= n, el
+# número de representaciones de x como suma de dos primos (es decir, el
+# número de pares (p,q) de primos tales que p+q = x). Si P es el vector
+# tal que P[x] es 1 si x es primo y 0 en caso contrario, dicho número es
+# el x-ésimo elemento de la convolución de P consigo mismo, que se
+# calcula con la transformada rápida de Fourier. Como la transformada
+# se calcula con números flotantes, se comprueba que los resultados
+# están próximos a enteros y que su suma es el cuadrado del número de
+# primos (que es el número total de pares).
+
+# Una TablaDeSumas hasta n tiene los vectores esPrimo y numero tales
+# que, para 0 <= x <= n, esPrimo[x] indica si x es primo y numero[x] es
+# el número de representaciones de x como suma de dos primos.
+@dataclass(frozen=True)
+class TablaDeSumas:
+    n: int
+    esPrimo: npt.NDArray[np.bool_]
+    numero: npt.NDArray[np.int64]
+
+# calculaTablaDeSumas(n) es la tabla de las sumas de dos primos hasta
+# n. Por ejemplo,
+#    >>> calculaTablaDeSumas(20).numero.tolist()
+#    [0, 0, 0, 0, 1, 2, 1, 2, 2, 2, 3, 0, 2, 2, 3, 2, 4, 0, 4, 2, 4]
+#    >>> calculaTablaDeSumas(100).numero[100]
+#    12
+def calculaTablaDeSumas(n: int) -> TablaDeSumas:
+    esPrimo = np.zeros(n + 1, dtype=bool)
+    esPrimo[primosHasta(n)] = True
+    k = 1 << (2 * n + 1).bit_length()
+    f = np.fft.rfft(esPrimo.astype(float), k)
+    c = np.fft.irfft(f * f, k)
+    r = np.rint(c)
+    if np.abs(c - r).max() >= 0.25 or \
+       r.sum() != np.count_nonzero(esPrimo)**2:
+        raise ArithmeticError(f'la convolución hasta {n} no es exacta')
+    return TablaDeSumas(n, esPrimo, r[:n + 1].astype(np.int64))
+
+# _tablas es la lista cuyo único elemento es la última tabla calculada
+# por tablaDeSumas (o la lista vacía si aún no se ha calculado ninguna).
+_tablas: list[TablaDeSumas] = []
+
+# tablaDeSumas(n) es una tabla de las sumas de dos primos hasta n o
+# más. Cuando hay que calcular una nueva, su tamaño es al menos el doble
+# que el de la anterior.
+def tablaDeSumas(n: int) -> TablaDeSumas:
+    if not _tablas or _tablas[0].n < n:
+        m = max(n, 2**10, 2 * _tablas[0].n if _tablas else 0)
+        _tablas[:] = [calculaTablaDeSumas(m)]
+    return _tablas[0]
+
+# numeroDeSumas(n) es el número de representaciones de n como suma de
+# dos primos. Por ejemplo,
+#    numeroDeSumas(100)  ==  12
+#    numeroDeSumas(17)   ==  0
+def numeroDeSumas(n: int) -> int:
+    return int(tablaDeSumas(n).numero[n])
+
+# sumaDeDosPrimos5(n) es la lista de pares de primos cuya suma es
+# n. Por ejemplo,
+#    sumaDeDosPrimos5(9)   ==  [(2,7),(7,2)]
+#    sumaDeDosPrimos5(16)  ==  [(3,13),(5,11),(11,5),(13,3)]
+#    sumaDeDosPrimos5(17)  ==  []
+def sumaDeDosPrimos5(n: int) -> list[tuple[int, int]]:
+    t = tablaDeSumas(n)
+    if t.numero[n] == 0:
+        return []
+    xs = np.flatnonzero(t.esPrimo[:n])
+    xs = xs[t.esPrimo[n - xs]]
+    return [(x, n - x) for x in xs.tolist()]
+
+def esSumaDeDosPrimos5(n: int) -> bool:
+    return numeroDeSumas(n) > 0
+
+def sumasDeDosPrimos5() -> Iterator[int]:
+    n = 0
+    while True:
+        t = tablaDeSumas(n)
+        yield from (n + np.flatnonzero(t.numero[n:])).tolist()
+        n = t.n + 1
+
 # Verificación                                                     --
 # ============
 
@@ -103,6 +190,13 @@ def test_sumasDeDosPrimos() -> None:
     assert list(islice(sumasDeDosPrimos2(), 23)) == r
     assert list(islice(sumasDeDosPrimos3(), 23)) == r
     assert list(islice(sumasDeDosPrimos4(), 23)) == r
+    assert list(islice(sumasDeDosPrimos5(), 23)) == r
+    assert calculaTablaDeSumas(20).numero.tolist() == \
+        [0, 0, 0, 0, 1, 2, 1, 2, 2, 2, 3, 0, 2, 2, 3, 2, 4, 0, 4, 2, 4]
+    assert numeroDeSumas(100) == 12
+    assert sumaDeDosPrimos5(16) == [(3,13),(5,11),(11,5),(13,3)]
+    assert sumaDeDosPrimos5(17) == []
+    assert nth(sumasDeDosPrimos5(), 5*10**5) == 862878
     print("Verificado")
 
 # La comprobación es
@@ -124,11 +218,23 @@ def test_sumasDeDosPrimos_equiv(n: int) -> None:
     assert nth(sumasDeDosPrimos2(), n) == r
     assert nth(sumasDeDosPrimos3(), n) == r
     assert nth(sumasDeDosPrimos4(), n) == r
+    assert nth(sumasDeDosPrimos5(), n) == r
 
 # La comprobación es
 #    >>> test_sumasDeDosPrimos_equiv()
 #    >>>
 
+# La propiedad de las representaciones es
+@given(st.integers(min_value=1, max_value=3000))
+def test_sumaDeDosPrimos5(n: int) -> None:
+    r = sumaDeDosPrimos1(n)
+    assert sumaDeDosPrimos5(n) == r
+    assert numeroDeSumas(n) == len(r)
+
+# La comprobación es
+#    > poetry run pytest -q Sumas_de_dos_primos.py
+#    3 passed in 15.69s
+
 # Comparación de eficiencia
 # =========================
 
@@ -139,18 +245,37 @@ def tiempo(e: str) -> None:
 
 # La comparación es
 #    >>> tiempo('nth(sumasDeDosPrimos1(), 1000)')
-#    3.02 segundos
+#    0.22 segundos
 #    >>> tiempo('nth(sumasDeDosPrimos2(), 1000)')
-#    1.53 segundos
+#    0.15 segundos
 #    >>> tiempo('nth(sumasDeDosPrimos3(), 1000)')
 #    0.03 segundos
 #    >>> tiempo('nth(sumasDeDosPrimos4(), 1000)')
 #    0.00 segundos
+#    >>> tiempo('nth(sumasDeDosPrimos5(), 1000)')
+#    0.03 segundos
 #
 #    >>> tiempo('nth(sumasDeDosPrimos3(), 5*10**4)')
-#    3.76 segundos
+#    1.82 segundos
 #    >>> tiempo('nth(sumasDeDosPrimos4(), 5*10**4)')
-#    0.33 segundos
+#    0.08 segundos
+#    >>> tiempo('nth(sumasDeDosPrimos5(), 5*10**4)')
+#    0.04 segundos
+#
+#    >>> tiempo('nth(sumasDeDosPrimos4(), 5*10**5)')
+#    1.41 segundos
+#    >>> tiempo('nth(sumasDeDosPrimos5(), 5*10**5)')
+#    0.05 segundos
+#
+#    >>> tiempo('sumaDeDosPrimos1(10**6)')
+#    0.22 segundos
+#    >>> tiempo('sumaDeDosPrimos5(10**6)')
+#    0.00 segundos
+#
+#    >>> tiempo('calculaTablaDeSumas(10**6)')
+#    0.20 segundos
+#    >>> tiempo('calculaTablaDeSumas(10**7)')
+#    4.38 segundos
 
 # ---------------------------------------------------------------------
 # § Referencia                                                       --
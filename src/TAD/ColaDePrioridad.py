@@ -33,7 +33,19 @@
 # + not (esVacia (inserta x c))
 #
 # Para usar el TAD hay que usar una implementación concreta. En
-# principio, consideraremos su representación mediante listas.
+# principio, consideraremos las siguientes:
+#    + mediante listas ordenadas,
+#    + mediante montículos de heapq y
+#    + mediante montículos de emparejamiento persistentes.
+# Hay que elegir la que se desee utilizar, descomentándola y comentando
+# las otras.
+#
+# Las dos primeras copian la cola en cada inserta y resto, por lo que
+# su coste es lineal. Por defecto se usa la implementación mediante
+# montículos de emparejamiento, en la que inserta es de coste constante
+# y resto de coste logarítmico amortizado. Como en la implementación
+# con listas, los elementos iguales se extraen en el orden en que se
+# insertaron.
 
 __all__ = [
    'CPrioridad',
@@ -44,5 +56,14 @@ __all__ = [
    'esVacia',
     ]
 
-from src.TAD.ColaDePrioridadConListas import (CPrioridad, esVacia, inserta,
-                                              primero, resto, vacia)
+# from src.TAD.ColaDePrioridadConListas import (CPrioridad, esVacia, inserta,
+#                                               primero, resto, vacia)
+
+# from src.TAD.ColaDePrioridadConHeapq import (CPrioridad, esVacia, inserta,
+#                                              primero, resto, vacia)
+
+from src.TAD.ColaDePrioridadConMonticulosDeEmparejamiento import (CPrioridad,
+                                                                  esVacia,
+                                                                  inserta,
+                                                                  primero,
+                                                                  resto, vacia)
@@ -0,0 +1,343 @@
+# ColaDePrioridadConMonticulosDeEmparejamiento.py
+# El tipo de datos de las colas de prioridad mediante montículos de emparejamiento.
+# José A. Alonso Jiménez <https://jaalonso.github.io>
+# Sevilla, 18-octubre-2026
+# ---------------------------------------------------------------------
+
+# En esta implementación la cola de prioridad se representa mediante un
+# montículo de emparejamiento (en inglés, "pairing heap") inmutable. Un
+# montículo es None (el montículo vacío) o una terna (x, n, hs) donde x
+# es el menor elemento, n es su número de orden de inserción y hs es la
+# lista enlazada (es decir, None o un par (h, hs')) de los submontículos
+# no vacíos.
+#
+# Las operaciones son:
+# + inserta: mezcla el montículo con el que sólo tiene el nuevo
+#   elemento, colocando el de mayor raíz como primer hijo del otro. Su
+#   coste es constante.
+# + resto: mezcla los hijos de la raíz por parejas de izquierda a
+#   derecha y luego mezcla los resultados de derecha a izquierda. Su
+#   coste amortizado es logarítmico.
+# Como los nodos no se modifican nunca, ninguna operación copia la cola
+# y las distintas versiones comparten su estructura.
+#
+# El número de orden de inserción se usa para desempatar los elementos
+# iguales, de forma que (como en la implementación con listas) se
+# extraen en el mismo orden en que se insertaron.
+#
+# Se define la clase CPrioridad con los siguientes métodos:
+#    + inserta(x) añade x al final de la cola.
+#    + primero() es el primero de la cola.
+#    + resto() elimina el primero de la cola.
+#    + esVacia() se verifica si la cola es vacía.
+# Por ejemplo,
+#    >>> c = CPrioridad()
+#    >>> c
+#    -
+#    >>> c.inserta(5)
+#    >>> c.inserta(2)
+#    >>> c.inserta(3)
+#    >>> c.inserta(4)
+#    >>> c
+#    2 | 3 | 4 | 5
+#    >>> c.primero()
+#    2
+#    >>> c.resto()
+#    >>> c
+#    3 | 4 | 5
+#    >>> c.esVacia()
+#    False
+#    >>> c = CPrioridad()
+#    >>> c.esVacia()
+#    True
+#
+# Además se definen las correspondientes funciones. Por ejemplo,
+#    >>> vacia()
+#    -
+#    >>> inserta(4, inserta(3, inserta(2, inserta(5, vacia()))))
+#    2 | 3 | 4 | 5
+#    >>> primero (inserta(4, inserta(3, inserta(2, inserta(5, vacia())))))
+#    2
+#    >>> resto (inserta(4, inserta(3, inserta(2, inserta(5, vacia())))))
+#    3 | 4 | 5
+#    >>> esVacia(inserta(4, inserta(3, inserta(2, inserta(5, vacia())))))
+#    False
+#    >>> esVacia(vacia())
+#    True
+#
+# Finalmente, se define un generador aleatorio de colas, se comprueba
+# que las colas cumplen las propiedades de su especificación y se
+# compara su eficiencia con las otras implementaciones.
+
+from __future__ import annotations
+
+__all__ = [
+   'CPrioridad',
+   'vacia',
+   'inserta',
+   'primero',
+   'resto',
+   'esVacia',
+]
+
+from abc import abstractmethod
+from copy import deepcopy
+from dataclasses import dataclass
+from functools import reduce
+from random import Random
+from timeit import Timer, default_timer
+from types import ModuleType
+from typing import Any, Generic, Optional, Protocol, TypeVar
+
+from hypothesis import assume, given
+from hypothesis import strategies as st
+
+
+class Comparable(Protocol):
+    @abstractmethod
+    def __lt__(self: A, otro: A) -> bool:
+        pass
+
+A = TypeVar('A', bound=Comparable)
+
+# Montículos de emparejamiento
+# ============================
+
+# Un montículo es None o una terna (x, n, hs).
+Monticulo = Optional[tuple[Any, int, Any]]
+
+def mezcla(h1: Monticulo, h2: Monticulo) -> Monticulo:
+    """
+    Devuelve el montículo con los elementos de h1 y h2.
+    """
+    if h1 is None:
+        return h2
+    if h2 is None:
+        return h1
+    (x1, n1, hs1) = h1
+    (x2, n2, hs2) = h2
+    if x2 < x1 or (not x1 < x2 and n2 < n1):
+        return (x2, n2, (h1, hs2))
+    return (x1, n1, (h2, hs1))
+
+def mezclaHijos(hs: Any) -> Monticulo:
+    """
+    Devuelve el montículo obtenido mezclando los de la lista enlazada
+    hs en dos pasadas: por parejas de izquierda a derecha y, a
+    continuación, los resultados de derecha a izquierda.
+    """
+    parejas = []
+    while hs is not None:
+        (h1, hs) = hs
+        if hs is None:
+            parejas.append(h1)
+        else:
+            (h2, hs) = hs
+            parejas.append(mezcla(h1, h2))
+    h: Monticulo = None
+    for h1 in reversed(parejas):
+        h = mezcla(h1, h)
+    return h
+
+def elementosMonticulo(h: Monticulo) -> list[Any]:
+    """
+    Devuelve la lista de los elementos del montículo h en el orden en
+    que se extraerían.
+    """
+    nodos = []
+    pila = [h] if h is not None else []
+    while pila:
+        (x, n, hs) = pila.pop()
+        nodos.append((x, n))
+        while hs is not None:
+            (h1, hs) = hs
+            pila.append(h1)
+    nodos.sort(key=lambda p: p[1])
+    return [x for (x, _) in sorted(nodos, key=lambda p: p[0])]
+
+# Clase de las colas de prioridad mediante montículos de emparejamiento
+# =====================================================================
+
+@dataclass
+class CPrioridad(Generic[A]):
+    _monticulo: Monticulo = None
+    _insertados: int = 0
+
+    def __repr__(self) -> str:
+        """
+        Devuelve una cadena con los elementos de la cola separados por " | ".
+        Si la cola está vacía, devuelve "-".
+        """
+        if self._monticulo is None:
+            return '-'
+        return ' | '.join(str(x) for x in elementosMonticulo(self._monticulo))
+
+    def __eq__(self, c: Any) -> bool:
+        """
+        Se verifica si la cola es igual a la cola c; es decir, si sus
+        elementos se extraerían en el mismo orden.
+        """
+        return elementosMonticulo(self._monticulo) == \
+            elementosMonticulo(c._monticulo)
+
+    def __deepcopy__(self, memo: dict[int, Any]) -> CPrioridad[A]:
+        """
+        Devuelve una copia de la cola que comparte sus nodos, ya que
+        éstos son inmutables.
+        """
+        return CPrioridad(self._monticulo, self._insertados)
+
+    def esVacia(self) -> bool:
+        """
+        Comprueba si la cola está vacía.
+
+        Devuelve True si la cola está vacía, False en caso contrario.
+        """
+        return self._monticulo is None
+
+    def inserta(self, x: A) -> None:
+        """
+        Inserta el elemento x en la cola de prioridad.
+        """
+        self._monticulo = mezcla(self._monticulo,
+                                 (x, self._insertados, None))
+        self._insertados = self._insertados + 1
+
+    def primero(self) -> A:
+        """
+        Devuelve el primer elemento de la cola.
+        """
+        if self._monticulo is None:
+            raise IndexError('primero de la cola vacía')
+        return self._monticulo[0]
+
+    def resto(self) -> None:
+        """
+        Elimina el primer elemento de la cola
+        """
+        if self._monticulo is None:
+            raise IndexError('resto de la cola vacía')
+        self._monticulo = mezclaHijos(self._monticulo[2])
+
+# Funciones del tipo de las colas de prioridad
+# ============================================
+
+def vacia() -> CPrioridad[A]:
+    """
+    Crea y devuelve una cola vacía de tipo A.
+    """
+    c: CPrioridad[A] = CPrioridad()
+    return c
+
+def inserta(x: A, c: CPrioridad[A]) -> CPrioridad[A]:
+    """
+    Devuelve la cola obtenida insertando x en c, que comparte con c
+    todos sus nodos.
+    """
+    _aux = deepcopy(c)
+    _aux.inserta(x)
+    return _aux
+
+def esVacia(c: CPrioridad[A]) -> bool:
+    """
+    Devuelve True si la cola está vacía, False si no lo está.
+    """
+    return c.esVacia()
+
+def primero(c: CPrioridad[A]) -> A:
+    """
+    Devuelve el primer elemento de la cola c.
+    """
+    return c.primero()
+
+def resto(c: CPrioridad[A]) -> CPrioridad[A]:
+    """
+    Devuelve la cola obtenida eliminando el primer elemento de c.
+    """
+    _aux = deepcopy(c)
+    _aux.resto()
+    return _aux
+
+# Generador de colas de prioridad
+# ===============================
+
+def listaAcola(xs: list[A]) -> CPrioridad[A]:
+    """
+    Devuelve la cola de prioridad con los elementos de xs.
+    """
+    return reduce(lambda c, x: inserta(x, c), xs, vacia())
+
+def colaAleatoria() -> st.SearchStrategy[CPrioridad[int]]:
+    """
+    Genera una estrategia de búsqueda para generar colas de enteros de
+    forma aleatoria.
+
+    Utiliza la librería Hypothesis para generar una lista de enteros y
+    luego se convierte en una instancia de la clase cola.
+    """
+    return st.lists(st.integers()).map(listaAcola)
+
+# Comprobación de las propiedades de las colas
+# ============================================
+
+# Las propiedades son
+@given(c=colaAleatoria(), x=st.integers(), y=st.integers())
+def test_cola1(c: CPrioridad[int], x: int, y: int) -> None:
+    assert inserta(x, inserta(y, c)) == inserta(y, inserta(x, c))
+    assert primero(inserta(x, vacia())) == x
+    assert resto(inserta(x, vacia())) == vacia()
+    assert esVacia(vacia())
+    assert not esVacia(inserta(x, c))
+
+@given(c=colaAleatoria(), x=st.integers(), y=st.integers())
+def test_cola2(c: CPrioridad[int], x: int, y: int) -> None:
+    assume(not y < x)
+    assert primero(inserta(y, (inserta(x, c)))) == \
+        primero(inserta(x,c))
+    assert resto(inserta(y, (inserta(x, c)))) == \
+        inserta(y, resto(inserta(x, c)))
+
+# La comprobación es
+#    > poetry run pytest -q ColaDePrioridadConMonticulosDeEmparejamiento.py
+#    2 passed in 0.60s
+
+# Comparación de eficiencia
+# =========================
+
+# operaciones(m, n) aplica n operaciones con la implementación m de las
+# colas de prioridad: n/2 inserciones de números aleatorios seguidas de
+# n/2 extracciones del primero, usando las funciones del TAD.
+def operaciones(m: ModuleType, n: int) -> None:
+    g = Random(n)
+    c = m.vacia()
+    for _ in range(n // 2):
+        c = m.inserta(g.random(), c)
+    while not m.esVacia(c):
+        m.primero(c)
+        c = m.resto(c)
+
+def tiempo(e: str) -> None:
+    """Tiempo (en segundos) de evaluar la expresión e."""
+    t = Timer(e, "", default_timer, globals()).timeit(1)
+    print(f"{t:0.2f} segundos")
+
+# La comparación es
+#    >>> import src.TAD.ColaDePrioridadConListas as L
+#    >>> import src.TAD.ColaDePrioridadConHeapq as H
+#    >>> import src.TAD.ColaDePrioridadConMonticulosDeEmparejamiento as E
+#    >>> tiempo('operaciones(L, 10**4)')
+#    19.62 segundos
+#    >>> tiempo('operaciones(H, 10**4)')
+#    18.71 segundos
+#    >>> tiempo('operaciones(E, 10**4)')
+#    0.08 segundos
+#    >>> tiempo('operaciones(L, 4*10**4)')
+#    289.65 segundos
+#    >>> tiempo('operaciones(E, 4*10**4)')
+#    0.57 segundos
+#    >>> tiempo('operaciones(E, 10**6)')
+#    27.16 segundos
+#
+# Con las implementaciones mediante listas y heapq el tiempo crece
+# cuadráticamente (cada operación copia la cola), por lo que no es
+# posible completar 10^6 operaciones.
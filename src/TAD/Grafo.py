@@ -87,8 +87,11 @@
 #      están conectados por la arista y el peso de dicha arista.
 #
 # Para usar el TAD hay que usar una implementación concreta. En
-# principio, consideraremos sólo la siguiente:
-#    + mediante lista de adyacencia.
+# principio, consideraremos las siguientes:
+#    + mediante lista de adyacencia y
+#    + mediante vectores de adyacencia (en formato CSR con NumPy), que
+#      ocupa mucha menos memoria en grafos con millones de aristas.
+# Para elegir una se descomenta la correspondiente importación.
 
 # pylint: disable=unused-import
 
@@ -112,3 +115,9 @@ from src.TAD.GrafoConListaDeAdyacencia import (Arista, Cotas, Grafo,
                                                adyacentes, aristaEn, aristas,
                                                creaGrafo, creaGrafo_, dirigido,
                                                nodos, peso)
+# from src.TAD.GrafoConVectorDeAdyacencia import (Arista, Cotas, Grafo,
+#                                                 Orientacion, Peso, Vertice,
+#                                                 adyacentes, aristaEn,
+#                                                 aristas, creaGrafo,
+#                                                 creaGrafo_, dirigido, nodos,
+#                                                 peso)
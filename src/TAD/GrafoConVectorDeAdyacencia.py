@@ -4,70 +4,220 @@
 # Sevilla, 15-mayo-2023
 # ---------------------------------------------------------------------
 
+# En esta implementación el grafo se representa en formato CSR ("Compressed
+# Sparse Row") mediante tres vectores de NumPy:
+#    + _destinos: los extremos finales de las aristas, ordenadas por su
+#      extremo inicial, su extremo final y su peso.
+#    + _pesos: los pesos de las aristas, en el mismo orden.
+#    + _inicios: para cada vértice v (numerados desde el menor de la
+#      cota inferior y los extremos de las aristas), las aristas que
+#      salen de v son las que ocupan las posiciones desde _inicios[v]
+#      hasta _inicios[v+1] (sin incluir) en los vectores anteriores.
+# En los grafos no dirigidos se guardan las aristas en los dos sentidos
+# (salvo los lazos), como en la implementación con listas de adyacencia.
+#
+# Los vectores ocupan sólo unos pocos bytes por arista, frente a las
+# tuplas anidadas de la lista de aristas, lo que permite trabajar con
+# grafos de millones de aristas. Los adyacentes de un vértice se
+# obtienen en tiempo proporcional a su grado, mientras que aristaEn y
+# peso hacen una búsqueda binaria entre ellos.
+#
+# Se define la clase Grafo con los mismos métodos que en la
+# implementación con listas de adyacencia:
+#    + dirigido() se verifica si el grafo es dirigido.
+#    + nodos() es la lista de todos los nodos del grafo.
+#    + aristas() es la lista de las aristas del grafo.
+#    + adyacentes(v) es la lista de los vértices adyacentes al vértice
+#      v en el grafo.
+#    + aristaEn(a) se verifica si a es una arista del grafo.
+#    + peso(v1, v2) es el peso de la arista que une los vértices v1 y
+#      v2 en el grafo.
+# Por ejemplo,
+#    >>> Grafo(Orientacion.D, (1,3), [((1,2),0),((3,2),0),((2,2),0)])
+#    G D ([1, 2, 3], [(1, 2), (2, 2), (3, 2)])
+#    >>> Grafo(Orientacion.ND, (1,3), [((1,2),0),((3,2),5),((2,2),0)])
+#    G ND ([1, 2, 3], [((1, 2), 0), ((2, 2), 0), ((2, 3), 5)])
+#    >>> ejGrafoD.dirigido()
+#    True
+#    >>> ejGrafoND.nodos()
+#    [1, 2, 3, 4, 5]
+#    >>> ejGrafoND.adyacentes(4)
+#    [2, 3, 5]
+#    >>> ejGrafoD.adyacentes(4)
+#    [5]
+#    >>> ejGrafoND.aristaEn((5, 1))
+#    True
+#    >>> ejGrafoD.aristaEn((5, 1))
+#    False
+#    >>> ejGrafoND.peso(1, 5)
+#    78
+#
+# Además se definen las correspondientes funciones. Por ejemplo,
+#    >>> creaGrafo(Orientacion.ND, (1,3), [((1,2),12),((1,3),34)])
+#    G ND ([1, 2, 3], [((1, 2), 12), ((1, 3), 34), ((2, 1), 12), ((3, 1), 34)])
+#    >>> creaGrafo_(Orientacion.ND, (1,3), [(2, 1), (1, 3)])
+#    G ND ([1, 2, 3], [(1, 2), (1, 3)])
+#    >>> dirigido(ejGrafoND)
+#    False
+#    >>> nodos(ejGrafoD)
+#    [1, 2, 3, 4, 5]
+#    >>> adyacentes(ejGrafoND, 4)
+#    [2, 3, 5]
+#    >>> aristaEn(ejGrafoD, (1,5))
+#    True
+#    >>> peso(1, 5, ejGrafoD)
+#    78
+#    >>> aristas(ejGrafoD)
+#    [((1, 2), 12), ((1, 3), 34), ((1, 5), 78),
+#     ((2, 4), 55), ((2, 5), 32),
+#     ((3, 4), 61), ((3, 5), 44),
+#     ((4, 5), 93)]
+
+# pylint: disable=protected-access
+
 from __future__ import annotations
 
-from dataclasses import dataclass
+from enum import Enum
+from random import Random
+from timeit import Timer, default_timer
+
+import numpy as np
+import numpy.typing as npt
 
+Orientacion = Enum('Orientacion', ['D', 'ND'])
+
+Vertice = int
+Cotas = tuple[Vertice, Vertice]
+Peso = float
+Arista = tuple[tuple[Vertice, Vertice], Peso]
 
-@dataclass
 class Grafo:
-    orientacion: bool
-    cotas: tuple[int, int]
-    aristas: list[tuple[int, int, float]]
+    def __init__(self,
+                 _orientacion: Orientacion,
+                 _cotas: Cotas,
+                 _aristas: list[Arista]):
+        self._orientacion = _orientacion
+        self._cotas = _cotas
+        origenes = np.array([v1 for ((v1, _), _) in _aristas], dtype=np.int64)
+        destinos = np.array([v2 for ((_, v2), _) in _aristas], dtype=np.int64)
+        pesos = np.array([p for (_, p) in _aristas])
+        # Los vértices indexados son los de las cotas y los extremos de
+        # las aristas (que podrían estar fuera de las cotas).
+        (x, y) = _cotas
+        if origenes.size:
+            x = min(x, int(origenes.min()), int(destinos.min()))
+            y = max(y, int(origenes.max()), int(destinos.max()))
+        self._primero = x
+        n = max(0, 1 + y - x)
+        if _orientacion == Orientacion.ND:
+            noLazos = origenes != destinos
+            (origenes, destinos, pesos) = (
+                np.concatenate((origenes, destinos[noLazos])),
+                np.concatenate((destinos, origenes[noLazos])),
+                np.concatenate((pesos, pesos[noLazos])))
+        orden = np.lexsort((pesos, destinos, origenes))
+        self._destinos: npt.NDArray[np.int64] = destinos[orden]
+        self._pesos: npt.NDArray[np.generic] = pesos[orden]
+        self._inicios: npt.NDArray[np.int64] = np.zeros(n + 1, dtype=np.int64)
+        np.cumsum(np.bincount(origenes - x, minlength=n),
+                  out=self._inicios[1:])
 
-#    def dirigido(self) -> bool:
-#        return self.orientacion
-#
-#    def nodos(self) -> list[int]:
-#        cota_inicial, cota_final = self.cotas
-#        return list(range(cota_inicial, 1 + cota_final))
-#
-#    def nodos2(self) -> list[int]:
-#        nodos = []
-#        for v1, v2, _ in self.aristas:
-#            if v1 not in nodos:
-#                nodos.append(v1)
-#            if v2 not in nodos:
-#                nodos.append(v2)
-#        return sorted(nodos)
-#
-#    def adyacentes(self, vertice: int) -> list[int]:
-#        adyacentes = []
-#        for v1, v2, _ in self.aristas:
-#            if v1 == vertice:
-#                adyacentes.append(v2)
-#            elif v2 == vertice and not self.orientacion:
-#                adyacentes.append(v1)
-#        return adyacentes
-#
-#    def obtener_aristas(self) -> list[tuple[int, int, float]]:
-#        return self.aristas
-#
-#    def aristaEn(self, arista: tuple[int, int]) -> bool:
-#        for v1, v2, _ in self.aristas:
-#            if arista in ((v1, v2), (v2, v1)):
-#                return True
-#        return False
-#
-#    def peso(self, v1: int, v2: int) -> float:
-#        for vertice1, vertice2, peso in self.aristas:
-#            if (vertice1, vertice2) == (v1, v2) or (vertice2, vertice1) == (v1, v2):
-#                return peso
-#        raise ValueError("No se encontró una arista entre los vértices especificados.")
-
-def creaGrafo(o: bool,
-              cs: tuple[int, int],
-              as_: list[tuple[int, int, float]]) -> Grafo:
-    return Grafo(orientacion=o, cotas=cs, aristas=as_)
-
-ejGrafo2 = creaGrafo(False,
-                     (1, 5),
-                     [(1,2,12),(1,3,34),(1,5,78),
-                      (2,4,55),(2,5,32),
-                      (3,4,61),(3,5,44),
-                      (4,5,93)])
-
-# ejGrafoND es el grafo
+    def _rango(self, v: Vertice) -> tuple[int, int]:
+        """
+        Devuelve el par (i, j) tal que las aristas que salen de v son las
+        de las posiciones i..j-1 de los vectores de destinos y pesos.
+        """
+        i = v - self._primero
+        if not 0 <= i < len(self._inicios) - 1:
+            return (0, 0)
+        return (self._inicios.item(i), self._inicios.item(i + 1))
+
+    def _posicion(self, v1: Vertice, v2: Vertice) -> int:
+        """
+        Devuelve la posición de la arista (v1, v2) de menor peso, o -1 si
+        no existe.
+        """
+        (i, j) = self._rango(v1)
+        k = i + int(self._destinos[i:j].searchsorted(v2))
+        if k < j and self._destinos.item(k) == v2:
+            return k
+        return -1
+
+    def nodos(self) -> list[Vertice]:
+        (x, y) = self._cotas
+        return list(range(x, 1 + y))
+
+    def aristas(self) -> list[Arista]:
+        x = self._primero
+        origenes = np.repeat(np.arange(x, x + len(self._inicios) - 1),
+                             np.diff(self._inicios))
+        return list(zip(zip(origenes.tolist(), self._destinos.tolist()),
+                        self._pesos.tolist()))
+
+    def __repr__(self) -> str:
+        o = self._orientacion
+        vs = nodos(self)
+        ns = self.aristas()
+        escribeOrientacion = "D" if o == Orientacion.D else "ND"
+        ponderado = {p for ((_, _), p) in ns} != {0}
+        aristasReducidas = ns if o == Orientacion.D \
+            else [((x, y), p)
+                  for ((x, y), p) in ns
+                  if x <= y]
+        escribeAristas = str(aristasReducidas) if ponderado \
+            else str([a for (a, _) in aristasReducidas])
+        return f"G {escribeOrientacion} ({vs}, {escribeAristas})"
+
+    def dirigido(self) -> bool:
+        return self._orientacion == Orientacion.D
+
+    def adyacentes(self, v: int) -> list[int]:
+        (i, j) = self._rango(v)
+        ds = self._destinos[i:j]
+        if ds.size > 1:
+            ds = ds[np.concatenate(([True], ds[1:] != ds[:-1]))]
+        return ds.tolist()
+
+    def aristaEn(self, a: tuple[Vertice, Vertice]) -> bool:
+        (x, y) = a
+        return self._posicion(x, y) >= 0
+
+    def peso(self, v1: Vertice, v2: Vertice) -> Peso:
+        k = self._posicion(v1, v2)
+        if k < 0:
+            raise IndexError(f'no existe la arista {(v1, v2)}')
+        return self._pesos.item(k)
+
+def creaGrafo(o: Orientacion,
+              cs: Cotas,
+              as_: list[Arista]) -> Grafo:
+    return Grafo(o, cs, as_)
+
+def creaGrafo_(o: Orientacion,
+              cs: Cotas,
+              as_: list[tuple[Vertice, Vertice]]) -> Grafo:
+    return Grafo(o, cs, [((v1, v2), 0) for (v1, v2) in as_])
+
+def dirigido(g: Grafo) -> bool:
+    return g.dirigido()
+
+def nodos(g: Grafo) -> list[Vertice]:
+    return g.nodos()
+
+def adyacentes(g: Grafo, v: Vertice) -> list[Vertice]:
+    return g.adyacentes(v)
+
+def aristaEn(g: Grafo, a: tuple[Vertice, Vertice]) -> bool:
+    return g.aristaEn(a)
+
+def peso(v1: Vertice, v2: Vertice, g: Grafo) -> Peso:
+    return g.peso(v1, v2)
+
+def aristas(g: Grafo) -> list[Arista]:
+    return g.aristas()
+
+# En los ejemplos se usarán los grafos (no dirigido y dirigido)
+# correspondientes a
 #             12
 #        1 -------- 2
 #        | \78     /|
@@ -79,36 +229,56 @@ ejGrafo2 = creaGrafo(False,
 #        | /     93\|
 #        3 -------- 4
 #             61
-# representado mediante un vector de adyacencia; es decir,
-#    λ> ejGrafoND
-#    G ND array (1,5) [(1,[(2,12),(3,34),(5,78)]),
-#                      (2,[(1,12),(4,55),(5,32)]),
-#                      (3,[(1,34),(4,61),(5,44)]),
-#                      (4,[(2,55),(3,61),(5,93)]),
-#                      (5,[(1,78),(2,32),(3,44),(4,93)])])
-ejGrafoND: Grafo = creaGrafo(False,
+# definidos por
+ejGrafoND: Grafo = creaGrafo(Orientacion.ND,
                              (1, 5),
-                             [(1, 2, 12), (1, 3, 34), (1, 5, 78),
-                              (2, 4, 55), (2, 5, 32),
-                              (3, 4, 61), (3, 5, 44),
-                              (4, 5, 93)])
-
-# ejGrafoD es el mismo grafo que ejGrafoND pero orientando las aristas;
-# es decir,
-#    λ> ejGrafoD
-#    G D array (1,5) [(1,[(2,12),(3,34),(5,78)]),
-#                     (2,[(4,55),(5,32)]),
-#                     (3,[(4,61),(5,44)]),
-#                     (4,[(5,93)]),
-#                     (5,[])])
-ejGrafoD: Grafo = creaGrafo(True,
+                             [((1, 2), 12), ((1, 3), 34), ((1, 5), 78),
+                              ((2, 4), 55), ((2, 5), 32),
+                              ((3, 4), 61), ((3, 5), 44),
+                              ((4, 5), 93)])
+ejGrafoD: Grafo = creaGrafo(Orientacion.D,
                             (1, 5),
-                            [(1, 2, 12), (1, 3, 34), (1, 5, 78),
-                             (2, 4, 55), (2, 5, 32),
-                             (3, 4, 61), (3, 5, 44),
-                             (4, 5, 93)])
+                            [((1, 2), 12), ((1, 3), 34), ((1, 5), 78),
+                             ((2, 4), 55), ((2, 5), 32),
+                             ((3, 4), 61), ((3, 5), 44),
+                             ((4, 5), 93)])
 
-#    >>> ejGrafoND.nodos()
-#    [1, 2, 3, 4, 5]
-#    >>> ejGrafoD.nodos()
-#    [1, 2, 3, 4, 5]
+# Comparación de eficiencia
+# =========================
+
+# grafoAleatorio(n, m) es un grafo no dirigido con los vértices 1..n y
+# m aristas aleatorias (con pesos entre 1 y 100).
+def grafoAleatorio(n: int, m: int) -> Grafo:
+    g = Random(n + m)
+    return creaGrafo(Orientacion.ND,
+                     (1, n),
+                     [((g.randint(1, n), g.randint(1, n)), g.randint(1, 100))
+                      for _ in range(m)])
+
+# consultas(g) es la suma de los pesos de las aristas de g, calculada
+# consultando los adyacentes de cada vértice y el peso de cada arista.
+def consultas(g: Grafo) -> Peso:
+    return sum(peso(v, u, g)
+               for v in nodos(g)
+               for u in adyacentes(g, v)
+               if aristaEn(g, (v, u)))
+
+def tiempo(e: str) -> None:
+    """Tiempo (en segundos) de evaluar la expresión e."""
+    t = Timer(e, "", default_timer, globals()).timeit(1)
+    print(f"{t:0.2f} segundos")
+
+# La comparación es
+#    >>> import src.TAD.GrafoConListaDeAdyacencia as L
+#    >>> tiempo('L.consultas(L.grafoAleatorio(10**4, 10**5))')
+#    1.52 segundos
+#    >>> tiempo('consultas(grafoAleatorio(10**4, 10**5))')
+#    1.56 segundos
+#    >>> tiempo('L.consultas(L.grafoAleatorio(10**5, 10**6))')
+#    21.65 segundos
+#    >>> tiempo('consultas(grafoAleatorio(10**5, 10**6))')
+#    15.13 segundos
+#
+# Los tiempos son parecidos, pero la memoria ocupada por el grafo de
+# 10^6 aristas (medida con tracemalloc) es de 337 MB con listas de
+# adyacencia y de 31 MB con vectores de adyacencia.
@@ -9,12 +9,14 @@
 # con Hypothesis.
 # ---------------------------------------------------------------------
 
+from random import Random
 from typing import Any
 
 from hypothesis import strategies as st
 from hypothesis.strategies import composite
 
-from src.TAD.Grafo import Grafo, Orientacion, creaGrafo_
+from src.TAD.Grafo import (Arista, Grafo, Orientacion, creaGrafo,
+                           creaGrafo_)
 
 
 # Generador de aristas. Por ejemplo,
@@ -72,3 +74,43 @@ def gen_grafo(draw: Any) -> Grafo:
     if o == Orientacion.ND:
         return draw(gen_grafoND())
     return draw(gen_grafoD())
+
+# Generador de grafos no dirigidos, conexos y ponderados. Están formados
+# por un camino que recorre todos los vértices (en un orden aleatorio)
+# y otras aristas aleatorias, con pesos entre 1 y 20 (para que haya
+# empates). Por ejemplo,
+#    >>> gen_grafoConexoPonderado().example()
+#    G ND ([1, 2, 3, 4], [((1, 2), 1), ((2, 3), 1), ((3, 4), 1)])
+#    >>> gen_grafoConexoPonderado().example()
+#    G ND ([1, 2, 3, 4, 5], [((1, 2), 15), ((1, 5), 6), ((1, 5), 8),
+#                            ((2, 2), 12), ((2, 4), 20), ((2, 5), 2),
+#                            ((2, 5), 18), ((3, 4), 11)])
+@composite
+def gen_grafoConexoPonderado(draw: Any) -> Grafo:
+    n = draw(st.integers(1,10))
+    vs = draw(st.permutations(list(range(1, n + 1))))
+    camino = list(zip(vs, vs[1:]))
+    otras = draw(gen_aristas(n))
+    pesos = draw(st.lists(st.integers(1, 20),
+                          min_size=len(camino) + len(otras),
+                          max_size=len(camino) + len(otras)))
+    return creaGrafo(Orientacion.ND,
+                     (1,n),
+                     list(zip(camino + otras, pesos)))
+
+# grafoConexoAleatorio(n, m) es un grafo no dirigido y conexo con los
+# vértices 1..n formado por el camino 1-2-...-n y m aristas aleatorias,
+# con pesos aleatorios entre 1 y 1000. Es determinista (la semilla
+# depende de n y m), por lo que sirve para comparar la eficiencia de
+# distintos algoritmos sobre grafos grandes. Por ejemplo,
+#    >>> grafoConexoAleatorio(4, 2)
+#    G ND ([1, 2, 3, 4], [((1, 2), 813), ((1, 3), 1), ((1, 4), 781),
+#                         ((2, 3), 588), ((3, 4), 842)])
+def grafoConexoAleatorio(n: int, m: int) -> Grafo:
+    r = Random(n + m)
+    camino: list[Arista] = [((x, x + 1), r.randint(1, 1000))
+                            for x in range(1, n)]
+    otras: list[Arista] = [((r.randint(1, n), r.randint(1, n)),
+                            r.randint(1, 1000))
+                           for _ in range(m)]
+    return creaGrafo(Orientacion.ND, (1, n), camino + otras)
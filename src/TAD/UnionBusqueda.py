@@ -0,0 +1,183 @@
+# UnionBusqueda.py
+# Estructura de unión-búsqueda (conjuntos disjuntos).
+# José A. Alonso Jiménez <https://jaalonso.github.io>
+# Sevilla, 18-octubre-2026
+# ---------------------------------------------------------------------
+
+# La estructura de unión-búsqueda (en inglés, "union-find" o
+# "disjoint-set") mantiene una partición de un conjunto de elementos en
+# clases disjuntas. Cada clase se representa mediante un árbol en el que
+# cada elemento apunta a su padre y la raíz es el representante de la
+# clase. Se usan dos mejoras:
+# + compresión de caminos: al buscar la raíz de un elemento, todos los
+#   elementos del camino pasan a apuntar directamente a la raíz.
+# + unión por rango: al unir dos clases, la raíz del árbol de menor
+#   rango (una cota superior de su altura) pasa a ser hija de la del
+#   otro.
+# Con ambas, el coste amortizado de cada operación es O(α(n)), donde α
+# es la inversa de la función de Ackermann (que, en la práctica, es
+# menor que 5).
+#
+# Se define la clase UnionBusqueda con los siguientes métodos:
+#    + inserta(x) añade x como una nueva clase unitaria.
+#    + raiz(x) es el representante de la clase de x.
+#    + une(x, y) une las clases de x e y; devuelve True si estaban
+#      separadas y False si ya eran la misma.
+#    + conectados(x, y) se verifica si x e y están en la misma clase.
+#    + numeroDeClases() es el número de clases.
+# Por ejemplo,
+#    >>> u = UnionBusqueda(range(1, 7))
+#    >>> u.numeroDeClases()
+#    6
+#    >>> u.une(1, 2)
+#    True
+#    >>> u.une(3, 4)
+#    True
+#    >>> u.une(2, 4)
+#    True
+#    >>> u.une(1, 3)
+#    False
+#    >>> u.conectados(1, 4)
+#    True
+#    >>> u.conectados(1, 5)
+#    False
+#    >>> u.numeroDeClases()
+#    3
+#    >>> u.clases()
+#    [[1, 2, 3, 4], [5], [6]]
+# ---------------------------------------------------------------------
+
+from typing import Generic, Hashable, Iterable, TypeVar
+
+from hypothesis import given
+from hypothesis import strategies as st
+
+A = TypeVar('A', bound=Hashable)
+
+class UnionBusqueda(Generic[A]):
+    def __init__(self, xs: Iterable[A] = ()) -> None:
+        self._padre: dict[A, A] = {}
+        self._rango: dict[A, int] = {}
+        self._numeroDeClases = 0
+        for x in xs:
+            self.inserta(x)
+
+    def __repr__(self) -> str:
+        return f"UnionBusqueda({self.clases()})"
+
+    def __contains__(self, x: A) -> bool:
+        return x in self._padre
+
+    def inserta(self, x: A) -> None:
+        """
+        Añade x como una clase unitaria (si no estaba ya).
+        """
+        if x not in self._padre:
+            self._padre[x] = x
+            self._rango[x] = 0
+            self._numeroDeClases += 1
+
+    def raiz(self, x: A) -> A:
+        """
+        Devuelve el representante de la clase de x, comprimiendo el
+        camino desde x hasta él.
+        """
+        padre = self._padre
+        r = x
+        while padre[r] != r:
+            r = padre[r]
+        while padre[x] != r:
+            (padre[x], x) = (r, padre[x])
+        return r
+
+    def une(self, x: A, y: A) -> bool:
+        """
+        Une las clases de x e y. Devuelve True si eran distintas y False
+        en caso contrario.
+        """
+        rx = self.raiz(x)
+        ry = self.raiz(y)
+        if rx == ry:
+            return False
+        if self._rango[rx] < self._rango[ry]:
+            (rx, ry) = (ry, rx)
+        self._padre[ry] = rx
+        if self._rango[rx] == self._rango[ry]:
+            self._rango[rx] += 1
+        self._numeroDeClases -= 1
+        return True
+
+    def conectados(self, x: A, y: A) -> bool:
+        """
+        Se verifica si x e y pertenecen a la misma clase.
+        """
+        return self.raiz(x) == self.raiz(y)
+
+    def numeroDeClases(self) -> int:
+        """
+        Devuelve el número de clases de la partición.
+        """
+        return self._numeroDeClases
+
+    def clases(self) -> list[list[A]]:
+        """
+        Devuelve la lista de las clases, cada una con sus elementos en
+        el orden en que se insertaron y ordenadas por la posición de su
+        primer elemento.
+        """
+        cs: dict[A, list[A]] = {}
+        for x in self._padre:
+            cs.setdefault(self.raiz(x), []).append(x)
+        return list(cs.values())
+
+# Verificación
+# ============
+
+def test_UnionBusqueda() -> None:
+    u = UnionBusqueda(range(1, 7))
+    assert u.numeroDeClases() == 6
+    assert u.une(1, 2)
+    assert u.une(3, 4)
+    assert u.une(2, 4)
+    assert not u.une(1, 3)
+    assert u.conectados(1, 4)
+    assert not u.conectados(1, 5)
+    assert u.numeroDeClases() == 3
+    assert u.clases() == [[1, 2, 3, 4], [5], [6]]
+    # Una cadena larga de uniones no desborda la pila.
+    v: UnionBusqueda[int] = UnionBusqueda(range(10**5))
+    for x in range(1, 10**5):
+        v.une(x - 1, x)
+    assert v.conectados(0, 10**5 - 1)
+    assert v.numeroDeClases() == 1
+    print("Verificado")
+
+# La verificación es
+#    >>> test_UnionBusqueda()
+#    Verificado
+
+# Comprobación de propiedades
+# ===========================
+
+# La propiedad es que, después de unir los pares de ps, dos elementos
+# están conectados si, y sólo si, están en la misma clase calculada
+# ingenuamente fusionando las listas de las clases.
+@given(st.lists(st.tuples(st.integers(0, 9), st.integers(0, 9))))
+def test_conectados(ps: list[tuple[int, int]]) -> None:
+    u = UnionBusqueda(range(10))
+    cs = [{x} for x in range(10)]
+    for (x, y) in ps:
+        u.une(x, y)
+        cx = next(c for c in cs if x in c)
+        cy = next(c for c in cs if y in c)
+        if cx is not cy:
+            cs.remove(cy)
+            cx |= cy
+    assert u.numeroDeClases() == len(cs)
+    for x in range(10):
+        for y in range(10):
+            assert u.conectados(x, y) == any(x in c and y in c for c in cs)
+
+# La comprobación es
+#    > poetry run pytest -q UnionBusqueda.py
+#    2 passed in 2.60s
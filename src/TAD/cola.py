@@ -35,6 +35,12 @@
 # principio, consideraremos dos: una usando listas y otra usando
 # sucesiones. Hay que elegir la que se desee utilizar, descomentándola
 # y comentando las otras.
+#
+# Las implementaciones con listas, dos listas y deque copian la cola en
+# cada inserta y resto, por lo que su coste es lineal. Por defecto se
+# usa la implementación mediante flujos perezosos, cuyas operaciones
+# son de coste constante amortizado y comparten la estructura entre
+# las distintas versiones de la cola.
 
 __all__ = [
     'Cola',
@@ -45,10 +51,13 @@ __all__ = [
     'esVacia',
     'colaAleatoria'
 ]
-from src.TAD.colaConListas import (Cola, colaAleatoria, esVacia, inserta,
-                                   primero, resto, vacia)
+# from src.TAD.colaConListas import (Cola, colaAleatoria, esVacia, inserta,
+#                                    primero, resto, vacia)
 
 # from src.TAD.colaConDosListas import (Cola, colaAleatoria, esVacia, inserta,
 #                                       primero, resto, vacia)
 # from src.TAD.colaConDeque import (Cola, vacia, inserta, primero, resto,
 #                                   esVacia, colaAleatoria)
+
+from src.TAD.colaConFlujos import (Cola, colaAleatoria, esVacia, inserta,
+                                   primero, resto, vacia)
@@ -0,0 +1,314 @@
+# colaConFlujos.py
+# Implementación de las colas mediante flujos perezosos.
+# José A. Alonso Jiménez <https://jaalonso.github.io>
+# Sevilla, 18-octubre-2026
+# ======================================================================
+
+# En esta implementación se usa la cola del banquero de Okasaki
+# ("Purely functional data structures", sección 6.3.2). La cola se
+# representa mediante
+#    + un flujo perezoso f con los primeros elementos de la cola,
+#    + una lista enlazada r con los últimos elementos en orden inverso y
+#    + las longitudes de f y r,
+# manteniendo el invariante len(r) <= len(f). Cuando al insertar o al
+# quitar un elemento se rompe el invariante, f se sustituye por la
+# concatenación perezosa de f y la inversa de r, que sólo se calcula
+# cuando se necesitan sus elementos. Los nodos de los flujos y de las
+# listas enlazadas son inmutables y los flujos recuerdan los valores ya
+# calculados, por lo que las funciones inserta y resto no copian la
+# cola, comparten los nodos con la original y tienen coste constante
+# amortizado incluso cuando se usan versiones antiguas de la cola.
+#
+# Se define la clase Cola con los siguientes métodos:
+#    + inserta(x) añade x al final de la cola.
+#    + primero() es el primero de la cola.
+#    + resto() elimina el primero de la cola.
+#    + esVacia() se verifica si la cola es vacía.
+# Por ejemplo,
+#    >>> c = Cola()
+#    >>> c
+#    -
+#    >>> c.inserta(5)
+#    >>> c.inserta(2)
+#    >>> c.inserta(3)
+#    >>> c.inserta(4)
+#    >>> c
+#    5 | 2 | 3 | 4
+#    >>> c.primero()
+#    5
+#    >>> c.resto()
+#    >>> c
+#    2 | 3 | 4
+#    >>> c.esVacia()
+#    False
+#    >>> c = Cola()
+#    >>> c.esVacia()
+#    True
+#
+# Además se definen las correspondientes funciones. Por ejemplo,
+#    >>> vacia()
+#    -
+#    >>> inserta(4, inserta(3, inserta(2, inserta(5, vacia()))))
+#    5 | 2 | 3 | 4
+#    >>> primero(inserta(4, inserta(3, inserta(2, inserta(5, vacia())))))
+#    5
+#    >>> resto(inserta(4, inserta(3, inserta(2, inserta(5, vacia())))))
+#    2 | 3 | 4
+#    >>> esVacia(inserta(4, inserta(3, inserta(2, inserta(5, vacia())))))
+#    False
+#    >>> esVacia(vacia())
+#    True
+#
+# Finalmente, se define un generador aleatorio de colas y se comprueba
+# que las colas cumplen las propiedades de su especificación.
+
+from __future__ import annotations
+
+__all__ = [
+    'Cola',
+    'vacia',
+    'inserta',
+    'primero',
+    'resto',
+    'esVacia',
+    'colaAleatoria'
+]
+
+from copy import deepcopy
+from dataclasses import dataclass, field
+from typing import Any, Callable, Generic, Iterator, Optional, TypeVar
+
+from hypothesis import assume, given
+from hypothesis import strategies as st
+
+A = TypeVar('A')
+
+# Flujos perezosos
+# ================
+
+# Un flujo es una suspensión cuyo valor, una vez calculado, es None (el
+# flujo vacío) o un par (x, s) donde s es un flujo.
+class Flujo:
+    __slots__ = ('_calculo', '_valor')
+
+    def __init__(self,
+                 calculo: Optional[Callable[[], Any]] = None,
+                 valor: Optional[tuple[Any, Flujo]] = None) -> None:
+        self._calculo = calculo
+        self._valor = valor
+
+    def fuerza(self) -> Optional[tuple[Any, Flujo]]:
+        """
+        Devuelve el valor del flujo, calculándolo la primera vez.
+        """
+        if self._calculo is not None:
+            self._valor = self._calculo()
+            self._calculo = None
+        return self._valor
+
+flujoVacio = Flujo()
+
+def concatena(s: Flujo, t: Flujo) -> Flujo:
+    """
+    Devuelve el flujo perezoso formado por los elementos de s seguidos
+    de los de t.
+    """
+    def calculo() -> Optional[tuple[Any, Flujo]]:
+        v = s.fuerza()
+        if v is None:
+            return t.fuerza()
+        return (v[0], concatena(v[1], t))
+    return Flujo(calculo)
+
+def invierte(r: Optional[tuple[Any, Any]]) -> Flujo:
+    """
+    Devuelve el flujo perezoso con los elementos de la lista enlazada r
+    en orden inverso (que se calcula completo al forzarlo).
+    """
+    def calculo() -> Optional[tuple[Any, Flujo]]:
+        s = flujoVacio
+        xs = r
+        while xs is not None:
+            s = Flujo(valor=(xs[0], s))
+            xs = xs[1]
+        return s.fuerza()
+    return Flujo(calculo)
+
+# Clase de las colas mediante flujos
+# ==================================
+
+@dataclass
+class Cola(Generic[A]):
+    _longitudF: int = 0
+    _frente: Flujo = field(default=flujoVacio)
+    _longitudR: int = 0
+    _final: Optional[tuple[Any, Any]] = None
+
+    def _equilibra(self) -> None:
+        """
+        Restablece el invariante len(r) <= len(f) concatenando
+        perezosamente el final invertido al frente.
+        """
+        if self._longitudR > self._longitudF:
+            self._frente = concatena(self._frente, invierte(self._final))
+            self._longitudF = self._longitudF + self._longitudR
+            self._longitudR = 0
+            self._final = None
+
+    def _iterador(self) -> Iterator[A]:
+        """
+        Devuelve un iterador sobre los elementos de la cola en orden.
+        """
+        v = self._frente.fuerza()
+        while v is not None:
+            yield v[0]
+            v = v[1].fuerza()
+        ys = []
+        xs = self._final
+        while xs is not None:
+            ys.append(xs[0])
+            xs = xs[1]
+        yield from reversed(ys)
+
+    def __repr__(self) -> str:
+        """
+        Devuelve una cadena con los elementos de la cola separados por " | ".
+        Si la cola está vacía, devuelve "-".
+        """
+        if self.esVacia():
+            return '-'
+        return ' | '.join(str(x) for x in self._iterador())
+
+    def __eq__(self, c: Any) -> bool:
+        """
+        Se verifica si la cola es igual a la cola c; es decir, si tienen
+        los mismos elementos en el mismo orden.
+        """
+        return list(self._iterador()) == list(c._iterador())
+
+    def __deepcopy__(self, memo: dict[int, Any]) -> Cola[A]:
+        """
+        Devuelve una copia de la cola que comparte sus nodos, ya que
+        éstos son inmutables.
+        """
+        return Cola(self._longitudF, self._frente,
+                    self._longitudR, self._final)
+
+    def inserta(self, x: A) -> None:
+        """
+        Inserta el elemento x al final de la cola.
+        """
+        self._final = (x, self._final)
+        self._longitudR = self._longitudR + 1
+        self._equilibra()
+
+    def esVacia(self) -> bool:
+        """
+        Comprueba si la cola está vacía.
+
+        Devuelve True si la cola está vacía, False en caso contrario.
+        """
+        return self._longitudF == 0
+
+    def primero(self) -> A:
+        """
+        Devuelve el primer elemento de la cola.
+        """
+        v = self._frente.fuerza()
+        if v is None:
+            raise IndexError('primero de la cola vacía')
+        return v[0]
+
+    def resto(self) -> None:
+        """
+        Elimina el primer elemento de la cola
+        """
+        v = self._frente.fuerza()
+        if v is None:
+            raise IndexError('resto de la cola vacía')
+        self._frente = v[1]
+        self._longitudF = self._longitudF - 1
+        self._equilibra()
+
+# Funciones del tipo de las colas
+# ===============================
+
+def vacia() -> Cola[A]:
+    """
+    Crea y devuelve una cola vacía de tipo A.
+    """
+    c: Cola[A] = Cola()
+    return c
+
+def inserta(x: A, c: Cola[A]) -> Cola[A]:
+    """
+    Devuelve la cola obtenida añadiendo x al final de c, que comparte
+    con c todos sus elementos.
+    """
+    _aux = deepcopy(c)
+    _aux.inserta(x)
+    return _aux
+
+def esVacia(c: Cola[A]) -> bool:
+    """
+    Devuelve True si la cola está vacía, False si no lo está.
+    """
+    return c.esVacia()
+
+def primero(c: Cola[A]) -> A:
+    """
+    Devuelve el primer elemento de la cola c.
+    """
+    return c.primero()
+
+def resto(c: Cola[A]) -> Cola[A]:
+    """
+    Devuelve la cola obtenida eliminando el primer elemento de c, que
+    comparte con c el resto de sus elementos.
+    """
+    _aux = deepcopy(c)
+    _aux.resto()
+    return _aux
+
+# Generador de colas
+# ==================
+
+def listaAcola(xs: list[A]) -> Cola[A]:
+    """
+    Devuelve la cola cuyos elementos son los de xs en el mismo orden.
+    """
+    c: Cola[A] = vacia()
+    for x in xs:
+        c.inserta(x)
+    return c
+
+def colaAleatoria() -> st.SearchStrategy[Cola[int]]:
+    """
+    Genera una estrategia de búsqueda para generar colas de enteros de
+    forma aleatoria.
+
+    Utiliza la librería Hypothesis para generar una lista de enteros y
+    luego se convierte en una instancia de la clase cola.
+    """
+    return st.lists(st.integers()).map(listaAcola)
+
+# Comprobación de las propiedades de las colas
+# ============================================
+
+# Las propiedades son
+@given(c=colaAleatoria(), x=st.integers())
+def test_cola1(c: Cola[int], x: int) -> None:
+    assert primero(inserta(x, vacia())) == x
+    assert resto(inserta(x, vacia())) == vacia()
+    assert esVacia(vacia())
+    assert not esVacia(inserta(x, c))
+
+@given(c=colaAleatoria(), x=st.integers())
+def test_cola2(c: Cola[int], x: int) -> None:
+    assume(not esVacia(c))
+    assert primero(inserta(x, c)) == primero(c)
+    assert resto(inserta(x, c)) == inserta(x, resto(c))
+
+# La comprobación es
+#    > poetry run pytest -q colaConFlujos.py
+#    2 passed in 0.41s
@@ -43,10 +43,17 @@
 # principio, consideraremos las siguientes:
 #    + mediante listas no ordenadas con duplicados,
 #    + mediante listas no ordenadas sin duplicados,
-#    + mediante listas ordenadas sin duplicados y
-#    + mediante la librería Data.Set.
+#    + mediante listas ordenadas sin duplicados,
+#    + mediante la librería Data.Set y
+#    + mediante árboles AVL persistentes.
 # Hay que elegir la que se desee utilizar, descomentándola y comentando
 # las otras.
+#
+# Las implementaciones con listas copian el conjunto en cada inserta y
+# elimina, por lo que su coste es lineal. Por defecto se usa la
+# implementación mediante árboles AVL, cuyas operaciones son de coste
+# logarítmico y comparten la estructura entre las distintas versiones
+# del conjunto.
 
 __all__ = [
     'Conj',
@@ -67,12 +74,14 @@ __all__ = [
 #     Conj, conjuntoAleatorio, elimina, esVacio, inserta, menor, pertenece,
 #     vacio)
 
-from src.TAD.conjuntoConListasOrdenadasSinDuplicados import (Conj,
-                                                             conjuntoAleatorio,
-                                                             elimina, esVacio,
-                                                             inserta, menor,
-                                                             pertenece, vacio)
+# from src.TAD.conjuntoConListasOrdenadasSinDuplicados import (
+#     Conj, conjuntoAleatorio, elimina, esVacio, inserta, menor, pertenece,
+#     vacio)
 
 # from src.TAD.conjuntoConLibreria import (
 #     Conj, conjuntoAleatorio, elimina, esVacio, inserta, menor, pertenece,
 #     vacio)
+
+from src.TAD.conjuntoConArbolesAVL import (Conj, conjuntoAleatorio, elimina,
+                                          esVacio, inserta, menor, pertenece,
+                                          vacio)
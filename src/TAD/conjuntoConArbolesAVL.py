@@ -0,0 +1,401 @@
+# conjuntoConArbolesAVL.py
+# Implementación de los conjuntos mediante árboles AVL persistentes.
+# José A. Alonso Jiménez <https://jaalonso.github.io>
+# Sevilla, 18-octubre-2026
+# ---------------------------------------------------------------------
+
+# En esta implementación los elementos del conjunto se guardan en un
+# árbol binario de búsqueda equilibrado (AVL) inmutable. Un árbol es
+# None (el árbol vacío) o una tupla (i, x, d, a) donde x es la raíz, i
+# y d son los subárboles izquierdo y derecho y a es la altura del
+# árbol. Las alturas de i y d difieren a lo sumo en 1, por lo que la
+# altura del árbol es logarítmica en el número de elementos.
+#
+# Las funciones inserta y elimina no copian el conjunto, sino que
+# construyen los nodos del camino desde la raíz hasta el elemento
+# (reequilibrándolos mediante rotaciones) y comparten con el conjunto
+# original todos los demás. Por tanto, inserta, elimina, menor y
+# pertenece tienen coste logarítmico.
+#
+# Se define la clase Conj con los siguientes métodos:
+#    + inserta(x) añade x al conjunto.
+#    + menor() es el menor elemento del conjunto.
+#    + elimina(x) elimina las ocurrencias de x en el conjunto.
+#    + pertenece(x) se verifica si x pertenece al conjunto.
+#    + esVacia() se verifica si la cola es vacía.
+#    + esEquilibrado() se verifica si el árbol del conjunto es AVL (se
+#      usa en las comprobaciones).
+# Por ejemplo,
+#    >>> c = Conj()
+#    >>> c
+#    {}
+#    >>> c.inserta(5)
+#    >>> c.inserta(2)
+#    >>> c.inserta(3)
+#    >>> c.inserta(4)
+#    >>> c.inserta(5)
+#    >>> c
+#    {2, 3, 4, 5}
+#    >>> c.menor()
+#    2
+#    >>> c.elimina(3)
+#    >>> c
+#    {2, 4, 5}
+#    >>> c.pertenece(4)
+#    True
+#    >>> c.pertenece(3)
+#    False
+#    >>> c.esVacio()
+#    False
+#    >>> c = Conj()
+#    >>> c.esVacio()
+#    True
+#    >>> c = Conj()
+#    >>> c.inserta(2)
+#    >>> c.inserta(5)
+#    >>> d = Conj()
+#    >>> d.inserta(5)
+#    >>> d.inserta(2)
+#    >>> d.inserta(5)
+#    >>> c == d
+#    True
+#
+# Además se definen las correspondientes funciones. Por ejemplo,
+#    >>> vacio()
+#    {}
+#    >>> inserta(5, inserta(3, inserta(2, inserta(5, vacio()))))
+#    {2, 3, 5}
+#    >>> menor(inserta(5, inserta(3, inserta(2, inserta(5, vacio())))))
+#    2
+#    >>> elimina(5, inserta(5, inserta(3, inserta(2, inserta(5, vacio())))))
+#    {2, 3}
+#    >>> pertenece(5, inserta(5, inserta(3, inserta(2, inserta(5, vacio())))))
+#    True
+#    >>> pertenece(1, inserta(5, inserta(3, inserta(2, inserta(5, vacio())))))
+#    False
+#    >>> esVacio(inserta(5, inserta(3, inserta(2, inserta(5, vacio())))))
+#    False
+#    >>> esVacio(vacio())
+#    True
+#    >>> inserta(5, inserta(2, vacio())) == inserta(2, inserta(5, (inserta(2, vacio()))))
+#    True
+#
+# Finalmente, se define un generador aleatorio de conjuntos y se
+# comprueba que los conjuntos cumplen las propiedades de su
+# especificación.
+
+from __future__ import annotations
+
+__all__ = [
+    'Conj',
+    'vacio',
+    'inserta',
+    'menor',
+    'elimina',
+    'pertenece',
+    'esVacio',
+    'conjuntoAleatorio'
+]
+
+from abc import abstractmethod
+from copy import deepcopy
+from dataclasses import dataclass
+from functools import reduce
+from typing import Any, Generic, Iterator, Optional, Protocol, TypeVar
+
+from hypothesis import given
+from hypothesis import strategies as st
+
+
+class Comparable(Protocol):
+    @abstractmethod
+    def __lt__(self: A, otro: A) -> bool:
+        pass
+
+A = TypeVar('A', bound=Comparable)
+
+# Árboles AVL
+# ===========
+
+# Un árbol es None o una tupla (i, x, d, a).
+Arbol = Optional[tuple[Any, Any, Any, int]]
+
+def altura(t: Arbol) -> int:
+    """
+    Devuelve la altura del árbol t.
+    """
+    return 0 if t is None else t[3]
+
+def nodo(i: Arbol, x: Any, d: Arbol) -> Arbol:
+    """
+    Devuelve el árbol de raíz x y subárboles i y d.
+    """
+    return (i, x, d, max(altura(i), altura(d)) + 1)
+
+def equilibra(i: Arbol, x: Any, d: Arbol) -> Arbol:
+    """
+    Devuelve el árbol AVL de raíz x y subárboles i y d, cuyas alturas
+    difieren a lo sumo en 2, aplicando las rotaciones necesarias.
+    """
+    ai = altura(i)
+    ad = altura(d)
+    if ai > ad + 1:
+        assert i is not None
+        (ii, xi, di, _) = i
+        if altura(ii) >= altura(di):
+            return nodo(ii, xi, nodo(di, x, d))
+        assert di is not None
+        (idi, xdi, ddi, _) = di
+        return nodo(nodo(ii, xi, idi), xdi, nodo(ddi, x, d))
+    if ad > ai + 1:
+        assert d is not None
+        (id_, xd, dd, _) = d
+        if altura(dd) >= altura(id_):
+            return nodo(nodo(i, x, id_), xd, dd)
+        assert id_ is not None
+        (iid, xid, did, _) = id_
+        return nodo(nodo(i, x, iid), xid, nodo(did, xd, dd))
+    return nodo(i, x, d)
+
+def insertaArbol(x: Any, t: Arbol) -> Arbol:
+    """
+    Devuelve el árbol obtenido añadiendo x a t (o t, si x ya está en t).
+    """
+    if t is None:
+        return (None, x, None, 1)
+    (i, y, d, _) = t
+    if x < y:
+        i1 = insertaArbol(x, i)
+        return t if i1 is i else equilibra(i1, y, d)
+    if y < x:
+        d1 = insertaArbol(x, d)
+        return t if d1 is d else equilibra(i, y, d1)
+    return t
+
+def eliminaMenor(t: Arbol) -> tuple[Any, Arbol]:
+    """
+    Devuelve el par formado por el menor elemento del árbol no vacío t
+    y el árbol obtenido eliminándolo.
+    """
+    assert t is not None
+    (i, x, d, _) = t
+    if i is None:
+        return (x, d)
+    (m, i1) = eliminaMenor(i)
+    return (m, equilibra(i1, x, d))
+
+def eliminaArbol(x: Any, t: Arbol) -> Arbol:
+    """
+    Devuelve el árbol obtenido eliminando x de t.
+    """
+    if t is None:
+        return None
+    (i, y, d, _) = t
+    if x < y:
+        i1 = eliminaArbol(x, i)
+        return t if i1 is i else equilibra(i1, y, d)
+    if y < x:
+        d1 = eliminaArbol(x, d)
+        return t if d1 is d else equilibra(i, y, d1)
+    if d is None:
+        return i
+    (m, d1) = eliminaMenor(d)
+    return equilibra(i, m, d1)
+
+def elementosArbol(t: Arbol) -> Iterator[Any]:
+    """
+    Devuelve un iterador sobre los elementos de t en orden creciente.
+    """
+    pila: list[tuple[Any, Any, Any, int]] = []
+    while pila or t is not None:
+        while t is not None:
+            pila.append(t)
+            t = t[0]
+        t = pila.pop()
+        yield t[1]
+        t = t[2]
+
+# Clase de los conjuntos mediante árboles AVL
+# ===========================================
+
+@dataclass
+class Conj(Generic[A]):
+    _arbol: Arbol = None
+
+    def __repr__(self) -> str:
+        """
+        Devuelve una cadena con los elementos del conjunto entre llaves
+        y separados por ", ".
+        """
+        return '{' + ', '.join(str(x) for x in elementosArbol(self._arbol)) + '}'
+
+    def __eq__(self, c: Any) -> bool:
+        """
+        Se verifica si el conjunto es igual al conjunto c; es decir, si
+        tienen los mismos elementos (aunque sus árboles tengan distinta
+        forma).
+        """
+        return list(elementosArbol(self._arbol)) == \
+            list(elementosArbol(c._arbol))
+
+    def __deepcopy__(self, memo: dict[int, Any]) -> Conj[A]:
+        """
+        Devuelve una copia del conjunto que comparte sus nodos, ya que
+        éstos son inmutables.
+        """
+        return Conj(self._arbol)
+
+    def inserta(self, x: A) -> None:
+        """
+        Añade el elemento x al conjunto.
+        """
+        self._arbol = insertaArbol(x, self._arbol)
+
+    def menor(self) -> A:
+        """
+        Devuelve el menor elemento del conjunto
+        """
+        t = self._arbol
+        if t is None:
+            raise IndexError('menor del conjunto vacío')
+        while t[0] is not None:
+            t = t[0]
+        return t[1]
+
+    def elimina(self, x: A) -> None:
+        """
+        Elimina el elemento x del conjunto.
+        """
+        self._arbol = eliminaArbol(x, self._arbol)
+
+    def esVacio(self) -> bool:
+        """
+        Se verifica si el conjunto está vacío.
+        """
+        return self._arbol is None
+
+    def pertenece(self, x: A) -> bool:
+        """
+        Se verifica si x pertenece al conjunto.
+        """
+        t = self._arbol
+        while t is not None:
+            (i, y, d, _) = t
+            if x < y:
+                t = i
+            elif y < x:
+                t = d
+            else:
+                return True
+        return False
+
+    def esEquilibrado(self) -> bool:
+        """
+        Se verifica si el árbol del conjunto es un árbol de búsqueda
+        equilibrado con las alturas correctas.
+        """
+        return esAVL(self._arbol)
+
+# Funciones del tipo conjunto
+# ===========================
+
+def vacio() -> Conj[A]:
+    """
+    Crea y devuelve un conjunto vacío de tipo A.
+    """
+    c: Conj[A] = Conj()
+    return c
+
+def inserta(x: A, c: Conj[A]) -> Conj[A]:
+    """
+    Devuelve el conjunto obtenido añadiendo x a c, que comparte con c
+    todos los nodos que no están en el camino hasta x.
+    """
+    _aux = deepcopy(c)
+    _aux.inserta(x)
+    return _aux
+
+def menor(c: Conj[A]) -> A:
+    """
+    Devuelve el menor elemento del conjunto c.
+    """
+    return c.menor()
+
+def elimina(x: A, c: Conj[A]) -> Conj[A]:
+    """
+    Devuelve el conjunto obtenido eliminando x de c, que comparte con c
+    todos los nodos que no están en el camino hasta x.
+    """
+    _aux = deepcopy(c)
+    _aux.elimina(x)
+    return _aux
+
+def pertenece(x: A, c: Conj[A]) -> bool:
+    """
+    Se verifica si x pertenece a c.
+    """
+    return c.pertenece(x)
+
+def esVacio(c: Conj[A]) -> bool:
+    """
+    Se verifica si el conjunto está vacío.
+    """
+    return c.esVacio()
+
+# Generador de conjuntos
+# ======================
+
+def listaAconjunto(xs: list[A]) -> Conj[A]:
+    """
+    Devuelve el conjunto de los elementos de xs.
+    """
+    return reduce(lambda c, x: inserta(x, c), xs, vacio())
+
+def conjuntoAleatorio() -> st.SearchStrategy[Conj[int]]:
+    """
+    Estrategia de búsqueda para generar conjuntos de enteros de forma
+    aleatoria.
+    """
+    return st.lists(st.integers()).map(listaAconjunto)
+
+# Comprobación de las propiedades de los conjuntos
+# ================================================
+
+# esAVL(t) se verifica si t es un árbol de búsqueda equilibrado con
+# las alturas correctas.
+def esAVL(t: Arbol) -> bool:
+    def aux(t: Arbol) -> tuple[bool, int]:
+        if t is None:
+            return (True, 0)
+        (i, _, d, a) = t
+        (bi, ai) = aux(i)
+        (bd, ad) = aux(d)
+        return (bi and bd and abs(ai - ad) <= 1 and a == max(ai, ad) + 1,
+                max(ai, ad) + 1)
+    xs = list(elementosArbol(t))
+    return aux(t)[0] and all(x < y for (x, y) in zip(xs, xs[1:]))
+
+# Las propiedades son
+@given(c=conjuntoAleatorio(), x=st.integers(), y=st.integers())
+def test_conjuntos(c: Conj[int], x: int, y: int) -> None:
+    assert inserta(x, inserta(x, c)) == inserta(x, c)
+    assert inserta(x, inserta(y, c)) == inserta(y, inserta(x, c))
+    v: Conj[int] = vacio()
+    assert not pertenece(x, v)
+    assert pertenece(y, inserta(x, c)) == (x == y) or pertenece(y, c)
+    assert elimina(x, v) == v
+
+    def relacion(x: int, y: int, c: Conj[int]) -> Conj[int]:
+        if x == y:
+            return elimina(x, c)
+        return inserta(y, elimina(x, c))
+
+    assert elimina(x, inserta(y, c)) == relacion(x, y, c)
+    assert esVacio(vacio())
+    assert not esVacio(inserta(x, c))
+    assert inserta(x, c).esEquilibrado()
+    assert elimina(x, c).esEquilibrado()
+
+# La comprobación es
+#    > poetry run pytest -q conjuntoConArbolesAVL.py
+#    1 passed in 0.30s
@@ -32,6 +32,12 @@
 # principio, consideraremos dos una usando listas y otra usando
 # sucesiones. Hay que elegir la que se desee utilizar, descomentándola
 # y comentando las otras.
+#
+# Las implementaciones con listas y deque copian la pila en cada apila
+# y desapila, por lo que su coste es lineal. Por defecto se usa la
+# implementación mediante listas enlazadas, cuyas operaciones son de
+# coste constante y comparten la estructura entre las distintas
+# versiones de la pila.
 
 __all__ = [
     'Pila',
@@ -42,8 +48,11 @@ __all__ = [
     'desapila',
     'pilaAleatoria'
 ]
-from src.TAD.pilaConListas import (Pila, apila, cima, desapila, esVacia,
-                                   pilaAleatoria, vacia)
+# from src.TAD.pilaConListas import (Pila, apila, cima, desapila, esVacia,
+#                                    pilaAleatoria, vacia)
 
 # from src.TAD.pilaConDeque import (Pila, apila, cima, desapila, esVacia,
 #                                   pilaAleatoria, vacia)
+
+from src.TAD.pilaConListasEnlazadas import (Pila, apila, cima, desapila,
+                                            esVacia, pilaAleatoria, vacia)
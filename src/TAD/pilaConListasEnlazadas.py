@@ -0,0 +1,235 @@
+# pilaConListasEnlazadas.py
+# Implementación de las pilas mediante listas enlazadas persistentes.
+# José A. Alonso Jiménez <https://jaalonso.github.io>
+# Sevilla, 18-octubre-2026
+# ======================================================================
+
+# En esta implementación los elementos de la pila se guardan en una
+# lista enlazada inmutable; es decir, o bien None (la lista vacía) o
+# bien un par (x, xs) donde x es la cima y xs la lista enlazada del
+# resto. Como los pares no se modifican nunca, las funciones apila y
+# desapila no copian la pila, sino que la nueva pila comparte con la
+# antigua todos sus nodos. Por tanto, ambas operaciones son de coste
+# constante.
+#
+# Se define la clase Pila con los siguientes métodos:
+#    + apila(x) añade x al principio de la pila.
+#    + cima() devuelve la cima de la pila.
+#    + desapila() elimina la cima de la pila.
+#    + esVacia() se verifica si la pila es vacía.
+# Por ejemplo,
+#    >>> p = Pila()
+#    >>> p
+#    -
+#    >>> p.apila(5)
+#    >>> p.apila(2)
+#    >>> p.apila(3)
+#    >>> p.apila(4)
+#    >>> p
+#    4 | 3 | 2 | 5
+#    >>> p.cima()
+#    4
+#    >>> p.desapila()
+#    >>> p
+#    3 | 2 | 5
+#    >>> p.esVacia()
+#    False
+#    >>> p = Pila()
+#    >>> p.esVacia()
+#    True
+#
+# Además se definen las correspondientes funciones. Por ejemplo:
+#    >>> vacia()
+#    -
+#    >>> apila(4, apila(3, apila(2, apila(5, vacia()))))
+#    4 | 3 | 2 | 5
+#    >>> cima(apila(4, apila(3, apila(2, apila(5, vacia())))))
+#    4
+#    >>> desapila(apila(4, apila(3, apila(2, apila(5, vacia())))))
+#    3 | 2 | 5
+#    >>> esVacia(apila(4, apila(3, apila(2, apila(5, vacia())))))
+#    False
+#    >>> esVacia(vacia())
+#    True
+#
+# Finalmente, se define un generador aleatorio de pilas y se comprueba
+# que las pilas cumplen las propiedades de su especificación.
+
+__all__ = [
+    'Pila',
+    'vacia',
+    'apila',
+    'esVacia',
+    'cima',
+    'desapila',
+    'pilaAleatoria'
+]
+
+from copy import deepcopy
+from dataclasses import dataclass
+from typing import Any, Generic, Iterator, Optional, TypeVar
+
+from hypothesis import given
+from hypothesis import strategies as st
+
+A = TypeVar('A')
+
+# Una lista enlazada es None o un par (x, xs) con xs una lista enlazada.
+Enlazada = Optional[tuple[Any, Any]]
+
+# Clase de las pilas mediante listas enlazadas
+# ============================================
+
+@dataclass
+class Pila(Generic[A]):
+    _elementos: Enlazada = None
+
+    def _iterador(self) -> Iterator[A]:
+        """
+        Devuelve un iterador sobre los elementos de la pila, empezando
+        por la cima.
+        """
+        xs = self._elementos
+        while xs is not None:
+            yield xs[0]
+            xs = xs[1]
+
+    def __repr__(self) -> str:
+        """
+        Devuelve una cadena con los elementos de la pila separados por " | ".
+        Si la pila está vacía, devuelve "-".
+        """
+        if self._elementos is None:
+            return '-'
+        return " | ".join(str(x) for x in self._iterador())
+
+    def __eq__(self, p: Any) -> bool:
+        """
+        Se verifica si la pila es igual a la pila p; es decir, si tienen
+        los mismos elementos en el mismo orden. Se compara
+        iterativamente (sin comparar directamente los pares anidados)
+        para no desbordar la pila de recursión con pilas largas.
+        """
+        xs = self._elementos
+        ys = p._elementos
+        while xs is not ys:
+            if xs is None or ys is None or xs[0] != ys[0]:
+                return False
+            xs = xs[1]
+            ys = ys[1]
+        return True
+
+    def __deepcopy__(self, memo: dict[int, Any]) -> 'Pila[A]':
+        """
+        Devuelve una copia de la pila que comparte sus nodos, ya que
+        éstos son inmutables.
+        """
+        return Pila(self._elementos)
+
+    def apila(self, x: A) -> None:
+        """
+        Agrega el elemento x al inicio de la pila.
+        """
+        self._elementos = (x, self._elementos)
+
+    def esVacia(self) -> bool:
+        """
+        Verifica si la pila está vacía.
+
+        Devuelve True si la pila está vacía, False en caso contrario.
+        """
+        return self._elementos is None
+
+    def cima(self) -> A:
+        """
+        Devuelve el elemento en la cima de la pila.
+        """
+        if self._elementos is None:
+            raise IndexError('cima de la pila vacía')
+        return self._elementos[0]
+
+    def desapila(self) -> None:
+        """
+        Elimina el elemento en la cima de la pila.
+        """
+        if self._elementos is None:
+            raise IndexError('desapila de la pila vacía')
+        self._elementos = self._elementos[1]
+
+# Funciones del tipo de las pilas
+# ===============================
+
+def vacia() -> Pila[A]:
+    """
+    Crea y devuelve una pila vacía de tipo A.
+    """
+    p: Pila[A] = Pila()
+    return p
+
+def apila(x: A, p: Pila[A]) -> Pila[A]:
+    """
+    Devuelve la pila obtenida añadiendo x en la cima de p, que comparte
+    con p todos sus elementos.
+    """
+    _aux = deepcopy(p)
+    _aux.apila(x)
+    return _aux
+
+def esVacia(p: Pila[A]) -> bool:
+    """
+    Devuelve True si la pila está vacía, False si no lo está.
+    """
+    return p.esVacia()
+
+def cima(p: Pila[A]) -> A:
+    """
+    Devuelve el elemento en la cima de la pila p.
+    """
+    return p.cima()
+
+def desapila(p: Pila[A]) -> Pila[A]:
+    """
+    Devuelve la pila obtenida eliminando la cima de p, que comparte con
+    p el resto de sus elementos.
+    """
+    _aux = deepcopy(p)
+    _aux.desapila()
+    return _aux
+
+# Generador de pilas
+# ==================
+
+def listaApila(xs: list[A]) -> Pila[A]:
+    """
+    Devuelve la pila cuyos elementos son los de xs, siendo el primero
+    de xs la cima.
+    """
+    p: Pila[A] = vacia()
+    for x in reversed(xs):
+        p.apila(x)
+    return p
+
+def pilaAleatoria() -> st.SearchStrategy[Pila[int]]:
+    """
+    Genera una estrategia de búsqueda para generar pilas de enteros de
+    forma aleatoria.
+
+    Utiliza la librería Hypothesis para generar una lista de enteros y
+    luego se convierte en una instancia de la clase pila.
+    """
+    return st.lists(st.integers()).map(listaApila)
+
+# Comprobación de las propiedades de las pilas
+# ============================================
+
+# Las propiedades son
+@given(p=pilaAleatoria(), x=st.integers())
+def test_pila(p: Pila[int], x: int) -> None:
+    assert cima(apila(x, p)) == x
+    assert desapila(apila(x, p)) == p
+    assert esVacia(vacia())
+    assert not esVacia(apila(x, p))
+
+# La comprobación es
+#    > poetry run pytest -q pilaConListasEnlazadas.py
+#    1 passed in 0.22s
@@ -0,0 +1,217 @@
+# TablasAritmeticas.py
+# Tablas de funciones aritméticas mediante cribas.
+# José A. Alonso Jiménez <https://jaalonso.github.io>
+# Sevilla, 18-octubre-2026
+# ---------------------------------------------------------------------
+
+# ---------------------------------------------------------------------
+# Muchos ejercicios necesitan la suma o el número de divisores, la
+# función indicatriz de Euler, la función de Möbius o el menor factor
+# primo de todos los números de un intervalo [0, n]. En lugar de
+# calcularlos uno a uno, se calculan todos a la vez con una criba
+# sobre vectores de NumPy:
+# + para cada primo p menor o igual que la raíz cuadrada de n se
+#   calcula el exponente de p en cada uno de sus múltiplos y se
+#   multiplican los valores de las funciones en dichos múltiplos por
+#   su valor en la potencia de p correspondiente (ya que las funciones
+#   son multiplicativas) y
+# + lo que queda de cada número tras dividirlo por sus factores primos
+#   pequeños es 1 o un primo mayor que la raíz cuadrada de n (con
+#   exponente 1), cuyo factor se aplica a todos los números a la vez.
+#
+# Definir la clase Tabla con los atributos
+#    n               : int
+#    menorFactor     : npt.NDArray[np.int64]
+#    numeroDivisores : npt.NDArray[np.int64]
+#    sumaDivisores   : npt.NDArray[np.int64]
+#    phi             : npt.NDArray[np.int64]
+#    mu              : npt.NDArray[np.int64]
+# tales que, para 1 <= x <= n,
+# + menorFactor[x] es el menor factor primo de x (1 si x = 1),
+# + numeroDivisores[x] es el número de divisores de x (tau(x)),
+# + sumaDivisores[x] es la suma de los divisores de x (sigma(x)),
+# + phi[x] es la función indicatriz de Euler de x y
+# + mu[x] es la función de Möbius de x
+# (y en la posición 0 todos son 0), y las funciones
+#    menoresFactores : (int, type) -> npt.NDArray
+#    calculaTabla    : (int) -> Tabla
+#    tabla           : (int) -> Tabla
+# tales que
+# + menoresFactores(n, tipo) es el vector menorFactor de la tabla hasta
+#   n, con elementos de tipo tipo (por defecto, np.int64). Se calcula
+#   con su propia criba (sin las demás funciones), por lo que lo pueden
+#   usar los módulos que sólo necesitan los menores factores (como
+#   CribaDeFactores). Por ejemplo,
+#      >>> menoresFactores(12, np.int32)
+#      array([ 0,  1,  2,  3,  2,  5,  2,  7,  2,  3,  2, 11,  2], dtype=int32)
+# + calculaTabla(n) es la tabla hasta n. Por ejemplo,
+#      >>> t = calculaTabla(12)
+#      >>> t.sumaDivisores.tolist()
+#      [0, 1, 3, 4, 7, 6, 12, 8, 15, 13, 18, 12, 28]
+#      >>> t.numeroDivisores.tolist()
+#      [0, 1, 2, 2, 3, 2, 4, 2, 4, 3, 4, 2, 6]
+#      >>> t.phi.tolist()
+#      [0, 1, 1, 2, 2, 4, 2, 6, 4, 6, 4, 10, 4]
+#      >>> t.mu.tolist()
+#      [0, 1, -1, -1, 0, -1, 1, -1, 0, 0, 1, -1, 0]
+#      >>> t.menorFactor.tolist()
+#      [0, 1, 2, 3, 2, 5, 2, 7, 2, 3, 2, 11, 2]
+# + tabla(n) es una tabla hasta n o más. Las tablas se guardan, de
+#   forma que sólo se calcula una nueva si se pide un n mayor que el de
+#   la última calculada y, en ese caso, su tamaño es al menos el doble
+#   que el de la anterior (por lo que, al recorrer los números de uno
+#   en uno, el coste total es proporcional al de la última tabla). Por
+#   ejemplo,
+#      >>> tabla(10**6).sumaDivisores[220] - 220
+#      284
+#      >>> tabla(10**6) is tabla(10)
+#      True
+# ---------------------------------------------------------------------
+
+from dataclasses import dataclass
+from math import isqrt
+from timeit import Timer, default_timer
+from typing import Any
+
+import numpy as np
+import numpy.typing as npt
+from hypothesis import given
+from hypothesis import strategies as st
+from sympy import divisor_count, divisor_sigma, mobius, primefactors, totient
+
+from src.CribaSegmentada import primosHasta
+
+@dataclass(frozen=True)
+class Tabla:
+    n: int
+    menorFactor: npt.NDArray[np.int64]
+    numeroDivisores: npt.NDArray[np.int64]
+    sumaDivisores: npt.NDArray[np.int64]
+    phi: npt.NDArray[np.int64]
+    mu: npt.NDArray[np.int64]
+
+def menoresFactores(n: int, tipo: type = np.int64) -> npt.NDArray[Any]:
+    n = max(n, 1)
+    t: npt.NDArray[Any] = np.zeros(n + 1, dtype=tipo)
+    for p in primosHasta(isqrt(n)):
+        multiplos = t[p * p::p]
+        multiplos[multiplos == 0] = p
+    # Los números sin factores primos menores que su raíz cuadrada son
+    # primos (o 0 o 1).
+    sinFactor = np.flatnonzero(t == 0)
+    t[sinFactor] = sinFactor
+    t[1] = 1
+    return t
+
+def calculaTabla(n: int) -> Tabla:
+    n = max(n, 1)
+    menorFactor = menoresFactores(n)
+    numeroDivisores = np.ones(n + 1, dtype=np.int64)
+    sumaDivisores = np.ones(n + 1, dtype=np.int64)
+    phi = np.ones(n + 1, dtype=np.int64)
+    mu = np.ones(n + 1, dtype=np.int64)
+    # resto[x] es lo que queda de x tras dividirlo por sus factores
+    # primos menores o iguales que la raíz cuadrada de n.
+    resto = np.arange(n + 1, dtype=np.int64)
+    for p in primosHasta(isqrt(n)):
+        multiplos = slice(p, n + 1, p)
+        # es[i] es el exponente de p en el i-ésimo múltiplo de p, p·(i+1).
+        cocientes = np.arange(1, n // p + 1, dtype=np.int64)
+        es = np.ones(len(cocientes), dtype=np.int64)
+        divisibles = np.flatnonzero(cocientes % p == 0)
+        while divisibles.size:
+            es[divisibles] += 1
+            cocientes[divisibles] //= p
+            divisibles = divisibles[cocientes[divisibles] % p == 0]
+        # potencias[e] es p^e.
+        potencias = p ** np.arange(es.max() + 2, dtype=np.int64)
+        numeroDivisores[multiplos] *= es + 1
+        sumaDivisores[multiplos] *= (potencias[es + 1] - 1) // (p - 1)
+        phi[multiplos] *= potencias[es - 1] * (p - 1)
+        mu[multiplos] *= np.where(es == 1, -1, 0)
+        resto[multiplos] //= potencias[es]
+    grandes = resto > 1
+    numeroDivisores[grandes] *= 2
+    sumaDivisores[grandes] *= resto[grandes] + 1
+    phi[grandes] *= resto[grandes] - 1
+    mu[grandes] *= -1
+    for v in (numeroDivisores, sumaDivisores, phi, mu):
+        v[0] = 0
+    return Tabla(n, menorFactor, numeroDivisores, sumaDivisores, phi, mu)
+
+# MINIMO es el tamaño de la primera tabla que calcula tabla.
+MINIMO = 2**10
+
+# _tablas es la lista cuyo único elemento es la última tabla calculada
+# por tabla (o la lista vacía si aún no se ha calculado ninguna).
+_tablas: list[Tabla] = []
+
+def tabla(n: int) -> Tabla:
+    if not _tablas or _tablas[0].n < n:
+        m = max(n, MINIMO, 2 * _tablas[0].n if _tablas else 0)
+        _tablas[:] = [calculaTabla(m)]
+    return _tablas[0]
+
+# Verificación
+# ============
+
+def test_TablasAritmeticas() -> None:
+    t = calculaTabla(12)
+    assert t.sumaDivisores.tolist() == \
+        [0, 1, 3, 4, 7, 6, 12, 8, 15, 13, 18, 12, 28]
+    assert t.numeroDivisores.tolist() == \
+        [0, 1, 2, 2, 3, 2, 4, 2, 4, 3, 4, 2, 6]
+    assert t.phi.tolist() == [0, 1, 1, 2, 2, 4, 2, 6, 4, 6, 4, 10, 4]
+    assert t.mu.tolist() == [0, 1, -1, -1, 0, -1, 1, -1, 0, 0, 1, -1, 0]
+    assert t.menorFactor.tolist() == [0, 1, 2, 3, 2, 5, 2, 7, 2, 3, 2, 11, 2]
+    assert menoresFactores(12, np.int32).tolist() == t.menorFactor.tolist()
+    assert menoresFactores(12, np.int32).dtype == np.int32
+    assert calculaTabla(1).sumaDivisores.tolist() == [0, 1]
+    assert tabla(10**6).sumaDivisores[220] - 220 == 284
+    assert tabla(10**6) is tabla(10)
+    assert tabla(10**6 + 1).n == 2 * 10**6
+    print("Verificado")
+
+# La verificación es
+#    >>> test_TablasAritmeticas()
+#    Verificado
+
+# Comprobación de propiedades
+# ===========================
+
+# La propiedad es
+@given(st.integers(min_value=2, max_value=3000))
+def test_calculaTabla(n: int) -> None:
+    t = calculaTabla(n)
+    for x in {1, 2, n, n // 2 + 1, max(1, n - 1)}:
+        assert t.sumaDivisores[x] == divisor_sigma(x)
+        assert t.numeroDivisores[x] == divisor_count(x)
+        assert t.phi[x] == totient(x)
+        assert t.mu[x] == mobius(x)
+        assert t.menorFactor[x] == (min(primefactors(x)) if x > 1 else 1)
+
+# La comprobación es
+#    > poetry run pytest -q TablasAritmeticas.py
+#    2 passed in 12.95s
+
+# Comparación de eficiencia
+# =========================
+
+def tiempo(e: str) -> None:
+    """Tiempo (en segundos) de evaluar la expresión e."""
+    t = Timer(e, "", default_timer, globals()).timeit(1)
+    print(f"{t:0.2f} segundos")
+
+# La comparación es
+#    >>> tiempo('[divisor_sigma(x) for x in range(1, 10**5 + 1)]')
+#    12.62 segundos
+#    >>> tiempo('[totient(x) for x in range(1, 10**5 + 1)]')
+#    11.19 segundos
+#    >>> tiempo('calculaTabla(10**5)')
+#    0.02 segundos
+#    >>> tiempo('calculaTabla(10**6)')
+#    0.31 segundos
+#    >>> tiempo('calculaTabla(10**7)')
+#    3.24 segundos
+#    >>> tiempo('[tabla(x).sumaDivisores[x] for x in range(1, 10**6 + 1)]')
+#    0.84 segundos
@@ -0,0 +1,3 @@
+from src.AgregadosDeCaminos import test_AgregadosDeCaminos
+
+test_AgregadosDeCaminos()
@@ -0,0 +1,3 @@
+from src.AlineamientoSCM import test_AlineamientoSCM
+
+test_AlineamientoSCM()
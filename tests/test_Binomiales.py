@@ -0,0 +1,3 @@
+from src.Binomiales import test_Binomiales
+
+test_Binomiales()
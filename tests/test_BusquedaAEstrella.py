@@ -0,0 +1,3 @@
+from src.BusquedaAEstrella import test_buscaAEstrella
+
+test_buscaAEstrella()
@@ -0,0 +1,3 @@
+from src.BusquedaEnAnchura import test_buscaAnchuraPerezosa
+
+test_buscaAnchuraPerezosa()
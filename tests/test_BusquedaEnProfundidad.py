@@ -0,0 +1,3 @@
+from src.BusquedaEnProfundidad import test_buscaProfundidadPerezosa
+
+test_buscaProfundidadPerezosa()
@@ -0,0 +1,3 @@
+from src.CiclosAlicuotas import test_CiclosAlicuotas
+
+test_CiclosAlicuotas()
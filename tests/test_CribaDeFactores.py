@@ -0,0 +1,3 @@
+from src.CribaDeFactores import test_CribaDeFactores
+
+test_CribaDeFactores()
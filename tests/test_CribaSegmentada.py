@@ -0,0 +1,3 @@
+from src.CribaSegmentada import test_CribaSegmentada
+
+test_CribaSegmentada()
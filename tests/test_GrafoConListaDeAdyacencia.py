@@ -86,3 +86,14 @@ def test_GrafoConListaDeAdyacencia() -> None:
     assert peso(1, 5, ejGrafoD2) == 78
     assert str(aristas(ejGrafoD2)) == "[((1, 2), 12), ((1, 3), 34), ((1, 5), 78), ((2, 4), 55), ((2, 5), 32), ((3, 4), 61), ((3, 5), 44), ((4, 5), 93)]"
     assert str(aristas(ejGrafoND2)) == "[((1, 2), 12), ((1, 3), 34), ((1, 5), 78), ((2, 1), 12), ((2, 4), 55), ((2, 5), 32), ((3, 1), 34), ((3, 4), 61), ((3, 5), 44), ((4, 2), 55), ((4, 3), 61), ((4, 5), 93), ((5, 1), 78), ((5, 2), 32), ((5, 3), 44), ((5, 4), 93)]"
+
+def test_indiceDeAdyacencia() -> None:
+    g = creaGrafo(Orientacion.D, (1,4), [((2,1),7),((1,3),5),((1,3),2),((1,2),0)])
+    assert adyacentes(g, 1) == [2, 3]
+    assert adyacentes(g, 4) == []
+    assert adyacentes(g, 9) == []
+    assert aristaEn(g, (2,1))
+    assert not aristaEn(g, (3,1))
+    assert peso(1, 3, g) == 2
+    g.adyacentes(1).append(4)
+    assert adyacentes(g, 1) == [2, 3]
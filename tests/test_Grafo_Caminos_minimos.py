@@ -0,0 +1,3 @@
+from src.Grafo_Caminos_minimos import test_caminosMinimos
+
+test_caminosMinimos()
@@ -0,0 +1,3 @@
+from src.PotenciasPerfectas import test_PotenciasPerfectas
+
+test_PotenciasPerfectas()
@@ -0,0 +1,3 @@
+from src.ProgramacionDinamica import test_ProgramacionDinamica
+
+test_ProgramacionDinamica()
@@ -0,0 +1,3 @@
+from src.SumasDeDosCuadrados import test_SumasDeDosCuadrados
+
+test_SumasDeDosCuadrados()
@@ -0,0 +1,3 @@
+from src.TablasAritmeticas import test_TablasAritmeticas
+
+test_TablasAritmeticas()
@@ -0,0 +1,3 @@
+from src.TAD.UnionBusqueda import test_UnionBusqueda
+
+test_UnionBusqueda()